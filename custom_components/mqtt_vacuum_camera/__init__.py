@@ -1,9 +1,10 @@
 """
 MQTT Vacuum Camera.
-Version: 2025.10.0
+Version: 2026.5.0
 """
 
 from functools import partial
+import logging
 from pathlib import Path
 from typing import Any
 import zipfile
@@ -17,6 +18,7 @@ from homeassistant.const import (
     SERVICE_RELOAD,
     Platform,
 )
+from homeassistant.core import SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -33,6 +35,8 @@ from .common import (
     update_options,
 )
 from .const import (
+    CONF_CURRENT_FLOOR,
+    CONF_FLOORS_DATA,
     CONF_VACUUM_CONFIG_ENTRY_ID,
     CONF_VACUUM_CONNECTION_STRING,
     CONF_VACUUM_IDENTIFIERS,
@@ -42,14 +46,31 @@ from .const import (
 from .coordinator import MQTTVacuumCoordinator
 from .types import CoordinatorConfig
 from .utils.camera.camera_services import (
+    camera_attributes,
+    camera_frame_history,
     camera_select_floor,
+    camera_timelapse,
     camera_update_floor_data,
     obstacle_view,
+    obstacles_contact_sheet,
     reload_camera_config,
     reset_trims,
 )
+from .utils.camera.image_view import (
+    CameraHistoryView,
+    CameraImageView,
+    CameraSvgView,
+)
+from .utils.camera.websocket_api import async_register_websocket_api
 from .utils.connection.connector import ValetudoConnector
 from .utils.files_operations import async_get_active_user_language
+from .utils.options.options_update import (
+    changed_options,
+    floor_to_apply,
+    is_drawing_option,
+    needs_reload,
+)
+from .utils.startup_timings import StartupTimings
 from .utils.thread_pool import ThreadPoolManager
 from .utils.vacuum.mqtt_vacuum_services import (
     async_register_vacuums_services,
@@ -64,9 +85,9 @@ def init_shared_data(
     _hass: core.HomeAssistant,
     mqtt_listen_topic: str,
     device_info: DeviceInfo,
-) -> tuple[CameraShared, str]:
+) -> tuple[CameraShared, CameraSharedManager]:
     """
-    Initialize the shared data.
+    Initialize the shared data and return it with its manager.
     Raises ValueError if mqtt_listen_topic is empty.
     """
     if not mqtt_listen_topic:
@@ -76,7 +97,7 @@ def init_shared_data(
     shared_manager = CameraSharedManager(file_name, dict(device_info))
     shared = shared_manager.get_instance()
     shared.vacuum_status_font = f"{get_default_font_path()}/FiraSans.ttf"
-    return shared, file_name
+    return shared, shared_manager
 
 
 async def start_up_mqtt(
@@ -90,14 +111,19 @@ async def start_up_mqtt(
     return connector
 
 
-async def init_coordinator(hass, entry, vacuum_topic, is_rand256, is_conga):
+async def init_coordinator(
+    hass, entry, vacuum_topic, is_rand256, is_conga, timings=None
+):
     """Initialize the coordinator with configuration."""
+    timings = timings or StartupTimings()
     device_info: DeviceInfo = get_camera_device_info(hass, entry)
-    shared, _ = init_shared_data(hass, vacuum_topic, device_info)
+    with timings.phase("init_shared_data"):
+        shared, shared_manager = init_shared_data(hass, vacuum_topic, device_info)
     shared.user_language = await async_get_active_user_language(hass)
     shared.is_rand = is_rand256
     shared.is_conga = is_conga
-    connector = await start_up_mqtt(hass, vacuum_topic, is_rand256, shared)
+    with timings.phase("start_up_mqtt"):
+        connector = await start_up_mqtt(hass, vacuum_topic, is_rand256, shared)
 
     config = CoordinatorConfig(
         hass=hass,
@@ -108,17 +134,40 @@ async def init_coordinator(hass, entry, vacuum_topic, is_rand256, is_conga):
         shared=shared,
     )
     coordinator_entity = MQTTVacuumCoordinator(config)
+    # Kept to apply the drawing options without a reload.
+    coordinator_entity.shared_manager = shared_manager
+    # The camera entity adds its phases to the timings of the entry.
+    coordinator_entity.startup_timings = timings
     return coordinator_entity
 
 
 async def options_update_listener(hass: core.HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+    previous = entry_data.get("options", {})
+    options = dict(config_entry.options)
+    camera = entry_data.get("camera")
+    changed = changed_options(previous, options)
+    if camera is None or needs_reload(changed):
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+    # Floor and drawing changes are applied in place: no new subscriptions or pools.
+    entry_data["options"] = options
+    if any(is_drawing_option(key) for key in changed):
+        await camera.async_apply_drawing_options()
+    floor = floor_to_apply(previous, options)
+    if floor is not None:
+        await camera.async_switch_floor(
+            floor,
+            (options.get(CONF_FLOORS_DATA) or {}).get(floor, {}),
+            previous.get(CONF_CURRENT_FLOOR) != floor,
+        )
 
 
 async def async_setup_entry(hass: core.HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up platform from a ConfigEntry."""
 
+    timings = StartupTimings()
     hass.data.setdefault(DOMAIN, {})
     hass_data = dict(entry.data)
 
@@ -143,9 +192,10 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: ConfigEntry) -> boo
     is_rand256 = is_rand256_vacuum(vacuum_device)
     is_conga = is_congaduto_vacuum(vacuum_device)
 
-    data_coordinator = await init_coordinator(
-        hass, entry, mqtt_topic_vacuum, is_rand256, is_conga
-    )
+    with timings.phase("init_coordinator"):
+        data_coordinator = await init_coordinator(
+            hass, entry, mqtt_topic_vacuum, is_rand256, is_conga, timings
+        )
 
     hass_data.update(
         {
@@ -155,6 +205,8 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: ConfigEntry) -> boo
             "coordinator": data_coordinator,
             "is_rand256": is_rand256,
             "file_name": data_coordinator.context.file_name,
+            "options": dict(entry.options),
+            "startup_timings": timings,
         }
     )
     # Register Services
@@ -176,18 +228,40 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: ConfigEntry) -> boo
             "camera_update_floor_data",
             partial(camera_update_floor_data, hass=hass),
         )
+        hass.services.async_register(
+            DOMAIN,
+            "camera_frame_history",
+            partial(camera_frame_history, hass=hass),
+            supports_response=SupportsResponse.ONLY,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "camera_timelapse",
+            partial(camera_timelapse, hass=hass),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "obstacles_contact_sheet",
+            partial(obstacles_contact_sheet, hass=hass),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "camera_attributes",
+            partial(camera_attributes, hass=hass),
+            supports_response=SupportsResponse.ONLY,
+        )
         await async_register_vacuums_services(hass, data_coordinator)
     # Registers update listener to update config entry when options are updated.
     unsub_options_update_listener = entry.add_update_listener(options_update_listener)
     # Store a reference to the unsubscribe function to clean up if an entry is unloaded.
     hass_data["unsub_options_update_listener"] = unsub_options_update_listener
     hass.data[DOMAIN][entry.entry_id] = hass_data
-    if bool(hass_data.get("is_rand256")):
-        await hass.config_entries.async_forward_entry_setups(
-            entry, ["camera", "sensor"]
-        )
-    else:
-        await hass.config_entries.async_forward_entry_setups(entry, ["camera"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    timings.finish("async_setup_entry")
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("%s", timings.summary(data_coordinator.context.file_name))
 
     return True
 
@@ -196,12 +270,8 @@ async def async_unload_entry(
     hass: core.HomeAssistant, entry: config_entries.ConfigEntry
 ) -> bool:
     """Unload a config entry."""
-    if bool(hass.data[DOMAIN][entry.entry_id]["is_rand256"]):
-        unload_platform = PLATFORMS
-    else:
-        unload_platform = [Platform.CAMERA]
     if unload_ok := await hass.config_entries.async_unload_platforms(
-        entry, unload_platform
+        entry, PLATFORMS
     ):
         # Remove config entry from domain.
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
@@ -231,6 +301,10 @@ async def async_unload_entry(
             hass.services.async_remove(DOMAIN, "obstacle_view")
             hass.services.async_remove(DOMAIN, "camera_select_floor")
             hass.services.async_remove(DOMAIN, "camera_update_floor_data")
+            hass.services.async_remove(DOMAIN, "camera_frame_history")
+            hass.services.async_remove(DOMAIN, "camera_timelapse")
+            hass.services.async_remove(DOMAIN, "obstacles_contact_sheet")
+            hass.services.async_remove(DOMAIN, "camera_attributes")
             hass.services.async_remove(DOMAIN, SERVICE_RELOAD)
             await async_remove_vacuums_services(hass)
     return unload_ok
@@ -249,6 +323,13 @@ async def async_setup(hass: core.HomeAssistant, _config: dict) -> bool:
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_homeassistant_stop)
 
+    # Conditional-GET image endpoint (ETag / Last-Modified) for dashboards.
+    hass.http.register_view(CameraImageView())
+    hass.http.register_view(CameraHistoryView())
+    hass.http.register_view(CameraSvgView())
+    # Websocket map deltas for custom cards.
+    async_register_websocket_api(hass)
+
     # Make sure MQTT integration is enabled and the client is available
     if not await mqtt.async_wait_for_mqtt_client(hass):
         LOGGER.error("MQTT integration is not available")
@@ -33,4 +33,6 @@ async def async_setup_entry(
         camera = [MQTTCameraMPEG(coordinator, config)]
     else:
         camera = [MQTTCamera(coordinator, config)]
+    # Keep a reference so the integration views and services can reach the entity.
+    config["camera"] = camera[0]
     async_add_entities(camera, update_before_add=True)
@@ -16,7 +16,13 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 from valetudo_map_parser import FloorData
 
-from .const import DEFAULT_VALUES, KEYS_TO_UPDATE, LOGGER
+from .const import (
+    CONF_VACUUM_CONNECTION_STRING,
+    DEFAULT_VALUES,
+    DOMAIN,
+    KEYS_TO_UPDATE,
+    LOGGER,
+)
 from .hass_types import GET_MQTT_DATA
 
 
@@ -243,6 +249,34 @@ def get_entity_id(
     return vacuum_entity_id
 
 
+def get_camera_entity(hass: HomeAssistant, entity_id: str) -> Any | None:
+    """
+    Return the loaded camera entity of this integration for the given entity_id.
+    """
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict):
+            continue
+        camera = entry_data.get("camera")
+        if camera is not None and camera.entity_id == entity_id:
+            return camera
+    return None
+
+
+def get_vacuum_coordinator(hass: HomeAssistant, vacuum_topic: str | None) -> Any | None:
+    """
+    Return the coordinator of the camera entry of the vacuum MQTT topic.
+    """
+    if not vacuum_topic:
+        return None
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if (
+            isinstance(entry_data, dict)
+            and entry_data.get(CONF_VACUUM_CONNECTION_STRING) == vacuum_topic
+        ):
+            return entry_data.get("coordinator")
+    return None
+
+
 def redact_ip_filter(func):
     """Decorator to remove IP addresses from function output"""
 
@@ -1,5 +1,5 @@
 """Constants for the mqtt_vacuum_camera integration.
-Last Updated on version: 2025.10.0
+Last Updated on version: 2026.5.0
 """
 
 from enum import Enum
@@ -481,7 +481,8 @@ NOT_STREAMING_STATES = {
     "docked",
 }
 
-DECODED_TOPICS = {
+# Topics of each firmware, suffixes of the vacuum base topic.
+HYPFER_DECODED_TOPICS = {
     "/MapData/segments",
     "/maploader/map",
     "/maploader/status",
@@ -497,19 +498,23 @@ DECODED_TOPICS = {
     "/WaterUsageControlCapability/preset",
     "/DockStatusStateAttribute/status",
     "/ValetudoEvents/valetudo_events",
-    "/state",  # Rand256
-    "/destinations",  # Rand256
-    "/command",  # Rand256
-    "/custom_command",  # Rand256
-    "/attributes",  # Rand256
 }
 
+RAND256_DECODED_TOPICS = {
+    "/state",
+    "/destinations",
+    "/command",
+    "/custom_command",
+    "/attributes",
+}
+
+DECODED_TOPICS = HYPFER_DECODED_TOPICS | RAND256_DECODED_TOPICS
+
 
 # self.command_topic need to be added to this dictionary after init.
-NON_DECODED_TOPICS = {
-    "/MapData/map-data",
-    "/map_data",
-}
+HYPFER_NON_DECODED_TOPICS = {"/MapData/map-data"}
+RAND256_NON_DECODED_TOPICS = {"/map_data"}
+NON_DECODED_TOPICS = HYPFER_NON_DECODED_TOPICS | RAND256_NON_DECODED_TOPICS
 
 """App Constants. Not in use, and dummy values"""
 IDLE_SCAN_INTERVAL = 120
@@ -607,9 +612,27 @@ ATTR_CAMERA_MODE = "camera_mode"
 DOWNLOAD_TIMEOUT = 6
 CAMERA_SCAN_INTERVAL_S = 3.0
 RENDER_TIMEOUT_S = 2.9
+WARM_START_TIMEOUT_S = 10.0
 FRAME_INTERVAL_S = 0.2
+SENSOR_UPDATE_COOLDOWN_S = 1.0
 MJPEG_INTERVAL_S = 1.0
 
+# Frame history (ring buffer of encoded frames per camera)
+FRAME_HISTORY_MAX_FRAMES = 240
+FRAME_HISTORY_MAX_BYTES = 24 * 1024 * 1024
+
+# Obstacle images cache (per camera) and background prefetch
+OBSTACLE_CACHE_MEMORY_BYTES = 16 * 1024 * 1024
+OBSTACLE_CACHE_DISK_BYTES = 64 * 1024 * 1024
+OBSTACLE_PREFETCH_CONCURRENCY = 2
+OBSTACLE_PREFETCH_MAX_ITEMS = 50
+
+# Robot HTTP session (obstacle images downloads)
+ROBOT_HTTP_MAX_CONNECTIONS = 4
+ROBOT_HTTP_KEEPALIVE_S = 30.0
+ROBOT_HTTP_CONNECT_TIMEOUT_S = 3.0
+ROBOT_HTTP_MAX_BYTES = 8 * 1024 * 1024
+
 # Obstacle detection
 OBSTACLE_SEARCH_RADIUS_MULTIPLIER = (
     65  # Multiplier for obstacle search radius calculation
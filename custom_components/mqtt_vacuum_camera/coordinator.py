@@ -1,6 +1,10 @@
 """
 MQTT Vacuum Camera Coordinator.
-Version: 2025.10.0
+Version: 2026.5.0
+The sensor data is pushed by the connector when the vacuum attributes, state
+or battery change (no polling): the updates are coalesced and only sent to
+the entities when the formatted data actually changed. The cleaning session
+metrics computed by the camera are merged in the same data.
 """
 
 from __future__ import annotations
@@ -9,12 +13,21 @@ from typing import Optional
 
 import async_timeout
 
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from valetudo_map_parser.config.shared import CameraSharedManager
 
 from .common import get_camera_device_info
-from .const import DEFAULT_NAME, LOGGER, SENSOR_NO_DATA
+from .const import DEFAULT_NAME, LOGGER, SENSOR_NO_DATA, SENSOR_UPDATE_COOLDOWN_S
 from .types import CoordinatorConfig, CoordinatorContext
+from .utils.camera.room_index import RoomIndexCache
+from .utils.startup_timings import StartupTimings
+
+
+def _attachment(attached: bool) -> str:
+    """Return the state of an attachment sensor."""
+    return "attached" if attached else "detached"
 
 
 class MQTTVacuumCoordinator(DataUpdateCoordinator):
@@ -52,8 +65,68 @@ class MQTTVacuumCoordinator(DataUpdateCoordinator):
         )
 
         self.shared_manager: Optional[CameraSharedManager] = None
+        self.startup_timings = StartupTimings()
         self.in_sync_with_camera: bool = False
         self.sensor_data = SENSOR_NO_DATA
+        self.session_metrics: dict = {}
+        # Room index of the current map, updated by the camera.
+        self.rooms = RoomIndexCache(bool(config.is_rand256))
+
+        # Push updates from the connector, coalesced by the debouncer.
+        self._push_debouncer = Debouncer(
+            config.hass,
+            LOGGER,
+            cooldown=SENSOR_UPDATE_COOLDOWN_S,
+            immediate=True,
+            function=self._async_push_sensor_data,
+        )
+        self._unsub_connector = config.connector.async_add_update_listener(
+            self.async_request_sensor_update
+        )
+        # The retained topics may have been received before the listener.
+        self.async_request_sensor_update()
+
+    @callback
+    def async_request_sensor_update(self) -> None:
+        """Schedule a sensor data update (the vacuum data changed)."""
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def async_set_session_metrics(self, metrics: dict) -> None:
+        """Publish the cleaning session metrics computed by the camera."""
+        if metrics != self.session_metrics:
+            self.session_metrics = metrics
+            self.async_request_sensor_update()
+
+    def _robot_in_room(self) -> Optional[str]:
+        """Return the room of the robot, from the room index of the map."""
+        robot_room = self.rooms.robot_room
+        if robot_room and robot_room.get("name"):
+            return robot_room["name"]
+        vacuum_room = self.context.shared.current_room or {"in_room": "Unsupported"}
+        return vacuum_room.get("in_room")
+
+    async def _async_push_sensor_data(self) -> None:
+        """Format the sensor data and notify the entities if it changed."""
+        if self.is_rand256:
+            sensor_data = await self.context.connector.get_rand256_attributes()
+            if not sensor_data:
+                return
+            formatted_data = await self.async_update_sensor_data(sensor_data)
+        else:
+            formatted_data = await self.async_hypfer_sensor_data()
+        if formatted_data is not SENSOR_NO_DATA:
+            formatted_data = {**formatted_data, **self.session_metrics}
+        if formatted_data == self.sensor_data:
+            return
+        self.sensor_data = formatted_data
+        self.async_set_updated_data(formatted_data)
+
+    async def async_shutdown(self) -> None:
+        """Stop the push updates."""
+        await super().async_shutdown()
+        self._unsub_connector()
+        self._push_debouncer.async_shutdown()
 
     async def _async_update_data(self):
         """
@@ -74,6 +147,26 @@ class MQTTVacuumCoordinator(DataUpdateCoordinator):
             )
             raise UpdateFailed(f"Error fetching sensor data: {err}") from err
 
+    async def async_hypfer_sensor_data(self) -> dict:
+        """Return the Hypfer sensor data, from the connector state (no MQTT)."""
+        connector = self.context.connector
+        return {
+            "battery": await connector.get_battery_level(),
+            "state": await connector.get_vacuum_status(),
+            "error": await connector.get_vacuum_error(),
+            "dock_status": await connector.get_dock_status(),
+            "operation_mode": await connector.get_operation_mode(),
+            "water_usage": await connector.get_water_usage(),
+            "mop_attached": _attachment(await connector.get_mop_attachment_status()),
+            "dustbin_attached": _attachment(
+                await connector.get_dustbin_attachment_status()
+            ),
+            "watertank_attached": _attachment(
+                await connector.get_watertank_attachment_status()
+            ),
+            "robot_in_room": self._robot_in_room(),
+        }
+
     async def async_update_sensor_data(self, sensor_data):
         """Update the sensor data format before sending to the sensors."""
         try:
@@ -87,7 +180,6 @@ class MQTTVacuumCoordinator(DataUpdateCoordinator):
                 LOGGER.warning("Failed to get vacuum status: %s", err, exc_info=True)
                 return SENSOR_NO_DATA
 
-            vacuum_room = self.context.shared.current_room or {"in_room": "Unsupported"}
             last_run_stats = sensor_data.get("last_run_stats", {})
             last_loaded_map = sensor_data.get("last_loaded_map", {"name": "Default"})
 
@@ -115,7 +207,7 @@ class MQTTVacuumCoordinator(DataUpdateCoordinator):
                 "last_bin_out": sensor_data.get("last_bin_out", 0),
                 "last_bin_full": sensor_data.get("last_bin_full", 0),
                 "last_loaded_map": last_loaded_map.get("name", "Default"),
-                "robot_in_room": vacuum_room.get("in_room"),
+                "robot_in_room": self._robot_in_room(),
             }
             return formatted_data
 
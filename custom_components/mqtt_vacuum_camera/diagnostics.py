@@ -0,0 +1,61 @@
+"""
+Diagnostics support for MQTT Vacuum Camera.
+Version: 2026.5.0
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_UNIQUE_ID
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_VACUUM_CONFIG_ENTRY_ID,
+    CONF_VACUUM_CONNECTION_STRING,
+    CONF_VACUUM_ENTITY_ID,
+    CONF_VACUUM_IDENTIFIERS,
+    DOMAIN,
+)
+
+TO_REDACT = {
+    CONF_UNIQUE_ID,
+    CONF_VACUUM_CONFIG_ENTRY_ID,
+    CONF_VACUUM_CONNECTION_STRING,
+    CONF_VACUUM_ENTITY_ID,
+    CONF_VACUUM_IDENTIFIERS,
+}
+
+
+def _camera_diagnostics(camera) -> dict[str, Any]:
+    """Return the runtime state of the camera entity."""
+    etag, last_modified = camera.frame_tag
+    return {
+        "camera_mode": str(camera.context.shared.camera_mode),
+        "etag": etag,
+        "last_modified": last_modified,
+        "frame_history": camera.features.frame_history.stats(),
+        "obstacle_cache": camera.processors.obstacle_view.cache.stats(),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    camera = entry_data.get("camera")
+    timings = entry_data.get("startup_timings")
+    return {
+        "entry": {
+            "title": entry.title,
+            "version": entry.version,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "is_rand256": entry_data.get("is_rand256"),
+        "startup_timings_ms": timings.as_dict() if timings is not None else None,
+        "camera": _camera_diagnostics(camera) if camera is not None else None,
+    }
@@ -1,6 +1,6 @@
 """
 Camera
-Last Updated on version: 2025.12.0
+Last Updated on version: 2026.5.0
 """
 
 from __future__ import annotations
@@ -20,32 +20,46 @@ from homeassistant.helpers.entity import DeviceInfo as Entity_Info
 from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from valetudo_map_parser.config.colors import ColorsManagement
+from valetudo_map_parser.config.types import TrimsData
 
-from .common import get_vacuum_unique_id_from_mqtt_topic
+from .common import get_camera_device_info, get_vacuum_unique_id_from_mqtt_topic
 from .const import (
     ATTR_FRIENDLY_NAME,
     ATTR_VACUUM_TOPIC,
     CAMERA_SCAN_INTERVAL_S,
     CAMERA_STORAGE,
+    CONF_CURRENT_FLOOR,
     CONF_VACUUM_IDENTIFIERS,
     FRAME_INTERVAL_S,
     LOGGER,
     MJPEG_INTERVAL_S,
     RENDER_TIMEOUT_S,
+    WARM_START_TIMEOUT_S,
     CameraModes,
 )
 from .types import (
     CameraContext,
     CameraDeviceInfo,
+    CameraFeatures,
     CameraImageState,
     CameraMQTTConfig,
     CameraPathsConfig,
     CameraProcessors,
     CameraSettings,
 )
+from .utils.camera.camera_attributes import AttributesSnapshot
 from .utils.camera.camera_processing import CameraProcessor
+from .utils.camera.frame_history import FrameHistory
+from .utils.camera.image_view import frame_etag
+from .utils.camera.map_data import extract_entities
+from .utils.camera.map_deltas import MapDeltaTracker
+from .utils.camera.map_store import MapArchive
+from .utils.camera.session_analytics import EVENT_SESSION_SUMMARY, SessionAnalytics
+from .utils.camera.svg_export import SvgExporter
+from .utils.camera.trims_store import TRIM_KEYS, async_get_trims_store
 from .utils.camera.obstacle_view import ObstacleView, ObstacleViewContext
 from .utils.connection.decompress import DecompressionManager
+from .utils.connection.http_client import RobotHttpClient
 from .utils.files_operations import async_load_file
 from .utils.thread_pool import ThreadPoolManager
 
@@ -59,8 +73,8 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
     From PI4 up to all other Home Assistant supported platforms.
 
     Note: Instance attributes count includes required Home Assistant Camera
-    base class attributes (_attr_*). Core logic uses 7 grouped dataclasses:
-    context, device, mqtt, paths, image_state, processors, settings.
+    base class attributes (_attr_*). Core logic uses 8 grouped dataclasses:
+    context, device, mqtt, paths, image_state, processors, settings, features.
     """
 
     _attr_has_entity_name = True
@@ -102,13 +116,26 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         self._cached_jpeg: bytes | None = None
 
         # 6. Processors (grouped)
-        self.processors = self._init_processors(device_info)
+        with coordinator.startup_timings.phase("_init_processors"):
+            self.processors = self._init_processors(device_info)
 
         # 7. Settings (grouped)
         self.settings = CameraSettings(
             frame_interval=float(timedelta(seconds=6).total_seconds()),
         )
 
+        # 8. Dashboard features (grouped)
+        self.features = CameraFeatures(
+            map_deltas=MapDeltaTracker(
+                self.context.file_name, bool(self.context.shared.is_rand)
+            ),
+            frame_history=FrameHistory(),
+            svg_export=SvgExporter(bool(self.context.shared.is_rand), device_info),
+            map_store=MapArchive(self.context.hass, self.context.file_name),
+            session_analytics=SessionAnalytics(),
+            attributes=AttributesSnapshot(),
+        )
+
         # Set Home Assistant entity attributes
         self._attr_model = self.device.model
         self._attr_brand = self.device.brand
@@ -153,7 +180,12 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         decompression = DecompressionManager.get_instance(self.context.file_name)
 
         # Create the processor for the camera
-        processor = CameraProcessor(self.context.hass, self.context.shared, thread_pool)
+        http_client = RobotHttpClient(
+            self.context.file_name, self.context.coordinator.config_entry.options
+        )
+        processor = CameraProcessor(
+            self.context.hass, self.context.shared, thread_pool, http_client
+        )
 
         # Initialize ObstacleView manager
         obstacle_context = ObstacleViewContext(
@@ -161,8 +193,8 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
             shared=self.context.shared,
             file_name=self.context.file_name,
             download_image_func=processor.download_image,
-            open_image_func=processor.async_open_image,
-            pil_to_bytes_func=self._run_async_image_to_bytes,
+            process_image_func=processor.async_process_obstacle_image,
+            contact_sheet_func=processor.async_render_contact_sheet,
         )
         obstacle_view = ObstacleView(obstacle_context)
 
@@ -185,20 +217,151 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to Home Assistant."""
+        with self.context.coordinator.startup_timings.phase("async_added_to_hass"):
+            await self._async_set_up_camera()
+
+    async def _async_set_up_camera(self) -> None:
+        """Load the start image, the stored trims and the obstacle view."""
         self.settings.should_poll = True
         _start_image = self.context.shared.last_image
         self.image_state.main_image = await self.context.hass.async_add_executor_job(
             self._image_to_bytes, _start_image, "Start Up"
         )
         self.context.shared.camera_mode = CameraModes.MAP_VIEW
+        self.features.trims_store = await async_get_trims_store(self.context.hass)
+        trims = self.context.shared.trims.to_dict()
+        stored_trims = self._stored_trims(self._current_floor)
+        if stored_trims and not any(trims.get(key) for key in TRIM_KEYS):
+            # Restore the auto-crop of the last run until it is calculated.
+            self.context.shared.trims = TrimsData.from_dict(stored_trims)
         # Setup ObstacleView manager
         await self.processors.obstacle_view.async_setup(self.entity_id)
+        # Rooms and destinations from MQTT change the attributes without a frame.
+        self.async_on_remove(
+            self.mqtt.connector.async_add_update_listener(
+                self.features.attributes.invalidate
+            )
+        )
+        self.context.hass.async_create_background_task(
+            self._async_warm_start(), name=f"{self.context.file_name}_warm_start"
+        )
         self.async_schedule_update_ha_state(True)
 
+    @property
+    def _current_floor(self) -> str:
+        """Return the active floor of the camera."""
+        options = self.context.coordinator.config_entry.options
+        return options.get(CONF_CURRENT_FLOOR, "floor_0")
+
+    def _map_name(self) -> Optional[str]:
+        """Return the name of the loaded map (Rand256), stored in the archive."""
+        sensor_data = self.context.coordinator.sensor_data or {}
+        map_name = sensor_data.get("last_loaded_map")
+        return map_name if isinstance(map_name, str) else None
+
+    def _stored_trims(self, floor: str) -> Optional[dict]:
+        """Return the trims stored for a floor of this camera."""
+        store = self.features.trims_store
+        trims = store.get(self.context.file_name, floor) if store else None
+        return {"floor": floor, **trims} if trims else None
+
+    async def _async_warm_start(self) -> None:
+        """Render the stored map of the floor until the first live map."""
+        stored = await self.features.map_store.async_load(self._current_floor)
+        if stored is None or self.processors.processor.data:
+            return
+        parsed_json, _ = stored
+        self.features.map_store.mark_saved(parsed_json)
+        if await self._async_render_map(parsed_json):
+            LOGGER.debug(
+                "%s: Camera warm started from the stored map", self.context.file_name
+            )
+
+    async def _async_render_map(self, parsed_json: Optional[dict]) -> bool:
+        """Render a parsed map outside of the live updates."""
+        render = None
+        if parsed_json is not None:
+            render = self.processors.processor.run_process_valetudo_data(parsed_json)
+        if render is None:
+            return False
+        try:
+            await asyncio.wait_for(render, timeout=WARM_START_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            LOGGER.debug("%s: Stored map render timed out", self.context.file_name)
+            return False
+        finally:
+            # The live map must still be rendered when it arrives.
+            self.context.shared.image_grab = True
+        self._record_frame()
+        await self._async_handle_new_map(parsed_json)
+        self.async_write_ha_state()
+        return True
+
+    async def async_apply_drawing_options(self) -> None:
+        """Apply new colours, transparency and drawn elements to the live camera."""
+        shared = self.context.shared
+        device_info = get_camera_device_info(
+            self.context.hass, self.context.coordinator.config_entry
+        )
+        shared_manager = self.context.coordinator.shared_manager
+        if shared_manager is not None:
+            # The auto-calculated trims of the running map are kept.
+            trims = shared.trims
+            shared_manager.update_shared_data(device_info)
+            shared.trims = trims
+        colors = ColorsManagement(shared)
+        colors.set_initial_colours(device_info)
+        self.processors.colors = colors
+        self.features.svg_export.set_options(device_info)
+        # The drawing configuration is read when the handler is created.
+        self.processors.processor.reset_handler()
+        self.features.attributes.invalidate()
+        await self._async_render_map(self.features.last_map)
+        LOGGER.debug("%s: Drawing options applied", self.context.file_name)
+
+    async def async_switch_floor(
+        self, floor: str, floor_data: dict, new_floor: bool = True
+    ) -> None:
+        """Activate a floor in place, keeping the subscriptions and the pools."""
+        shared = self.context.shared
+        trims = floor_data.get("trims")
+        if not trims or not any(trims.get(key) for key in TRIM_KEYS):
+            trims = self._stored_trims(floor) or trims
+        if trims:
+            shared.trims = TrimsData.from_dict(trims)
+        else:
+            shared.reset_trims()
+        if floor_data.get("rotation") is not None:
+            shared.image_rotate = int(floor_data["rotation"])
+        # A new handler drops the render and crop caches of the previous floor.
+        self.processors.processor.reset_handler()
+        self.features.attributes.invalidate()
+        parsed_json = self.features.last_map
+        if new_floor:
+            self.features.session_analytics.reset()
+            self.features.map_store.forget()
+            stored = await self.features.map_store.async_load(floor)
+            parsed_json = stored[0] if stored else None
+            if parsed_json is not None:
+                self.features.map_store.mark_saved(parsed_json)
+        # Without a stored map the last frame stays until the live map arrives.
+        await self._async_render_map(parsed_json)
+        LOGGER.debug("%s: Switched to %s", self.context.file_name, floor)
+
+    def reset_trims(self) -> None:
+        """Drop the live trims so that they are not stored again before a reload."""
+        self.context.shared.reset_trims()
+        # The crop of the handler is calculated again with the next map.
+        self.processors.processor.reset_handler()
+        self.features.attributes.invalidate()
+
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity removal from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_cleanup_all()
+        self.features.frame_history.clear()
+        if hasattr(self, "processors"):
+            await self.processors.processor.async_close()
 
         # Unsubscribe from MQTT topics
         if self.mqtt.connector:
@@ -258,11 +421,49 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
         """Camera Image"""
+        frame = self._select_frame()
+        self._update_frame_tag(frame)
+        return frame
+
+    @property
+    def frame_tag(self) -> tuple[Optional[str], Optional[float]]:
+        """Return the ETag and Last-Modified time of the last served frame."""
+        return self.image_state.etag, self.image_state.last_modified
+
+    def _update_frame_tag(self, frame: Optional[bytes]) -> None:
+        """Hash the frame only when a new bytes object is served."""
+        if frame is None or frame is self.image_state.tagged_frame:
+            return
+        etag = frame_etag(frame)
+        if etag != self.image_state.etag:
+            self.image_state.etag = etag
+            self.image_state.last_modified = time.time()
+        self.image_state.tagged_frame = frame
+
+    @property
+    def frame_content_type(self) -> str:
+        """Return the content type of the rendered frames."""
+        return self.context.shared.get_content_type
+
+    def _record_frame(self) -> None:
+        """Add the rendered frame to the history (deduplicated by ETag)."""
+        frame = self._select_frame()
+        self._update_frame_tag(frame)
+        if frame is None or self.image_state.etag is None:
+            return
+        self.features.frame_history.add(
+            frame,
+            self.image_state.etag,
+            self.image_state.last_modified or time.time(),
+            self.frame_content_type,
+        )
+
+    def _select_frame(self) -> Optional[bytes]:
+        """Select the frame to serve for the current camera mode."""
         if (
             self.context.shared.camera_mode == CameraModes.OBSTACLE_VIEW
             or self.context.shared.binary_image is None
         ):
-            width, height = self.image_state.width, self.image_state.height
             return self.image_state.main_image
         # Return the binary image data from the processor
         # Defensive check: ensure processor.data exists and has expected structure
@@ -283,9 +484,28 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         """Return supported features."""
         return CameraEntityFeature.ON_OFF
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return Camera Attributes"""
+    def _attributes_key(self) -> tuple:
+        """Return the shared fields the attributes depend on (cheap to compare)."""
+        shared = self.context.shared
+        return (
+            self.image_state.etag,
+            shared.vac_json_id,
+            shared.camera_mode,
+            shared.vacuum_state,
+            shared.vacuum_battery,
+            shared.get_content_type,
+            self._attr_name,
+            # Updated from MQTT without a new frame.
+            shared.vacuum_connection,
+            shared.dock_state,
+            shared.mop_mode,
+            shared.rand256_active_zone,
+            shared.destinations,
+            shared.map_rooms,
+        )
+
+    def _build_attributes(self) -> dict:
+        """Return all the camera attributes."""
         attr_data = self.context.shared.to_dict()["attributes"]
         attributes = {
             ATTR_FRIENDLY_NAME: self._attr_name,
@@ -296,6 +516,20 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         attributes["content_type"] = self.context.shared.get_content_type
         return attributes
 
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return Camera Attributes (compact, rebuilt only when changed)."""
+        return self.features.attributes.compact(
+            self._attributes_key(), self._build_attributes
+        )
+
+    def full_attributes(self) -> dict:
+        """Return the up to date attributes with the large payloads."""
+        self.features.attributes.invalidate()
+        return self.features.attributes.full(
+            self._attributes_key(), self._build_attributes
+        )
+
     @property
     def should_poll(self) -> bool:
         """ON/OFF Camera Polling Based on Camera Mode."""
@@ -400,6 +634,21 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
                     )
                     # Reset timeout counter on successful processing
                     self.settings.timeout_counter = 0
+                    self._record_frame()
+                    self.processors.obstacle_view.schedule_prefetch()
+                    # The room of the robot comes from the rendered map.
+                    self.context.coordinator.async_request_sensor_update()
+                    if self.features.trims_store is not None:
+                        self.features.trims_store.set(
+                            self.context.file_name,
+                            self._current_floor,
+                            self.context.shared.trims.to_dict(),
+                        )
+                    await self.features.map_store.async_save_if_needed(
+                        self._current_floor,
+                        self.context.shared.vacuum_state,
+                        self._map_name(),
+                    )
                 except asyncio.TimeoutError:
                     # Increment timeout counter (initialize if missing for existing instances)
                     current_count = getattr(self.settings, "timeout_counter", 0)
@@ -418,6 +667,49 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
                             self.context.file_name,
                             self.settings.timeout_counter,
                         )
+                await self._async_handle_new_map(parsed_json)
+
+    async def _async_handle_new_map(self, parsed_json: dict) -> None:
+        """Share the new parsed map with the dashboard features."""
+        self.features.last_map = parsed_json
+        self.features.map_deltas.set_source(parsed_json)
+        await self.features.map_deltas.async_process(self.context.hass)
+        await self._async_update_rooms(parsed_json)
+
+    def _build_rooms(self, parsed_json: dict) -> tuple:
+        """Build the room index if the map changed, extract the entities (executor)."""
+        map_hash, index = self.context.coordinator.rooms.build(parsed_json)
+        entities = extract_entities(parsed_json, bool(self.context.shared.is_rand))
+        return map_hash, index, entities
+
+    async def _async_update_rooms(self, parsed_json: dict) -> None:
+        """Update the rooms and cleaning session data with the new map."""
+        coordinator = self.context.coordinator
+        if self.context.shared.is_rand:
+            destinations = self.mqtt.connector.get_destinations() or {}
+            coordinator.rooms.set_names(
+                {
+                    str(room["id"]): room["name"].strip("#")
+                    for room in destinations.get("rooms", [])
+                }
+            )
+        map_hash, index, entities = await self.context.hass.async_add_executor_job(
+            self._build_rooms, parsed_json
+        )
+        # The robot room and the session are only changed on the event loop.
+        robot_room = coordinator.rooms.robot_room
+        index = coordinator.rooms.set_index(map_hash, index)
+        coordinator.rooms.locate_robot(entities["robot"])
+        summary = self.features.session_analytics.update(
+            entities, self.context.shared.vacuum_state, index
+        )
+        if coordinator.rooms.robot_room != robot_room:
+            coordinator.async_request_sensor_update()
+        coordinator.async_set_session_metrics(self.features.session_analytics.metrics())
+        if summary:
+            self.context.hass.bus.async_fire(
+                EVENT_SESSION_SUMMARY, {"entity_id": self.entity_id, **summary}
+            )
 
     async def _process_parsed_json(self, test_mode: bool = False):
         """Process the parsed JSON data and return the generated image."""
@@ -447,6 +739,8 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
                     payload=data, data_type=data_type
                 )
             )
+            if parsed_json is not None:
+                self.features.map_store.remember(parsed_json, data_type)
         return parsed_json, test_mode, data_type
 
     def _image_to_bytes(self, pil_img, image_id: str | None = None) -> Optional[bytes]:
@@ -470,26 +764,6 @@ class MQTTCamera(CoordinatorEntity, Camera):  # pylint: disable=too-many-instanc
         finally:
             buffered.close()
 
-    async def _run_async_image_to_bytes(self, pil_img, image_id: str | None = None):
-        """Thread function to process the image data using persistent thread pool."""
-        try:
-            result = await self.processors.thread_pool.run_in_executor(
-                "camera_processing",
-                self._image_to_bytes,
-                pil_img,
-                image_id,
-            )
-            return result
-        except (OSError, IOError) as e:
-            LOGGER.error("Error encoding image to PNG: %s", str(e), exc_info=True)
-            return None
-        except (AttributeError, ValueError) as e:
-            LOGGER.error("Invalid image data: %s", str(e), exc_info=True)
-            return None
-        except RuntimeError as e:
-            LOGGER.error("Thread pool error: %s", str(e), exc_info=True)
-            return None
-
     async def handle_vacuum_start(self, event):
         """Handle the event_vacuum_start event."""
         if event.data and isinstance(event.data, dict):
@@ -1,5 +1,5 @@
-"""Sensors for Rand256.
-Version: 2025.10.0
+"""Sensors for Rand256 and Hypfer.
+Version: 2026.5.0
 """
 
 from __future__ import annotations
@@ -14,7 +14,13 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfArea, UnitOfTime
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfArea,
+    UnitOfLength,
+    UnitOfSpeed,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import EntityCategory
@@ -31,6 +37,7 @@ class VacuumSensorDescription(SensorEntityDescription):
     """A class that describes vacuum sensor entities."""
 
     attributes: tuple = ()
+    attributes_key: str = None
     parent_key: str = None
     keys: list[str] = None
     value: Callable = None
@@ -177,6 +184,110 @@ SENSOR_TYPES = {
 }
 
 
+# Hypfer: values already received by the connector (no extra MQTT subscription).
+HYPFER_SENSOR_TYPES = {
+    "battery": SENSOR_TYPES["battery"],
+    "state": SENSOR_TYPES["state"],
+    "robot_in_room": SENSOR_TYPES["robot_in_room"],
+    "error": VacuumSensorDescription(
+        key="error",
+        icon="mdi:alert-circle",
+        name="Vacuum error",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "dock_status": VacuumSensorDescription(
+        key="dock_status",
+        icon="mdi:home-import-outline",
+        name="Dock status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "operation_mode": VacuumSensorDescription(
+        key="operation_mode",
+        icon="mdi:cog-transfer",
+        name="Operation mode",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "water_usage": VacuumSensorDescription(
+        key="water_usage",
+        icon="mdi:water",
+        name="Water usage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "mop_attached": VacuumSensorDescription(
+        key="mop_attached",
+        icon="mdi:spray-bottle",
+        name="Mop attachment",
+        device_class=SensorDeviceClass.ENUM,
+        options=["attached", "detached"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "dustbin_attached": VacuumSensorDescription(
+        key="dustbin_attached",
+        icon="mdi:delete-variant",
+        name="Dustbin attachment",
+        device_class=SensorDeviceClass.ENUM,
+        options=["attached", "detached"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "watertank_attached": VacuumSensorDescription(
+        key="watertank_attached",
+        icon="mdi:cup-water",
+        name="Water tank attachment",
+        device_class=SensorDeviceClass.ENUM,
+        options=["attached", "detached"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+}
+
+
+# Cleaning session metrics computed by the camera from the maps (both firmwares).
+SESSION_SENSOR_TYPES = {
+    "session_area": VacuumSensorDescription(
+        native_unit_of_measurement=UnitOfArea.SQUARE_METERS,
+        key="session_area",
+        icon="mdi:texture-box",
+        name="Session cleaned area",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "session_coverage": VacuumSensorDescription(
+        native_unit_of_measurement=PERCENTAGE,
+        key="session_coverage",
+        icon="mdi:floor-plan",
+        name="Session coverage",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        attributes_key="session_rooms",
+    ),
+    "session_distance": VacuumSensorDescription(
+        native_unit_of_measurement=UnitOfLength.METERS,
+        key="session_distance",
+        icon="mdi:map-marker-distance",
+        name="Session distance",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "session_average_speed": VacuumSensorDescription(
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        key="session_average_speed",
+        icon="mdi:speedometer",
+        name="Session average speed",
+        device_class=SensorDeviceClass.SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "session_duration": VacuumSensorDescription(
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        key="session_duration",
+        icon="mdi:timer-outline",
+        name="Session duration",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+}
+
+
 class VacuumSensor(CoordinatorEntity, SensorEntity):
     """Representation of a vacuum sensor."""
 
@@ -198,6 +309,12 @@ class VacuumSensor(CoordinatorEntity, SensorEntity):
         self.entity_id = f"sensor.{coordinator.context.file_name}_{sensor_type}"
         self._identifiers = vacuum_identifier
 
+    async def async_added_to_hass(self) -> None:
+        """Show the data already pushed by the connector."""
+        await super().async_added_to_hass()
+        if self.coordinator.sensor_data is not SENSOR_NO_DATA:
+            self._handle_coordinator_update()
+
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity removal from Home Assistant."""
         await super().async_will_remove_from_hass()
@@ -225,6 +342,10 @@ class VacuumSensor(CoordinatorEntity, SensorEntity):
 
         # Fetch the value based on the key in the description
         native_value = data.get(self.entity_description.key, 0)
+        if self.entity_description.attributes_key:
+            self._attr_extra_state_attributes = (
+                data.get(self.entity_description.attributes_key) or {}
+            )
         if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
             # Convert the Unix timestamp to datetime
             try:
@@ -281,8 +402,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         CONF_VACUUM_IDENTIFIERS
     ]
     # Create and add sensor entities
+    sensor_types = SENSOR_TYPES if coordinator.is_rand256 else HYPFER_SENSOR_TYPES
+    sensor_types = {**sensor_types, **SESSION_SENSOR_TYPES}
     sensors = []
-    for sensor_type, description in SENSOR_TYPES.items():
+    for sensor_type, description in sensor_types.items():
         sensors.append(
             VacuumSensor(coordinator, description, sensor_type, vacuum_identifier)
         )
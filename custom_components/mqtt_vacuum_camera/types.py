@@ -1,11 +1,11 @@
 """
 Type definitions and dataclasses for MQTT Vacuum Camera integration.
-Version: 2025.12.0
+Version: 2026.5.0
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Callable, Optional
 
@@ -60,7 +60,8 @@ class CoordinatorConfig:
     connector: Any  # ValetudoConnector (required)
     shared: Any  # CameraShared (required)
     is_rand256: bool = False
-    polling_interval: timedelta = field(default_factory=lambda: timedelta(seconds=10))
+    # None: the connector pushes the updates, no polling.
+    polling_interval: Optional[timedelta] = None
 
 
 @dataclass
@@ -127,6 +128,9 @@ class CameraImageState:
     width: int = 0
     height: int = 0
     json_data: Optional[dict] = None
+    etag: Optional[str] = None
+    last_modified: Optional[float] = None
+    tagged_frame: Optional[bytes] = None
 
 
 @dataclass
@@ -149,3 +153,17 @@ class CameraSettings:
     frame_interval: float = 6.0
     event_listener: Optional[Callable] = None
     timeout_counter: int = 0
+
+
+@dataclass
+class CameraFeatures:
+    """Optional dashboard features attached to the camera."""
+
+    map_deltas: Any  # MapDeltaTracker
+    frame_history: Any  # FrameHistory
+    svg_export: Any  # SvgExporter
+    map_store: Any  # MapArchive
+    session_analytics: Any  # SessionAnalytics
+    attributes: Any  # AttributesSnapshot
+    last_map: Optional[dict] = None  # last parsed map JSON
+    trims_store: Any = None  # TrimsStore, loaded when the camera is added
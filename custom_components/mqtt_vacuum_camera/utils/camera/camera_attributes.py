@@ -0,0 +1,81 @@
+"""
+Camera State Attributes.
+Version: 2026.5.0
+Versioned snapshot of the camera attributes, rebuilt only when the shared
+fields it depends on change. The state attributes keep a compact summary; the
+large payloads (rooms, zones, points, obstacles) are fetched on demand with
+the camera_attributes action or the websocket command.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable
+
+from custom_components.mqtt_vacuum_camera.const import (
+    ATTR_OBSTACLES,
+    ATTR_POINTS,
+    ATTR_ROOMS,
+    ATTR_ZONES,
+)
+
+LARGE_ATTRIBUTES = (ATTR_ROOMS, ATTR_ZONES, ATTR_POINTS, ATTR_OBSTACLES)
+ATTR_ATTRIBUTES_VERSION = "attributes_version"
+
+
+def _count(value: Any) -> int:
+    """Return the number of items of an attribute payload."""
+    if isinstance(value, (list, dict, tuple)):
+        return len(value)
+    return 0 if value is None else 1
+
+
+def compact_attributes(attributes: dict[str, Any], version: int) -> dict[str, Any]:
+    """Return the attributes with the large payloads replaced by their counts."""
+    compact = {
+        key: value for key, value in attributes.items() if key not in LARGE_ATTRIBUTES
+    }
+    for key in LARGE_ATTRIBUTES:
+        if key in attributes:
+            compact[f"{key}_count"] = _count(attributes[key])
+    compact[ATTR_ATTRIBUTES_VERSION] = version
+    return compact
+
+
+class AttributesSnapshot:
+    """Full and compact camera attributes, cached by a change key."""
+
+    def __init__(self) -> None:
+        self._key: Hashable = None
+        self._full: dict[str, Any] = {}
+        self._compact: dict[str, Any] = {}
+        self.version = 0
+
+    def _refresh(self, key: Hashable, build: Callable[[], dict[str, Any]]) -> None:
+        """Rebuild the snapshot when the key changed."""
+        if key is not None and key == self._key:
+            return
+        self._key = key
+        full = build()
+        if full != self._full or not self._compact:
+            if full != self._full:
+                self.version += 1
+            self._full = full
+            self._compact = compact_attributes(full, self.version)
+
+    def compact(
+        self, key: Hashable, build: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Return the state attributes (the same mapping while unchanged)."""
+        self._refresh(key, build)
+        return self._compact
+
+    def full(
+        self, key: Hashable, build: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Return all the attributes, including the large payloads."""
+        self._refresh(key, build)
+        return self._full
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next access."""
+        self._key = None
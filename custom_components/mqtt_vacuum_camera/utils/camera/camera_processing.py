@@ -1,25 +1,30 @@
 """
 Multiprocessing module
-Version: 2026.3.1
+Version: 2026.5.0
 This module provide the image multiprocessing in order to
 avoid the overload of the main_thread of Home Assistant.
 """
 
 from __future__ import annotations
 
-import asyncio
-import concurrent.futures
-from io import BytesIO
 from typing import Any
 
 from PIL import Image
-import aiohttp
 from valetudo_map_parser.config.types import JsonType
 from valetudo_map_parser.conga_handler import CongaMapImageHandler
 from valetudo_map_parser.hypfer_handler import HypferMapImageHandler
 from valetudo_map_parser.rand256_handler import ReImageHandler
 
 from custom_components.mqtt_vacuum_camera.const import LOGGER, NOT_STREAMING_STATES
+from custom_components.mqtt_vacuum_camera.utils.camera.contact_sheet import (
+    render_contact_sheet,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_image import (
+    render_obstacle_image,
+)
+from custom_components.mqtt_vacuum_camera.utils.connection.http_client import (
+    RobotHttpClient,
+)
 from custom_components.mqtt_vacuum_camera.utils.thread_pool import ThreadPoolManager
 
 LOGGER.propagate = True
@@ -30,19 +35,33 @@ class CameraProcessor:
     CameraProcessor class to process the image data from the Vacuum JSON data.
     """
 
-    def __init__(self, hass, camera_shared, thread_pool: ThreadPoolManager):
+    def __init__(
+        self,
+        hass,
+        camera_shared,
+        thread_pool: ThreadPoolManager,
+        http_client: RobotHttpClient,
+    ):
         self.hass = hass
         self._shared = camera_shared
-        if self._shared.is_rand:
-            self._handler = ReImageHandler(camera_shared)
-        elif self._shared.is_conga:
-            self._handler = CongaMapImageHandler(camera_shared)
-        else:
-            self._handler = HypferMapImageHandler(camera_shared)
+        self._handler = self._create_handler()
         self._thread_pool = thread_pool
+        self._http_client = http_client
         self.data: dict[str, Any] = {}
         self._file_name = self._shared.file_name
 
+    def _create_handler(self):
+        """Return the image handler of the vacuum firmware."""
+        if self._shared.is_rand:
+            return ReImageHandler(self._shared)
+        if self._shared.is_conga:
+            return CongaMapImageHandler(self._shared)
+        return HypferMapImageHandler(self._shared)
+
+    def reset_handler(self) -> None:
+        """Replace the image handler, dropping its render and crop caches."""
+        self._handler = self._create_handler()
+
     async def async_process_image_data(
         self, parsed_json: JsonType
     ) -> Image.Image | bytes | None:
@@ -103,8 +122,7 @@ class CameraProcessor:
             return self._handler.get_frame_number()
         return self._handler.get_frame_number() - 2
 
-    @staticmethod
-    async def download_image(url: str, set_timeout: int = 6):
+    async def download_image(self, url: str, set_timeout: int = 6):
         """
         Asynchronously download an image without blocking.
 
@@ -114,41 +132,29 @@ class CameraProcessor:
         Returns:
             Image: The downloaded image in jpeg format.
         """
-
-        try:
-            timeout = aiohttp.ClientTimeout(total=set_timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        obstacle_image = await response.read()
-                        return obstacle_image
-                    LOGGER.warning(
-                        "Failed to download obstacle image. Status: %s, Reason: %s",
-                        response.status,
-                        response.reason,
-                    )
-                    return None
-        except aiohttp.ClientError as e:
-            LOGGER.warning(
-                "Client error occurred: %s",
-                e,
-                exc_info=True,
-            )
-            return None
-        except asyncio.TimeoutError as e:
-            LOGGER.warning("Timeout downloading image: %s", e)
-            return None
-
-    async def async_open_image(self, obstacle_image: Any) -> Image.Image:
-        """Asynchronously open an image file using a temporary 1-worker pool."""
-
-        def open_image(image_data: Any) -> Image.Image:
-            return Image.open(BytesIO(image_data))
-
-        # obstacle_image
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix=f"{self._file_name}_camera"
-        ) as ex:
-            fut = ex.submit(open_image, obstacle_image)
-            result = await asyncio.wrap_future(fut)
-        return result
+        return await self._http_client.async_download(url, set_timeout)
+
+    async def async_close(self) -> None:
+        """Close the HTTP session of the vacuum."""
+        await self._http_client.async_close()
+
+    async def async_process_obstacle_image(
+        self, image_data: bytes, width: int, height: int, aspect_ratio: str
+    ) -> bytes:
+        """Open, resize and encode an obstacle image as one pooled job."""
+        return await self._thread_pool.run_in_executor(
+            "camera_processing",
+            render_obstacle_image,
+            image_data,
+            width,
+            height,
+            aspect_ratio,
+        )
+
+    async def async_render_contact_sheet(
+        self, items: list[tuple[str, bytes | None]]
+    ) -> bytes:
+        """Render the obstacles contact sheet as one pooled job."""
+        return await self._thread_pool.run_in_executor(
+            "camera_processing", render_contact_sheet, items
+        )
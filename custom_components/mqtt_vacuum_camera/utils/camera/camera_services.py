@@ -2,12 +2,22 @@
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SERVICE_RELOAD
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
 
-from ...common import create_floor_data, get_entity_id
+from ...common import create_floor_data, get_camera_entity, get_entity_id
 from ...const import CONF_CURRENT_FLOOR, CONF_FLOORS_DATA, DOMAIN, LOGGER
+from ...utils.camera.frame_history import parse_history_time
+from ...utils.camera.timelapse import (
+    DEFAULT_FRAME_DURATION_MS,
+    DEFAULT_TIMELAPSE_FRAMES,
+    DEFAULT_TIMELAPSE_WIDTH,
+    TIMELAPSE_EXTENSIONS,
+    TimelapseRequest,
+    async_run_timelapse,
+)
 from ...utils.files_operations import async_clean_up_all_auto_crop_files
 
 
@@ -199,3 +209,125 @@ async def camera_update_floor_data(call: ServiceCall, hass: HomeAssistant) -> No
         {"entity_id": camera_entity_id, "floor_id": floor_id},
         context=call.context,
     )
+
+
+def _get_camera_from_call(call: ServiceCall, hass: HomeAssistant):
+    """Return the camera entity object targeted by a service call."""
+    camera_entity_id = _resolve_camera_entity_id(call, hass)
+    camera = get_camera_entity(hass, camera_entity_id) if camera_entity_id else None
+    if camera is None:
+        raise ServiceValidationError("no_entity_id_provided")
+    return camera
+
+
+def _history_frame_response(camera, frame) -> ServiceResponse:
+    """Describe a history frame and where to download it."""
+    etag = frame.etag.strip('"')
+    return {
+        "timestamp": frame.timestamp,
+        "etag": etag,
+        "size": len(frame.data),
+        "content_type": frame.content_type,
+        "url": f"/api/{DOMAIN}/history/{camera.entity_id}?etag={etag}",
+    }
+
+
+async def camera_frame_history(
+    call: ServiceCall, hass: HomeAssistant
+) -> ServiceResponse:
+    """Return the recorded frames of a camera, or the frame at an index / time."""
+    camera = _get_camera_from_call(call, hass)
+    history = camera.features.frame_history
+    try:
+        if call.data.get("time") is not None:
+            frame = history.get_by_time(parse_history_time(call.data["time"]))
+        elif call.data.get("index") is not None:
+            frame = history.get_by_index(int(call.data["index"]))
+        else:
+            return {"stats": history.stats(), "frames": history.index()}
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+    if frame is None:
+        return {"frame": None}
+    return {"frame": _history_frame_response(camera, frame)}
+
+
+def _positive_int(call: ServiceCall, key: str, default: int) -> int:
+    """Return a positive integer option of the service call."""
+    value = call.data.get(key, default)
+    try:
+        number = int(value)
+    except (TypeError, ValueError) as err:
+        raise ServiceValidationError(f"{key} must be an integer: {value}") from err
+    if number < 1:
+        raise ServiceValidationError(f"{key} must be at least 1: {value}")
+    return number
+
+
+async def camera_timelapse(call: ServiceCall, hass: HomeAssistant) -> ServiceResponse:
+    """Build a time-lapse of the frame history in the background."""
+    camera = _get_camera_from_call(call, hass)
+    image_format = call.data.get("format", "webp")
+    if image_format not in TIMELAPSE_EXTENSIONS:
+        raise ServiceValidationError(f"Unsupported time-lapse format: {image_format}")
+    try:
+        since = parse_history_time(call.data.get("start"))
+        until = parse_history_time(call.data.get("end"))
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+    max_frames = _positive_int(call, "max_frames", DEFAULT_TIMELAPSE_FRAMES)
+    frame_duration = _positive_int(call, "frame_duration", DEFAULT_FRAME_DURATION_MS)
+    max_width = _positive_int(call, "max_width", DEFAULT_TIMELAPSE_WIDTH)
+
+    frames = [
+        frame
+        for frame in camera.features.frame_history.frames()
+        if (since is None or frame.timestamp >= since)
+        and (until is None or frame.timestamp <= until)
+    ]
+    if len(frames) < 2:
+        raise ServiceValidationError("timelapse_not_enough_frames")
+
+    request = TimelapseRequest(
+        entity_id=camera.entity_id,
+        file_name=call.data.get(
+            "filename", f"{camera.context.file_name}_timelapse"
+        ),
+        image_format=image_format,
+        max_frames=max_frames,
+        frame_duration=frame_duration,
+        max_width=max_width,
+    )
+    hass.async_create_background_task(
+        async_run_timelapse(hass, frames, request),
+        name=f"{DOMAIN}_timelapse_{request.job_id}",
+    )
+    return {"job_id": request.job_id, "frames": len(frames)}
+
+
+async def obstacles_contact_sheet(
+    call: ServiceCall, hass: HomeAssistant
+) -> ServiceResponse:
+    """Show all the obstacles of the map in one image on the camera."""
+    camera = _get_camera_from_call(call, hass)
+    obstacles = await camera.processors.obstacle_view.async_show_contact_sheet()
+    if obstacles is None:
+        raise ServiceValidationError("no_obstacles_to_show")
+    camera.async_schedule_update_ha_state(True)
+    return {
+        "obstacles": [
+            {
+                "index": position + 1,
+                "label": obstacle.get("label"),
+                "point": obstacle.get("point"),
+            }
+            for position, obstacle in enumerate(obstacles)
+        ]
+    }
+
+
+async def camera_attributes(call: ServiceCall, hass: HomeAssistant) -> ServiceResponse:
+    """Return all the camera attributes, with the rooms, zones and obstacles."""
+    camera = _get_camera_from_call(call, hass)
+    attributes = camera.full_attributes()
+    return {"version": camera.features.attributes.version, "attributes": attributes}
@@ -0,0 +1,103 @@
+"""
+Obstacles Contact Sheet.
+Version: 2026.5.0
+One image with the thumbnails of all the obstacles of the map, numbered and
+labelled, so a run can be reviewed in one fetch. Rendered in a synchronous
+job (camera processing pool) from the cached original images.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+import math
+from typing import Any, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_cache import (
+    obstacle_key,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_image import (
+    REDUCING_GAP,
+    fitted_size,
+)
+
+CONTACT_SHEET_COLUMNS = 4
+CONTACT_SHEET_MAX_ITEMS = 24
+THUMBNAIL_SIZE = (240, 180)
+LABEL_HEIGHT = 24
+PADDING = 6
+BACKGROUND = (32, 32, 32)
+PLACEHOLDER = (70, 70, 70)
+TEXT_COLOR = (235, 235, 235)
+
+
+def contact_sheet_signature(obstacles: list[dict[str, Any]]) -> tuple:
+    """Return what makes a contact sheet out of date when it changes."""
+    return tuple(
+        (obstacle_key(obstacle), obstacle.get("label")) for obstacle in obstacles
+    )
+
+
+def grid_shape(count: int, columns: int = CONTACT_SHEET_COLUMNS) -> tuple[int, int]:
+    """Return the (columns, rows) of the grid for count tiles."""
+    columns = max(1, min(columns, count))
+    return columns, max(1, math.ceil(count / columns))
+
+
+def _thumbnail(image_data: Optional[bytes]) -> Optional[Image.Image]:
+    """Decode an obstacle image directly near the thumbnail size."""
+    if not image_data:
+        return None
+    try:
+        with Image.open(BytesIO(image_data)) as source:
+            target = fitted_size(source.size, THUMBNAIL_SIZE)
+            source.draft("RGB", target)
+            image = source.convert("RGB")
+    except (OSError, ValueError):
+        return None
+    image.thumbnail(target, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    return image
+
+
+def render_contact_sheet(
+    items: list[tuple[str, Optional[bytes]]],
+    columns: int = CONTACT_SHEET_COLUMNS,
+) -> bytes:
+    """
+    Return the PNG contact sheet of (label, original image) items.
+
+    Obstacles without image (download failed) get a grey placeholder.
+    """
+    columns, rows = grid_shape(len(items), columns)
+    tile_width = THUMBNAIL_SIZE[0] + 2 * PADDING
+    tile_height = THUMBNAIL_SIZE[1] + LABEL_HEIGHT + 2 * PADDING
+    sheet = Image.new("RGB", (columns * tile_width, rows * tile_height), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+    for position, (label, image_data) in enumerate(items):
+        left = (position % columns) * tile_width + PADDING
+        top = (position // columns) * tile_height + PADDING
+        thumbnail = _thumbnail(image_data)
+        if thumbnail is None:
+            draw.rectangle(
+                (left, top, left + THUMBNAIL_SIZE[0], top + THUMBNAIL_SIZE[1]),
+                fill=PLACEHOLDER,
+            )
+        else:
+            sheet.paste(
+                thumbnail,
+                (
+                    left + (THUMBNAIL_SIZE[0] - thumbnail.width) // 2,
+                    top + (THUMBNAIL_SIZE[1] - thumbnail.height) // 2,
+                ),
+            )
+        draw.text(
+            (left, top + THUMBNAIL_SIZE[1] + 4),
+            f"{position + 1}. {label}",
+            fill=TEXT_COLOR,
+            font=font,
+        )
+    buffered = BytesIO()
+    sheet.save(buffered, format="PNG")
+    return buffered.getvalue()
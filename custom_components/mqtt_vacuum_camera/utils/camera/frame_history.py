@@ -0,0 +1,163 @@
+"""
+Frame History.
+Version: 2026.5.0
+Per camera ring buffer of the last encoded frames (PNG/JPEG bytes, never PIL
+images). Frames are stored once per content hash and evicted oldest first
+when the frame count or the memory cap is exceeded.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.mqtt_vacuum_camera.const import (
+    FRAME_HISTORY_MAX_BYTES,
+    FRAME_HISTORY_MAX_FRAMES,
+)
+
+
+@dataclass
+class HistoryFrame:
+    """A frame of the history."""
+
+    timestamp: float
+    etag: str
+    content_type: str
+    data: bytes
+
+
+def parse_history_time(value: Any) -> Optional[float]:
+    """Parse a POSIX timestamp or an ISO date/time (local time if naive)."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+    return parsed.timestamp()
+
+
+class FrameHistory:
+    """Ring buffer of encoded frames deduplicated by content hash."""
+
+    def __init__(
+        self,
+        max_frames: int = FRAME_HISTORY_MAX_FRAMES,
+        max_bytes: int = FRAME_HISTORY_MAX_BYTES,
+    ) -> None:
+        self._max_frames = max(1, max_frames)
+        self._max_bytes = max(1, max_bytes)
+        # (timestamp, etag, content_type) in chronological order
+        self._entries: deque[tuple[float, str, str]] = deque()
+        # etag -> [data, references]
+        self._store: dict[str, list] = {}
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_usage(self) -> int:
+        """Return the bytes held by the unique frames."""
+        return self._bytes
+
+    def add(self, data: bytes, etag: str, timestamp: float, content_type: str) -> bool:
+        """Record a frame, returns False if it is the same as the last one."""
+        if not data:
+            return False
+        if self._entries and self._entries[-1][1] == etag:
+            return False
+        if self._entries and timestamp < self._entries[-1][0]:
+            timestamp = self._entries[-1][0]
+        stored = self._store.get(etag)
+        if stored is None:
+            self._store[etag] = [data, 1]
+            self._bytes += len(data)
+        else:
+            stored[1] += 1
+        self._entries.append((timestamp, etag, content_type))
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Drop the oldest frames until both caps are respected."""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_frames or self._bytes > self._max_bytes
+        ):
+            _, etag, _ = self._entries.popleft()
+            stored = self._store[etag]
+            stored[1] -= 1
+            if stored[1] == 0:
+                self._bytes -= len(stored[0])
+                del self._store[etag]
+
+    def _frame(self, index: int) -> HistoryFrame:
+        timestamp, etag, content_type = self._entries[index]
+        return HistoryFrame(timestamp, etag, content_type, self._store[etag][0])
+
+    def get_by_index(self, index: int) -> Optional[HistoryFrame]:
+        """Return the frame at index (negative counts from the newest)."""
+        try:
+            return self._frame(index)
+        except IndexError:
+            return None
+
+    def get_by_time(self, timestamp: float) -> Optional[HistoryFrame]:
+        """Return the frame that was current at the given time."""
+        position = bisect_right(self._entries, timestamp, key=lambda entry: entry[0])
+        if position == 0:
+            return None
+        return self._frame(position - 1)
+
+    def get_by_etag(self, etag: str) -> Optional[HistoryFrame]:
+        """Return the newest frame with the given content hash."""
+        if etag not in self._store:
+            return None
+        for position in range(len(self._entries) - 1, -1, -1):
+            if self._entries[position][1] == etag:
+                return self._frame(position)
+        return None
+
+    def frames(self) -> list[HistoryFrame]:
+        """Return all the frames, oldest first (the bytes are shared)."""
+        return [self._frame(index) for index in range(len(self._entries))]
+
+    def index(self) -> list[dict[str, Any]]:
+        """Return the frames metadata, oldest first."""
+        return [
+            {
+                "index": position,
+                "timestamp": timestamp,
+                "etag": etag,
+                "size": len(self._store[etag][0]),
+            }
+            for position, (timestamp, etag, _) in enumerate(self._entries)
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the history statistics (used by diagnostics)."""
+        return {
+            "frames": len(self._entries),
+            "unique_frames": len(self._store),
+            "memory_bytes": self._bytes,
+            "max_frames": self._max_frames,
+            "max_bytes": self._max_bytes,
+            "oldest": self._entries[0][0] if self._entries else None,
+            "newest": self._entries[-1][0] if self._entries else None,
+        }
+
+    def clear(self) -> None:
+        """Release all the frames."""
+        self._entries.clear()
+        self._store.clear()
+        self._bytes = 0
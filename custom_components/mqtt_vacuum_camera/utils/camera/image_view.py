@@ -0,0 +1,199 @@
+"""
+Camera Image View with conditional GET support.
+Version: 2026.5.0
+Serves the last rendered frame of a camera tagged with a stable content hash
+(ETag) so that polling dashboards get a 304 Not Modified while the map is
+unchanged (e.g. while the robot is docked), the frames of the history and
+the vector (SVG) version of the map.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+from typing import Mapping, Optional
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+
+from custom_components.mqtt_vacuum_camera.common import get_camera_entity
+from custom_components.mqtt_vacuum_camera.const import DOMAIN
+from custom_components.mqtt_vacuum_camera.utils.camera.frame_history import (
+    parse_history_time,
+)
+
+IMAGE_VIEW_URL = f"/api/{DOMAIN}/image/{{entity_id}}"
+HISTORY_VIEW_URL = f"/api/{DOMAIN}/history/{{entity_id}}"
+SVG_VIEW_URL = f"/api/{DOMAIN}/svg/{{entity_id}}"
+
+
+def frame_etag(frame: bytes) -> str:
+    """Return a strong ETag (quoted content hash) for the frame bytes."""
+    return f'"{hashlib.blake2b(frame, digest_size=16).hexdigest()}"'
+
+
+def http_date(timestamp: float) -> str:
+    """Format a POSIX timestamp as an HTTP date."""
+    return formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(
+    headers: Mapping[str, str],
+    etag: Optional[str],
+    last_modified: Optional[float],
+) -> bool:
+    """
+    Evaluate the conditional request headers against the current frame.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2).
+    """
+    if_none_match = headers.get(hdrs.IF_NONE_MATCH)
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: a W/ prefix is still the same representation.
+        candidates |= {tag[2:] for tag in candidates if tag.startswith("W/")}
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = headers.get(hdrs.IF_MODIFIED_SINCE)
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    modified = datetime.fromtimestamp(int(last_modified), timezone.utc)
+    return modified <= since
+
+
+def authorize_camera_request(request: web.Request, camera) -> None:
+    """Apply the same access rules as the Home Assistant camera proxy."""
+    authenticated = (
+        request[KEY_AUTHENTICATED]
+        or request.query.get("token") in camera.access_tokens
+    )
+    if not authenticated:
+        raise web.HTTPUnauthorized()
+    if not camera.is_on:
+        raise web.HTTPServiceUnavailable()
+
+
+class CameraImageView(HomeAssistantView):
+    """Camera image endpoint answering If-None-Match / If-Modified-Since."""
+
+    url = IMAGE_VIEW_URL
+    name = f"api:{DOMAIN}:image"
+    requires_auth = False
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Return the current frame or 304 if the client copy is still valid."""
+        hass = request.app["hass"]
+        camera = get_camera_entity(hass, entity_id)
+        if camera is None:
+            raise web.HTTPNotFound()
+        authorize_camera_request(request, camera)
+
+        frame = await camera.async_camera_image()
+        if frame is None:
+            raise web.HTTPServiceUnavailable()
+
+        etag, last_modified = camera.frame_tag
+        headers = {hdrs.CACHE_CONTROL: "no-cache"}
+        if etag is not None:
+            headers[hdrs.ETAG] = etag
+        if last_modified is not None:
+            headers[hdrs.LAST_MODIFIED] = http_date(last_modified)
+
+        if is_not_modified(request.headers, etag, last_modified):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(
+            body=frame, content_type=camera.frame_content_type, headers=headers
+        )
+
+
+class CameraHistoryView(HomeAssistantView):
+    """Frames of the camera history by index, time or ETag."""
+
+    url = HISTORY_VIEW_URL
+    name = f"api:{DOMAIN}:history"
+    requires_auth = False
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Return a frame of the history, or the history index as JSON."""
+        hass = request.app["hass"]
+        camera = get_camera_entity(hass, entity_id)
+        if camera is None:
+            raise web.HTTPNotFound()
+        authorize_camera_request(request, camera)
+
+        history = camera.features.frame_history
+        query = request.query
+        try:
+            if "etag" in query:
+                etag = query["etag"].strip('"')
+                frame = history.get_by_etag(f'"{etag}"')
+            elif query.get("time"):
+                frame = history.get_by_time(parse_history_time(query["time"]))
+            elif "index" in query:
+                frame = history.get_by_index(int(query["index"]))
+            else:
+                return self.json({"stats": history.stats(), "frames": history.index()})
+        except ValueError as err:
+            raise web.HTTPBadRequest(text=str(err)) from err
+        if frame is None:
+            raise web.HTTPNotFound()
+
+        headers = {
+            hdrs.CACHE_CONTROL: "private, no-cache",
+            hdrs.ETAG: frame.etag,
+            hdrs.LAST_MODIFIED: http_date(frame.timestamp),
+        }
+        if is_not_modified(request.headers, frame.etag, frame.timestamp):
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            body=frame.data, content_type=frame.content_type, headers=headers
+        )
+
+
+def _render_svg(exporter, parsed_json: dict, static_only: bool) -> tuple[bytes, str]:
+    """Render the SVG and its ETag (executor job)."""
+    document = exporter.render(parsed_json, static_only).encode()
+    return document, frame_etag(document)
+
+
+class CameraSvgView(HomeAssistantView):
+    """Vector version of the map rendered from the parsed JSON."""
+
+    url = SVG_VIEW_URL
+    name = f"api:{DOMAIN}:svg"
+    requires_auth = False
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Return the map as SVG (static layers only with ?static=1)."""
+        hass = request.app["hass"]
+        camera = get_camera_entity(hass, entity_id)
+        if camera is None:
+            raise web.HTTPNotFound()
+        authorize_camera_request(request, camera)
+
+        parsed_json = camera.features.last_map
+        if parsed_json is None:
+            raise web.HTTPServiceUnavailable()
+        static_only = request.query.get("static", "").lower() in ("1", "true")
+        document, etag = await hass.async_add_executor_job(
+            _render_svg, camera.features.svg_export, parsed_json, static_only
+        )
+
+        headers = {hdrs.CACHE_CONTROL: "no-cache", hdrs.ETAG: etag}
+        if is_not_modified(request.headers, etag, None):
+            return web.Response(status=304, headers=headers)
+        response = web.Response(
+            body=document, content_type="image/svg+xml", headers=headers
+        )
+        response.enable_compression()
+        return response
@@ -0,0 +1,275 @@
+"""
+Parsed map helpers.
+Version: 2026.5.0
+Normalise the parsed Hypfer and Rand256 JSON into compact, firmware agnostic
+structures (static layers as run-length rows, entities as plain primitives)
+and compute a hash of the static part of the map.
+
+Coordinates are kept in the firmware's own space: layer runs are in map grid
+pixels (multiply by pixel_size for map units) and entities are in map units.
+"""
+
+from __future__ import annotations
+
+from array import array
+import hashlib
+from typing import Any, Iterator, Optional
+
+HYPFER_FORMAT = "hypfer"
+RAND256_FORMAT = "rand256"
+
+# Hypfer entity type -> normalised key
+_HYPFER_POINT_ENTITIES = {
+    "robot_position": "robot",
+    "charger_location": "charger",
+    "go_to_target": "go_to_target",
+}
+_HYPFER_SHAPE_ENTITIES = {
+    "path": "path",
+    "predicted_path": "predicted_path",
+    "active_zone": "active_zones",
+    "no_go_area": "no_go_areas",
+    "no_mop_area": "no_mop_areas",
+    "virtual_wall": "virtual_walls",
+}
+
+ENTITY_KEYS = (
+    "robot",
+    "charger",
+    "go_to_target",
+    "path",
+    "predicted_path",
+    "active_zones",
+    "no_go_areas",
+    "no_mop_areas",
+    "virtual_walls",
+    "obstacles",
+)
+
+
+def map_format(is_rand: bool) -> str:
+    """Return the map format name."""
+    return RAND256_FORMAT if is_rand else HYPFER_FORMAT
+
+
+def get_pixel_size(parsed_json: dict, is_rand: bool) -> int:
+    """Return the size of one grid pixel in map units."""
+    if is_rand:
+        return 50
+    return int(parsed_json.get("pixelSize", 5) or 5)
+
+
+def _point(values: Any, angle: Any = None) -> Optional[dict[str, Any]]:
+    """Return a point dict from a [x, y] sequence."""
+    if not values or len(values) < 2:
+        return None
+    point = {"x": values[0], "y": values[1]}
+    if angle is not None:
+        point["angle"] = angle
+    return point
+
+
+def _flatten(points: Any) -> list:
+    """Flatten [[x, y], ...] or [x, y, ...] into [x, y, ...]."""
+    if not points:
+        return []
+    if isinstance(points[0], (list, tuple)):
+        return [coord for point in points for coord in point]
+    return list(points)
+
+
+def _empty_entities() -> dict[str, Any]:
+    """Return the normalised entities skeleton."""
+    return {
+        "robot": None,
+        "charger": None,
+        "go_to_target": None,
+        "path": [],
+        "predicted_path": [],
+        "active_zones": [],
+        "no_go_areas": [],
+        "no_mop_areas": [],
+        "virtual_walls": [],
+        "obstacles": [],
+    }
+
+
+def _hypfer_entities(parsed_json: dict) -> dict[str, Any]:
+    """Extract the entities from a Hypfer map."""
+    entities = _empty_entities()
+    for entity in parsed_json.get("entities", []) or []:
+        entity_type = entity.get("type")
+        points = entity.get("points") or []
+        meta = entity.get("metaData") or {}
+        if entity_type in _HYPFER_POINT_ENTITIES:
+            key = _HYPFER_POINT_ENTITIES[entity_type]
+            entities[key] = _point(points, meta.get("angle"))
+        elif entity_type in _HYPFER_SHAPE_ENTITIES:
+            entities[_HYPFER_SHAPE_ENTITIES[entity_type]].append(list(points))
+        elif entity_type == "obstacle" and len(points) >= 2:
+            entities["obstacles"].append(
+                {
+                    "x": points[0],
+                    "y": points[1],
+                    "label": meta.get("label"),
+                    "id": meta.get("id"),
+                }
+            )
+    return entities
+
+
+def _rand256_entities(parsed_json: dict) -> dict[str, Any]:
+    """Extract the entities from a Rand256 parsed map."""
+    entities = _empty_entities()
+    entities["robot"] = _point(parsed_json.get("robot"), parsed_json.get("robot_angle"))
+    entities["charger"] = _point(parsed_json.get("charger"))
+    entities["go_to_target"] = _point(parsed_json.get("goto_target"))
+    path = parsed_json.get("path") or {}
+    if isinstance(path, dict) and path.get("points"):
+        entities["path"].append(_flatten(path["points"]))
+    predicted = parsed_json.get("goto_predicted_path") or {}
+    if isinstance(predicted, dict) and predicted.get("points"):
+        entities["predicted_path"].append(_flatten(predicted["points"]))
+    for key, source in (
+        ("active_zones", "currently_cleaned_zones"),
+        ("no_go_areas", "forbidden_zones"),
+        ("no_mop_areas", "forbidden_mop_zones"),
+        ("virtual_walls", "virtual_walls"),
+    ):
+        entities[key] = [_flatten(shape) for shape in parsed_json.get(source) or []]
+    for obstacle in parsed_json.get("obstacles") or []:
+        if isinstance(obstacle, dict) and "x" in obstacle:
+            entities["obstacles"].append(
+                {"x": obstacle["x"], "y": obstacle["y"], "label": obstacle.get("label")}
+            )
+    return entities
+
+
+def extract_entities(parsed_json: dict, is_rand: bool) -> dict[str, Any]:
+    """Return the dynamic part of the map (robot, path, zones, ...)."""
+    if is_rand:
+        return _rand256_entities(parsed_json)
+    return _hypfer_entities(parsed_json)
+
+
+def _indices_to_runs(indices: list, left: int, top: int, width: int) -> list[int]:
+    """Convert Rand256 pixel indices into [x, y, length, ...] runs."""
+    runs: list[int] = []
+    if not indices or width <= 0:
+        return runs
+    run_x = run_y = run_len = -1
+    for index in sorted(indices):
+        x = left + index % width
+        y = top + index // width
+        if y == run_y and x == run_x + run_len:
+            run_len += 1
+            continue
+        if run_len > 0:
+            runs.extend((run_x, run_y, run_len))
+        run_x, run_y, run_len = x, y, 1
+    runs.extend((run_x, run_y, run_len))
+    return runs
+
+
+def _points_to_runs(pixels: list) -> list[int]:
+    """Convert legacy Hypfer [x, y, ...] pixels into runs."""
+    return [
+        value
+        for index in range(0, len(pixels) - 1, 2)
+        for value in (pixels[index], pixels[index + 1], 1)
+    ]
+
+
+def _hypfer_layers(parsed_json: dict) -> Iterator[dict[str, Any]]:
+    """Yield the Hypfer layers as runs."""
+    for layer in parsed_json.get("layers", []) or []:
+        meta = layer.get("metaData") or {}
+        runs = layer.get("compressedPixels")
+        if runs is None:
+            runs = _points_to_runs(layer.get("pixels") or [])
+        yield {
+            "type": layer.get("type"),
+            "segment_id": meta.get("segmentId"),
+            "name": meta.get("name"),
+            "runs": list(runs),
+        }
+
+
+def _rand256_layers(parsed_json: dict) -> Iterator[dict[str, Any]]:
+    """Yield the Rand256 layers as runs."""
+    image = parsed_json.get("image") or {}
+    pixels = image.get("pixels") or {}
+    position = image.get("position") or {}
+    dimensions = image.get("dimensions") or {}
+    left = int(position.get("left", 0) or 0)
+    top = int(position.get("top", 0) or 0)
+    width = int(dimensions.get("width", 0) or 0)
+    for layer_type in ("floor", "walls"):
+        yield {
+            "type": "wall" if layer_type == "walls" else "floor",
+            "segment_id": None,
+            "name": None,
+            "runs": _indices_to_runs(pixels.get(layer_type) or [], left, top, width),
+        }
+    segments = image.get("segments") or {}
+    for segment_id in segments.get("id", []) or []:
+        indices = segments.get(f"pixels_seg_{segment_id}") or []
+        yield {
+            "type": "segment",
+            "segment_id": str(segment_id),
+            "name": None,
+            "runs": _indices_to_runs(indices, left, top, width),
+        }
+
+
+def iter_layers(parsed_json: dict, is_rand: bool) -> Iterator[dict[str, Any]]:
+    """Yield the static layers (floor, walls, segments) as run-length rows."""
+    if is_rand:
+        yield from _rand256_layers(parsed_json)
+    else:
+        yield from _hypfer_layers(parsed_json)
+
+
+def extract_static_layers(parsed_json: dict, is_rand: bool) -> dict[str, Any]:
+    """Return the static part of the map."""
+    if is_rand:
+        dimensions = (parsed_json.get("image") or {}).get("dimensions") or {}
+        size = {"x": dimensions.get("width", 0), "y": dimensions.get("height", 0)}
+    else:
+        size = parsed_json.get("size") or {}
+    return {
+        "format": map_format(is_rand),
+        "pixel_size": get_pixel_size(parsed_json, is_rand),
+        "size": size,
+        "layers": list(iter_layers(parsed_json, is_rand)),
+    }
+
+
+def compute_map_hash(parsed_json: dict, is_rand: bool) -> str:
+    """Hash the static layers of the map, ignoring the moving entities."""
+    digest = hashlib.blake2b(digest_size=12)
+    if is_rand:
+        image = parsed_json.get("image") or {}
+        digest.update(repr(image.get("position")).encode())
+        digest.update(repr(image.get("dimensions")).encode())
+        pixels = image.get("pixels") or {}
+        for key in ("floor", "walls"):
+            digest.update(key.encode())
+            digest.update(array("l", pixels.get(key) or []).tobytes())
+        segments = image.get("segments") or {}
+        for segment_id in segments.get("id", []) or []:
+            digest.update(str(segment_id).encode())
+            digest.update(
+                array("l", segments.get(f"pixels_seg_{segment_id}") or []).tobytes()
+            )
+        return digest.hexdigest()
+
+    digest.update(repr(parsed_json.get("size")).encode())
+    for layer in parsed_json.get("layers", []) or []:
+        meta = layer.get("metaData") or {}
+        digest.update(f"{layer.get('type')}:{meta.get('segmentId')}".encode())
+        runs = layer.get("compressedPixels")
+        if runs is None:
+            runs = layer.get("pixels") or []
+        digest.update(array("l", runs).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,185 @@
+"""
+Map Delta Tracker.
+Version: 2026.5.0
+Keeps the last map state sent to websocket subscribers of a camera and turns
+each new parsed map into a small delta (robot, path tail, charger, go-to
+target, zones, ...). The static layers are only sent when the map hash changes.
+Nothing is computed while the camera has no subscribers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from custom_components.mqtt_vacuum_camera.const import LOGGER
+from custom_components.mqtt_vacuum_camera.utils.camera.map_data import (
+    ENTITY_KEYS,
+    compute_map_hash,
+    extract_entities,
+    extract_static_layers,
+)
+
+MessageCallback = Callable[[dict[str, Any]], None]
+
+
+def path_delta(old: list[list], new: list[list]) -> Optional[dict[str, Any]]:
+    """
+    Return the appended part of the path when new only extends old.
+
+    Paths are lists of flat [x0, y0, x1, y1, ...] polylines. Returns None if
+    the path was replaced (new session, path reset) so the caller sends it all.
+    """
+    if not old or len(new) < len(old):
+        return None
+    index = len(old) - 1
+    last_old, current = old[index], new[index]
+    if len(current) < len(last_old) or (
+        last_old and current[len(last_old) - 2 : len(last_old)] != last_old[-2:]
+    ):
+        return None
+    if any(len(a) != len(b) for a, b in zip(new[:index], old[:index])):
+        return None
+    return {
+        "index": index,
+        "points": current[len(last_old) :],
+        "polylines": new[len(old) :],
+    }
+
+
+def compute_delta(
+    previous: dict[str, Any], current: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the entity keys that changed, with the path as a tail delta."""
+    changed: dict[str, Any] = {}
+    for key in ENTITY_KEYS:
+        old_value, new_value = previous.get(key), current.get(key)
+        if old_value == new_value:
+            continue
+        if key == "path":
+            tail = path_delta(old_value or [], new_value or [])
+            if tail is not None:
+                changed["path_append"] = tail
+                continue
+        changed[key] = new_value
+    return changed
+
+
+def build_state(
+    parsed_json: dict, is_rand: bool, known_hash: Optional[str]
+) -> dict[str, Any]:
+    """Build the full map state (executor job)."""
+    map_hash = compute_map_hash(parsed_json, is_rand)
+    state = {
+        "map_hash": map_hash,
+        "entities": extract_entities(parsed_json, is_rand),
+        "static": None,
+    }
+    if map_hash != known_hash:
+        state["static"] = extract_static_layers(parsed_json, is_rand)
+    return state
+
+
+class MapDeltaTracker:
+    """Per camera map state shared by all websocket subscribers."""
+
+    def __init__(self, file_name: str, is_rand: bool) -> None:
+        self._file_name = file_name
+        self._is_rand = is_rand
+        self._subscribers: set[MessageCallback] = set()
+        self._source: Optional[dict] = None
+        self._state: Optional[dict[str, Any]] = None
+        self._seq = 0
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return True if a websocket client is listening."""
+        return bool(self._subscribers)
+
+    @callback
+    def set_source(self, parsed_json: Optional[dict]) -> None:
+        """Remember the last parsed map (a reference, no copy)."""
+        if parsed_json is not None:
+            self._source = parsed_json
+
+    @callback
+    def async_subscribe(self, message_callback: MessageCallback) -> CALLBACK_TYPE:
+        """Add a subscriber, returning the unsubscribe callback."""
+        self._subscribers.add(message_callback)
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.discard(message_callback)
+            if not self._subscribers:
+                # The state goes stale without subscribers, rebuild on next one.
+                self._state = None
+
+        return _unsubscribe
+
+    async def async_snapshot(
+        self, hass: HomeAssistant, known_hash: Optional[str] = None
+    ) -> Optional[dict[str, Any]]:
+        """Return the full state for a new subscriber."""
+        if self._state is None and self._source is not None:
+            state = await hass.async_add_executor_job(
+                build_state, self._source, self._is_rand, None
+            )
+            # A frame may have been published while we were building.
+            if self._state is None:
+                self._state = state
+        if self._state is None:
+            return None
+        message = {
+            "type": "snapshot",
+            "seq": self._seq,
+            "map_hash": self._state["map_hash"],
+            "entities": self._state["entities"],
+        }
+        if self._state["map_hash"] != known_hash:
+            message["static"] = self._state["static"]
+        return message
+
+    async def async_process(self, hass: HomeAssistant) -> None:
+        """Compute the delta of the current source and push it."""
+        if not self._subscribers or self._source is None:
+            return
+        previous = self._state
+        known_hash = previous["map_hash"] if previous else None
+        try:
+            state = await hass.async_add_executor_job(
+                build_state, self._source, self._is_rand, known_hash
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("%s: Unable to compute map delta: %s", self._file_name, err)
+            return
+        if self._state is not previous or not self._subscribers:
+            return
+        if state["static"] is None and previous is not None:
+            state["static"] = previous["static"]
+
+        message: dict[str, Any] = {"type": "delta", "map_hash": state["map_hash"]}
+        if previous is None or state["map_hash"] != known_hash:
+            message["static"] = state["static"]
+            message["entities"] = state["entities"]
+        else:
+            changed = compute_delta(previous["entities"], state["entities"])
+            if not changed:
+                return
+            message["changed"] = changed
+
+        self._state = state
+        self._seq += 1
+        message["seq"] = self._seq
+        self._publish(message)
+
+    @callback
+    def _publish(self, message: dict[str, Any]) -> None:
+        """Send the message to every subscriber."""
+        for message_callback in list(self._subscribers):
+            try:
+                message_callback(message)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.warning(
+                    "%s: Map delta subscriber failed: %s", self._file_name, err
+                )
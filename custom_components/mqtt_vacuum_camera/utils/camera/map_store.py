@@ -0,0 +1,232 @@
+"""
+Map Archive.
+Version: 2026.5.0
+Archive of the last parsed map of each floor under
+.storage/valetudo_camera/map_archive/<vacuum>, so a restart or a floor switch
+renders a real map right away, without waiting for the robot or parsing.
+
+Each floor is one binary record: a small header and the parsed map as compact
+JSON compressed with zlib. An index file maps the floors to their records
+(O(1) lookup). Records and index are written atomically in an executor job,
+in the background. The last_map files of the earlier format are removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import shutil
+import struct
+import time
+from typing import Any, Optional
+import zlib
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from custom_components.mqtt_vacuum_camera.const import (
+    CAMERA_STORAGE,
+    LOGGER,
+    NOT_STREAMING_STATES,
+)
+from custom_components.mqtt_vacuum_camera.utils.files_operations import write_atomic
+
+MAP_ARCHIVE_FOLDER = "map_archive"
+MAP_ARCHIVE_INDEX = "index.json"
+# Raw payloads stored by the earlier format, not read anymore.
+LEGACY_MAP_FOLDER = "last_map"
+# While the robot is working the map changes every few seconds.
+LAST_MAP_SAVE_INTERVAL_S = 300.0
+# Record header: magic, format version, data type, reserved.
+RECORD_HEADER = struct.Struct("<4sBBH")
+RECORD_MAGIC = b"MVCA"
+RECORD_VERSION = 1
+DATA_TYPES = ("Hypfer", "Rand256")
+# Level 3: most of the ratio of level 9 for a fraction of the time.
+COMPRESSION_LEVEL = 3
+
+
+def _json_default(value: Any) -> Any:
+    """Serialise the containers of the parsed maps that are not JSON types."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode_map(parsed_json: dict) -> bytes:
+    """Return the compact JSON of a parsed map (a snapshot of it)."""
+    return json.dumps(
+        parsed_json, separators=(",", ":"), default=_json_default
+    ).encode()
+
+
+def encode_record(parsed_json: dict, data_type: str) -> bytes:
+    """Return the binary record of a parsed map."""
+    return pack_record(encode_map(parsed_json), data_type)
+
+
+def pack_record(body: bytes, data_type: str) -> bytes:
+    """Return the binary record of the JSON of a parsed map."""
+    header = RECORD_HEADER.pack(
+        RECORD_MAGIC, RECORD_VERSION, DATA_TYPES.index(data_type), 0
+    )
+    return header + zlib.compress(body, COMPRESSION_LEVEL)
+
+
+def decode_record(data: bytes) -> tuple[dict, str]:
+    """Return the (parsed map, data type) of a binary record."""
+    magic, version, data_type, _ = RECORD_HEADER.unpack_from(data)
+    if magic != RECORD_MAGIC or version != RECORD_VERSION:
+        raise ValueError("not a map record")
+    body = zlib.decompress(memoryview(data)[RECORD_HEADER.size :])
+    return json.loads(body), DATA_TYPES[data_type]
+
+
+def read_record(path: Path) -> Optional[tuple[dict, str]]:
+    """Read a stored map, None if missing or invalid."""
+    try:
+        return decode_record(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, IndexError, struct.error, zlib.error) as err:
+        LOGGER.debug("Ignoring the stored map %s: %s", path.name, err)
+        return None
+
+
+def read_index(path: Path) -> dict[str, dict[str, Any]]:
+    """Read the floors of the index, empty if missing or invalid."""
+    try:
+        floors = json.loads(path.read_bytes())["floors"]
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as err:
+        LOGGER.debug("Ignoring the map archive index %s: %s", path, err)
+        return {}
+    return floors if isinstance(floors, dict) else {}
+
+
+def load_index(folder: Path) -> dict[str, dict[str, Any]]:
+    """Remove the legacy last_map folder and read the index (executor)."""
+    legacy = folder.parents[1] / LEGACY_MAP_FOLDER
+    if legacy.is_dir():
+        shutil.rmtree(legacy, ignore_errors=True)
+        LOGGER.debug("Removed the legacy stored maps in %s", legacy)
+    return read_index(folder / MAP_ARCHIVE_INDEX)
+
+
+def _record_name(floor: str) -> str:
+    """Return the record file of a floor (safe file name)."""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in floor) + ".map"
+
+
+class MapArchive:
+    """Last parsed map of each floor of a vacuum, persisted with an index."""
+
+    def __init__(self, hass: HomeAssistant, file_name: str) -> None:
+        self._hass = hass
+        self._file_name = file_name
+        self._folder = Path(
+            hass.config.path(STORAGE_DIR, CAMERA_STORAGE, MAP_ARCHIVE_FOLDER, file_name)
+        )
+        self._index: Optional[dict[str, dict[str, Any]]] = None
+        self._map: Optional[dict] = None
+        self._data_type: Optional[str] = None
+        self._saved: Optional[dict] = None
+        self._saved_at = 0.0
+        self._save_task: Optional[asyncio.Task] = None
+
+    async def _async_index(self) -> dict[str, dict[str, Any]]:
+        """Return the index, read once."""
+        if self._index is None:
+            self._index = await self._hass.async_add_executor_job(
+                load_index, self._folder
+            )
+        return self._index
+
+    def remember(self, parsed_json: Optional[dict], data_type: str) -> None:
+        """Keep a reference to the last parsed map (no copy)."""
+        if parsed_json and data_type in DATA_TYPES:
+            self._map, self._data_type = parsed_json, data_type
+
+    def forget(self) -> None:
+        """Drop the last map, it belongs to the previous floor."""
+        self._map = None
+
+    def mark_saved(self, parsed_json: dict) -> None:
+        """Mark a map loaded from the archive as already saved."""
+        self._saved = parsed_json
+
+    async def async_save_if_needed(
+        self, floor: str, vacuum_state: str, map_name: Optional[str] = None
+    ) -> None:
+        """Persist the last map when the robot stops or every few minutes."""
+        parsed_json = self._map
+        if parsed_json is None or parsed_json is self._saved:
+            return
+        if self._save_task is not None and not self._save_task.done():
+            return
+        now = time.monotonic()
+        if (
+            vacuum_state not in NOT_STREAMING_STATES
+            and now - self._saved_at < LAST_MAP_SAVE_INTERVAL_S
+        ):
+            return
+        self._saved, self._saved_at = parsed_json, now
+        try:
+            # Serialised before the next render can change the parsed map.
+            body = encode_map(parsed_json)
+        except (TypeError, ValueError, RuntimeError) as err:
+            LOGGER.warning("%s: Unable to store the last map: %s", self._file_name, err)
+            return
+        index = await self._async_index()
+        self._save_task = self._hass.async_create_background_task(
+            self._async_write(floor, body, self._data_type, map_name, index),
+            name=f"{self._file_name}_map_archive",
+        )
+
+    async def _async_write(
+        self,
+        floor: str,
+        body: bytes,
+        data_type: str,
+        map_name: Optional[str],
+        index: dict[str, dict[str, Any]],
+    ) -> None:
+        """Write the record of the floor then the index."""
+        entry = {
+            "file": _record_name(floor),
+            "data_type": data_type,
+            "map_name": map_name or floor,
+            "saved_at": time.time(),
+        }
+        try:
+            entry["size"] = await self._hass.async_add_executor_job(
+                self._write_record, entry["file"], body, data_type
+            )
+            floors = {**index, floor: entry}
+            await self._hass.async_add_executor_job(
+                write_atomic,
+                self._folder / MAP_ARCHIVE_INDEX,
+                json.dumps({"version": RECORD_VERSION, "floors": floors}).encode(),
+            )
+            self._index = floors
+        except (OSError, TypeError, ValueError, RuntimeError) as err:
+            LOGGER.warning("%s: Unable to store the last map: %s", self._file_name, err)
+
+    def _write_record(self, record: str, body: bytes, data_type: str) -> int:
+        """Compress and write a record (executor), return its size."""
+        data = pack_record(body, data_type)
+        write_atomic(self._folder / record, data)
+        return len(data)
+
+    async def async_load(self, floor: str) -> Optional[tuple[dict, str]]:
+        """Return the stored (parsed map, data_type) of the floor."""
+        entry = (await self._async_index()).get(floor)
+        if entry is None:
+            return None
+        return await self._hass.async_add_executor_job(
+            read_record, self._folder / entry["file"]
+        )
@@ -0,0 +1,191 @@
+"""
+Obstacle Image Cache.
+Version: 2026.5.0
+Size bounded LRU of the obstacle images, in memory and on disk under
+.storage/valetudo_camera/obstacles/<vacuum>. Each obstacle (keyed by its
+image link) has an "original" variant (as downloaded from the robot) and
+resized/encoded variants ready to be shown by the camera.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import re
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from custom_components.mqtt_vacuum_camera.const import (
+    CAMERA_STORAGE,
+    LOGGER,
+    OBSTACLE_CACHE_DISK_BYTES,
+    OBSTACLE_CACHE_MEMORY_BYTES,
+)
+from custom_components.mqtt_vacuum_camera.utils.files_operations import write_atomic
+
+ORIGINAL_VARIANT = "original"
+OBSTACLES_FOLDER = "obstacles"
+
+
+def obstacle_key(obstacle: dict[str, Any]) -> Optional[str]:
+    """Return the cache key of an obstacle (hash of its image link or id)."""
+    source = obstacle.get("link") or obstacle.get("id")
+    if not source:
+        return None
+    return hashlib.blake2b(str(source).encode(), digest_size=10).hexdigest()
+
+
+def view_variant(width: int, height: int, aspect_ratio: Any) -> str:
+    """Return the variant name of an image resized for the camera."""
+    aspect = re.sub(r"[^0-9A-Za-z]+", "-", str(aspect_ratio))
+    return f"view_{width}x{height}_{aspect}"
+
+
+def _scan_folder(folder: Path) -> list[tuple[str, int]]:
+    """List the cached files, least recently used first."""
+    if not folder.is_dir():
+        return []
+    entries = []
+    for path in folder.iterdir():
+        if path.is_file() and not path.name.startswith("."):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+    return [(name, size) for _, name, size in sorted(entries)]
+
+
+def _read_and_touch(path: Path) -> Optional[bytes]:
+    """Read a cached file and mark it as recently used."""
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+    except OSError:
+        return None
+
+
+class ObstacleImageCache:
+    """Two level (memory + disk) LRU of the obstacle images of one vacuum."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        file_name: str,
+        memory_bytes: int = OBSTACLE_CACHE_MEMORY_BYTES,
+        disk_bytes: int = OBSTACLE_CACHE_DISK_BYTES,
+    ) -> None:
+        self._hass = hass
+        self._folder = Path(
+            hass.config.path(STORAGE_DIR, CAMERA_STORAGE, OBSTACLES_FOLDER, file_name)
+        )
+        self._memory_limit = memory_bytes
+        self._disk_limit = disk_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk: Optional[OrderedDict[str, int]] = None
+        self._disk_size = 0
+        self._disk_lock = asyncio.Lock()
+
+    @staticmethod
+    def _name(key: str, variant: str) -> str:
+        return f"{key}_{variant}"
+
+    def _remember(self, name: str, data: bytes) -> None:
+        """Add to the memory LRU, evicting the least recently used."""
+        previous = self._memory.pop(name, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        if len(data) > self._memory_limit:
+            return
+        self._memory[name] = data
+        self._memory_size += len(data)
+        while self._memory_size > self._memory_limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    async def _async_disk_index(self) -> OrderedDict[str, int]:
+        """Load the disk index once."""
+        if self._disk is None:
+            entries = await self._hass.async_add_executor_job(
+                _scan_folder, self._folder
+            )
+            self._disk = OrderedDict(entries)
+            self._disk_size = sum(self._disk.values())
+        return self._disk
+
+    def contains(self, key: str, variant: str = ORIGINAL_VARIANT) -> bool:
+        """Return True if the image is cached (memory or disk index)."""
+        name = self._name(key, variant)
+        return name in self._memory or bool(self._disk and name in self._disk)
+
+    async def async_get(
+        self, key: str, variant: str = ORIGINAL_VARIANT
+    ) -> Optional[bytes]:
+        """Return the cached image, from memory or disk."""
+        name = self._name(key, variant)
+        data = self._memory.get(name)
+        if data is not None:
+            self._memory.move_to_end(name)
+            return data
+        async with self._disk_lock:
+            disk = await self._async_disk_index()
+            if name not in disk:
+                return None
+            data = await self._hass.async_add_executor_job(
+                _read_and_touch, self._folder / name
+            )
+            if data is None:
+                self._disk_size -= disk.pop(name)
+                return None
+            disk.move_to_end(name)
+        self._remember(name, data)
+        return data
+
+    async def async_put(
+        self, key: str, data: bytes, variant: str = ORIGINAL_VARIANT
+    ) -> None:
+        """Store an image in memory and on disk."""
+        if not data:
+            return
+        name = self._name(key, variant)
+        self._remember(name, data)
+        async with self._disk_lock:
+            disk = await self._async_disk_index()
+            evicted = []
+            self._disk_size += len(data) - disk.pop(name, 0)
+            disk[name] = len(data)
+            while self._disk_size > self._disk_limit and len(disk) > 1:
+                old_name, size = disk.popitem(last=False)
+                self._disk_size -= size
+                evicted.append(old_name)
+            try:
+                await self._hass.async_add_executor_job(
+                    self._write_and_evict, name, data, evicted
+                )
+            except OSError as err:
+                LOGGER.warning("Unable to cache the obstacle image: %s", err)
+                self._disk_size -= disk.pop(name, 0)
+
+    def _write_and_evict(self, name: str, data: bytes, evicted: list[str]) -> None:
+        """Write the new file and remove the evicted ones (executor job)."""
+        write_atomic(self._folder / name, data)
+        for old_name in evicted:
+            (self._folder / old_name).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache statistics (used by diagnostics)."""
+        return {
+            "memory_items": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "disk_items": len(self._disk) if self._disk is not None else None,
+            "disk_bytes": self._disk_size if self._disk is not None else None,
+        }
+
+    def clear_memory(self) -> None:
+        """Release the memory cache."""
+        self._memory.clear()
+        self._memory_size = 0
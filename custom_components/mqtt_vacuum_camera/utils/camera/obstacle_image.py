@@ -0,0 +1,81 @@
+"""
+Obstacle Image Processing.
+Version: 2026.5.0
+Open, downscale, pad to the camera aspect ratio and encode an obstacle image
+in a single synchronous job (run on the camera processing pool).
+
+JPEG images are decoded directly near the target size (draft mode) and the
+resize uses a reducing gap, so the full resolution photo is never decoded.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+import math
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+# Lanczos quality with a cheap first reduction (Pillow reducing_gap).
+REDUCING_GAP = 2.0
+
+
+def parse_aspect_ratio(aspect_ratio: Optional[str]) -> Optional[tuple[int, int]]:
+    """Return the (width, height) factors of an option like "16, 9"."""
+    if not aspect_ratio or aspect_ratio == "None":
+        return None
+    try:
+        width, height = (int(part) for part in str(aspect_ratio).split(","))
+    except ValueError:
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return width, height
+
+
+def padded_size(
+    size: tuple[int, int], ref_size: tuple[int, int], ratio: tuple[int, int]
+) -> tuple[int, int]:
+    """Return the size of the image padded to the aspect ratio (as the map)."""
+    width, height = size
+    new_aspect_ratio = ratio[0] / ratio[1]
+    if ref_size[0] / ref_size[1] > new_aspect_ratio:
+        return int(height * new_aspect_ratio), height
+    return width, int(width / new_aspect_ratio)
+
+
+def fitted_size(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """Return the size of an image scaled down (aspect kept) to fit in box."""
+    scale = min(box[0] / size[0], box[1] / size[1], 1.0)
+    return max(1, math.ceil(size[0] * scale)), max(1, math.ceil(size[1] * scale))
+
+
+def render_obstacle_image(
+    image_data: bytes,
+    width: int,
+    height: int,
+    aspect_ratio: Optional[str],
+) -> bytes:
+    """
+    Return the PNG of the obstacle image fitted in width x height.
+
+    When width or height is not known yet (no map rendered) the image is
+    only converted to PNG.
+    """
+    with Image.open(BytesIO(image_data)) as source:
+        target = None
+        if width > 0 and height > 0:
+            target = fitted_size(source.size, (width, height))
+            # Only JPEG supports draft: decodes at 1/2, 1/4 or 1/8 scale.
+            source.draft("RGB", target)
+        image = source.convert("RGB")
+    if target is not None:
+        image.thumbnail(target, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    ratio = parse_aspect_ratio(aspect_ratio)
+    if ratio is not None and width > 0 and height > 0:
+        padded = padded_size(image.size, (width, height), ratio)
+        if padded != image.size and min(padded) > 0:
+            image = ImageOps.pad(image, padded)
+    buffered = BytesIO()
+    image.save(buffered, format="PNG")
+    return buffered.getvalue()
@@ -0,0 +1,107 @@
+"""
+Obstacle Spatial Index.
+Version: 2026.5.0
+Uniform grid over the obstacle points (image coordinates) built once per
+obstacles list, with nearest within radius, k-nearest and batch queries.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import math
+from typing import Any, Iterable, Optional
+
+# Built indexes kept for the last obstacles lists (one per camera in practice).
+INDEX_CACHE_SIZE = 8
+
+
+class ObstacleIndex:
+    """Grid index of the obstacles, cells of cell_size pixels."""
+
+    _cache: OrderedDict[tuple[int, int, float], tuple[list, ObstacleIndex]] = (
+        OrderedDict()
+    )
+
+    def __init__(self, obstacles: list[dict[str, Any]], cell_size: float) -> None:
+        self._obstacles = obstacles
+        self._cell_size = max(1.0, float(cell_size))
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._points: list[tuple[float, float]] = []
+        for position, obstacle in enumerate(obstacles):
+            point = obstacle["point"]
+            x, y = float(point["x"]), float(point["y"])
+            self._points.append((x, y))
+            self._cells.setdefault(self._cell(x, y), []).append(position)
+
+    @classmethod
+    def for_obstacles(
+        cls, obstacles: list[dict[str, Any]], cell_size: float
+    ) -> ObstacleIndex:
+        """Return the index of the obstacles list, built once per list."""
+        key = (id(obstacles), len(obstacles), float(cell_size))
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] is obstacles:
+            cls._cache.move_to_end(key)
+            return cached[1]
+        index = cls(obstacles, cell_size)
+        cls._cache[key] = (obstacles, index)
+        while len(cls._cache) > INDEX_CACHE_SIZE:
+            cls._cache.popitem(last=False)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def _ring(self, center: tuple[int, int], ring: int) -> Iterable[int]:
+        """Yield the obstacles of the cells at Chebyshev distance ring."""
+        cx, cy = center
+        for gx in range(cx - ring, cx + ring + 1):
+            for gy in range(cy - ring, cy + ring + 1):
+                if max(abs(gx - cx), abs(gy - cy)) == ring:
+                    yield from self._cells.get((gx, gy), ())
+
+    def k_nearest(
+        self, x: float, y: float, k: int = 1, radius: Optional[float] = None
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """Return up to k (distance, obstacle) closer than radius, nearest first."""
+        if k <= 0 or not self._points:
+            return []
+        center = self._cell(x, y)
+        max_ring = (
+            math.ceil(radius / self._cell_size)
+            if radius is not None
+            else max(
+                max(abs(gx - center[0]), abs(gy - center[1]))
+                for gx, gy in self._cells
+            )
+        )
+        found: list[tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            for position in self._ring(center, ring):
+                px, py = self._points[position]
+                distance = math.hypot(x - px, y - py)
+                if radius is None or distance < radius:
+                    found.append((distance, position))
+            found.sort()
+            # Every point in the next rings is at least ring * cell_size away.
+            if len(found) >= k and found[k - 1][0] <= ring * self._cell_size:
+                break
+        return [
+            (distance, self._obstacles[position]) for distance, position in found[:k]
+        ]
+
+    def nearest(
+        self, x: float, y: float, radius: float
+    ) -> Optional[dict[str, Any]]:
+        """Return the nearest obstacle closer than radius, or None."""
+        result = self.k_nearest(x, y, 1, radius)
+        return result[0][1] if result else None
+
+    def nearest_many(
+        self, points: Iterable[tuple[float, float]], radius: float
+    ) -> list[Optional[dict[str, Any]]]:
+        """Batch hit-test: the nearest obstacle for each point."""
+        return [self.nearest(x, y, radius) for x, y in points]
@@ -1,6 +1,6 @@
 """
 Obstacle View Manager
-Version: 2025.11.0
+Version: 2026.5.0
 This module handles obstacle detection, image download, and rendering
 for vacuums with ObstacleImagesCapability (e.g., Dreame vacuums).
 """
@@ -9,21 +9,34 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-import math
 from typing import Any, Callable, Optional
 
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.debounce import Debouncer
 from valetudo_map_parser.config.shared import CameraShared
-from valetudo_map_parser.config.utils import ResizeParams, async_resize_image
 
 from custom_components.mqtt_vacuum_camera.const import (
     DOWNLOAD_TIMEOUT,
     LOGGER,
+    OBSTACLE_PREFETCH_CONCURRENCY,
+    OBSTACLE_PREFETCH_MAX_ITEMS,
     OBSTACLE_SEARCH_RADIUS_MULTIPLIER,
     CameraModes,
 )
+from custom_components.mqtt_vacuum_camera.utils.camera.contact_sheet import (
+    CONTACT_SHEET_MAX_ITEMS,
+    contact_sheet_signature,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_cache import (
+    ORIGINAL_VARIANT,
+    ObstacleImageCache,
+    obstacle_key,
+    view_variant,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_index import (
+    ObstacleIndex,
+)
 
 
 @dataclass
@@ -34,8 +47,8 @@ class ObstacleViewContext:
     shared: CameraShared
     file_name: str
     download_image_func: Callable
-    open_image_func: Callable
-    pil_to_bytes_func: Callable
+    process_image_func: Callable
+    contact_sheet_func: Callable
 
 
 class ObstacleView:
@@ -45,7 +58,7 @@ class ObstacleView:
     This class handles:
     - Event listening for obstacle coordinate clicks
     - Finding nearest obstacles to clicked coordinates
-    - Downloading obstacle images from the vacuum
+    - Downloading obstacle images from the vacuum (prefetched and cached)
     - Processing and resizing obstacle images
     - Managing camera mode transitions between MAP_VIEW and OBSTACLE_VIEW
     """
@@ -62,8 +75,8 @@ class ObstacleView:
         self._file_name = context.file_name
         self._entity_id: Optional[str] = None
         self._download_image = context.download_image_func
-        self._open_image = context.open_image_func
-        self._pil_to_bytes = context.pil_to_bytes_func
+        self._process_image = context.process_image_func
+        self._render_contact_sheet = context.contact_sheet_func
 
         # State management
         self._obstacle_image: Optional[bytes] = None
@@ -73,6 +86,13 @@ class ObstacleView:
         # Event listener handles
         self._event_listener: Optional[Callable[[], None]] = None
 
+        # Obstacle images cache and background prefetch
+        self._cache = ObstacleImageCache(self.hass, self._file_name)
+        self._prefetch_semaphore = asyncio.Semaphore(OBSTACLE_PREFETCH_CONCURRENCY)
+        self._prefetch_source: Optional[list] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._contact_sheet: Optional[tuple[tuple, bytes]] = None
+
         # Initialize debouncer for obstacle view events
         self._debouncer = Debouncer(
             self.hass,
@@ -105,6 +125,12 @@ class ObstacleView:
         if self._debouncer:
             self._debouncer.async_shutdown()
 
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = None
+        self._cache.clear_memory()
+        self._contact_sheet = None
+
         # Clear state
         self._obstacle_image = None
         self._processing = False
@@ -156,30 +182,169 @@ class ObstacleView:
             )
             return None
 
-        nearest_obstacle = None
-        min_distance: float = float(
-            max(1, round(OBSTACLE_SEARCH_RADIUS_MULTIPLIER * (width / height)))
-        )
+        radius = ObstacleView.search_radius(width, height)
 
         LOGGER.debug(
             "Finding in the nearest %d pixels obstacle to coordinates: %d, %d",
-            min_distance,
+            radius,
             x,
             y,
         )
 
-        for obstacle in obstacles:
-            obstacle_point = obstacle["point"]
-            obstacle_x = obstacle_point["x"]
-            obstacle_y = obstacle_point["y"]
+        index = ObstacleIndex.for_obstacles(obstacles, radius)
+        return index.nearest(x, y, radius)
+
+    @staticmethod
+    def search_radius(width: int, height: int) -> float:
+        """Return the click search radius in image pixels."""
+        return float(
+            max(1, round(OBSTACLE_SEARCH_RADIUS_MULTIPLIER * (width / height)))
+        )
+
+    def hit_test(
+        self, points: list[tuple[float, float]]
+    ) -> list[Optional[dict[str, Any]]]:
+        """Return the nearest obstacle (or None) of each point, in one pass."""
+        width = self._shared.image_ref_width
+        height = self._shared.image_ref_height
+        obstacles = self._shared.obstacles_data
+        if not obstacles or width <= 0 or height <= 0:
+            return [None] * len(points)
+        radius = self.search_radius(width, height)
+        return ObstacleIndex.for_obstacles(obstacles, radius).nearest_many(
+            points, radius
+        )
+
+    @property
+    def cache(self) -> ObstacleImageCache:
+        """Return the obstacle images cache."""
+        return self._cache
+
+    @callback
+    def schedule_prefetch(self) -> None:
+        """Prefetch in background the images of new obstacles, if any."""
+        obstacles = self._shared.obstacles_data
+        if not obstacles or obstacles is self._prefetch_source:
+            return
+        if self._prefetch_task and not self._prefetch_task.done():
+            return  # The next update picks up the new list.
+        self._prefetch_source = obstacles
+        pending = [
+            obstacle
+            for obstacle in obstacles[:OBSTACLE_PREFETCH_MAX_ITEMS]
+            if obstacle.get("link")
+            and not self._cache.contains(obstacle_key(obstacle))
+        ]
+        if pending:
+            self._prefetch_task = self.hass.async_create_background_task(
+                self._async_prefetch(pending),
+                name=f"{self._file_name}_obstacles_prefetch",
+            )
+
+    async def _async_prefetch(self, obstacles: list[dict[str, Any]]) -> None:
+        """Download the original images, a few at a time."""
+        results = await asyncio.gather(
+            *(self._async_prefetch_one(obstacle) for obstacle in obstacles),
+            return_exceptions=True,
+        )
+        LOGGER.debug(
+            "%s: Prefetched %d of %d obstacle images",
+            self._file_name,
+            sum(result is True for result in results),
+            len(obstacles),
+        )
+
+    async def _async_prefetch_one(self, obstacle: dict[str, Any]) -> bool:
+        """Download and cache one original image."""
+        return await self._async_original(obstacle) is not None
+
+    async def _async_original(self, obstacle: dict[str, Any]) -> Optional[bytes]:
+        """Return the original image, from the cache or downloaded."""
+        key = obstacle_key(obstacle)
+        async with self._prefetch_semaphore:
+            image_data = await self._cache.async_get(key)
+            if image_data is not None:
+                return image_data
+            image_data = await self._async_download(obstacle["link"])
+        if image_data is not None:
+            await self._cache.async_put(key, image_data)
+        return image_data
+
+    async def async_show_contact_sheet(self) -> Optional[list[dict[str, Any]]]:
+        """
+        Show the contact sheet of the obstacles on the camera.
 
-            distance = math.hypot(x - obstacle_x, y - obstacle_y)
+        The sheet is rendered once and reused until the obstacles change.
+        The next obstacle_view request returns to the map, as for an obstacle.
 
-            if distance < min_distance:
-                min_distance = distance
-                nearest_obstacle = obstacle
+        Returns:
+            The obstacles in the order of the sheet, None if nothing to show
+        """
+        if self._shared.camera_mode not in (
+            CameraModes.MAP_VIEW,
+            CameraModes.OBSTACLE_VIEW,
+        ):
+            return None
+        obstacles = [
+            obstacle
+            for obstacle in self._shared.obstacles_data or []
+            if obstacle.get("link")
+        ][:CONTACT_SHEET_MAX_ITEMS]
+        if not obstacles:
+            return None
 
-        return nearest_obstacle
+        signature = contact_sheet_signature(obstacles)
+        if self._contact_sheet is None or self._contact_sheet[0] != signature:
+            await self._set_camera_mode(
+                CameraModes.OBSTACLE_DOWNLOAD, "Building the obstacles contact sheet"
+            )
+            images = await asyncio.gather(
+                *(self._async_original(obstacle) for obstacle in obstacles)
+            )
+            items = [
+                (str(obstacle.get("label", "obstacle")), image)
+                for obstacle, image in zip(obstacles, images)
+            ]
+            try:
+                self._contact_sheet = (
+                    signature,
+                    await self._render_contact_sheet(items),
+                )
+            except (OSError, RuntimeError, ValueError) as err:
+                LOGGER.warning(
+                    "%s: Unable to render the obstacles contact sheet: %r",
+                    self._file_name,
+                    err,
+                )
+                await self._set_camera_mode(
+                    CameraModes.MAP_VIEW, "Error rendering the contact sheet"
+                )
+                return None
+
+        await self._set_camera_mode(
+            CameraModes.OBSTACLE_VIEW, "Obstacles contact sheet"
+        )
+        self._obstacle_image = self._contact_sheet[1]
+        return obstacles
+
+    async def _async_download(self, link: str) -> Optional[bytes]:
+        """Download an obstacle image, None on timeout or error."""
+        try:
+            return await asyncio.wait_for(
+                fut=self._download_image(link, DOWNLOAD_TIMEOUT),
+                timeout=(DOWNLOAD_TIMEOUT + 1),  # dead man switch
+            )
+        except asyncio.TimeoutError:
+            LOGGER.warning("%s: Image download timed out", self._file_name)
+            return None
+
+    def _view_variant(self) -> str:
+        """Return the cache variant of the images resized for the camera."""
+        return view_variant(
+            self._shared.image_ref_width,
+            self._shared.image_ref_height,
+            self._shared.image_aspect_ratio,
+        )
 
     def _validate_obstacle_request(self, event: Event) -> bool:
         """
@@ -345,34 +510,37 @@ class ObstacleView:
         """
         Download and process obstacle image.
 
+        The resized image, or else the original one, is taken from the cache
+        when available (usually prefetched when the obstacle appeared).
+
         Args:
             obstacle: Obstacle data dictionary
 
         Returns:
             The processed obstacle image bytes or None
         """
-        # Download the obstacle image
-        await self._set_camera_mode(
-            CameraModes.OBSTACLE_DOWNLOAD,
-            f"Downloading image: {obstacle['link']}",
-        )
-
-        try:
-            image_data = await asyncio.wait_for(
-                fut=self._download_image(obstacle["link"], DOWNLOAD_TIMEOUT),
-                timeout=(DOWNLOAD_TIMEOUT + 1),  # dead man switch
-            )
-        except asyncio.TimeoutError:
-            LOGGER.warning("%s: Image download timed out", self._file_name)
+        key = obstacle_key(obstacle)
+        cached_view = await self._cache.async_get(key, self._view_variant())
+        if cached_view is not None:
             await self._set_camera_mode(
-                CameraModes.MAP_VIEW, "Obstacle image download timed out"
+                CameraModes.OBSTACLE_VIEW, "Obstacle image from cache"
             )
-            return None
+            self._obstacle_image = cached_view
+            return cached_view
 
+        image_data = await self._cache.async_get(key, ORIGINAL_VARIANT)
         if image_data is None:
-            LOGGER.debug("%s: No image downloaded", self._file_name)
-            await self._set_camera_mode(CameraModes.MAP_VIEW, "No image downloaded")
-            return None
+            # Download the obstacle image
+            await self._set_camera_mode(
+                CameraModes.OBSTACLE_DOWNLOAD,
+                f"Downloading image: {obstacle['link']}",
+            )
+            image_data = await self._async_download(obstacle["link"])
+            if image_data is None:
+                LOGGER.debug("%s: No image downloaded", self._file_name)
+                await self._set_camera_mode(CameraModes.MAP_VIEW, "No image downloaded")
+                return None
+            await self._cache.async_put(key, image_data, ORIGINAL_VARIANT)
 
         # Process the downloaded image
         return await self._process_obstacle_image(image_data, obstacle)
@@ -383,7 +551,7 @@ class ObstacleView:
         obstacle: dict[str, Any],
     ) -> Optional[bytes]:
         """
-        Process and resize the downloaded obstacle image.
+        Resize and encode the downloaded obstacle image.
 
         Args:
             image_data: Raw image data bytes
@@ -397,43 +565,27 @@ class ObstacleView:
         )
 
         try:
-            # Open the downloaded image with PIL
-            pil_img = await self._open_image(image_data)
-
-            # Resize the image if aspect ratio is provided
-            aspect_ratio = self._shared.image_aspect_ratio
-            if aspect_ratio != "None":
-                resize_data = ResizeParams(
-                    pil_img=pil_img,
-                    width=self._shared.image_ref_width,
-                    height=self._shared.image_ref_height,
-                    aspect_ratio=aspect_ratio,
-                    crop_size=[],
-                    is_rand=False,
-                    offset_func=None,
-                )
-
-                resize_result = await async_resize_image(params=resize_data)
-
-                # Handle both tuple and direct image returns
-                image = (
-                    resize_result[0]
-                    if isinstance(resize_result, tuple)
-                    else resize_result
-                )
-            else:
-                # Use original image if no aspect ratio is set
-                image = pil_img
-
-            # Convert to bytes
-            self._obstacle_image = await self._pil_to_bytes(
-                image,
-                image_id=obstacle.get("label", "obstacle"),
+            # Open, downscale (decode near the size of the map), pad to the
+            # aspect ratio and encode in one job of the camera pool.
+            self._obstacle_image = await self._process_image(
+                image_data,
+                self._shared.image_ref_width,
+                self._shared.image_ref_height,
+                self._shared.image_aspect_ratio,
             )
+            LOGGER.debug(
+                "%s: Output Image: %s.",
+                self._file_name,
+                obstacle.get("label", "obstacle"),
+            )
+            if self._obstacle_image:
+                await self._cache.async_put(
+                    obstacle_key(obstacle), self._obstacle_image, self._view_variant()
+                )
 
             return self._obstacle_image
 
-        except HomeAssistantError as err:
+        except (HomeAssistantError, OSError, RuntimeError, ValueError) as err:
             LOGGER.warning(
                 "%s: Unexpected Error processing image: %r",
                 self._file_name,
@@ -0,0 +1,195 @@
+"""
+Room Index.
+Version: 2026.5.0
+Raster of the rooms (segment of each cell, at a reduced resolution) built once
+per map from the segment layers. The room at a position (robot, go-to target,
+service coordinates) is then a single array read.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Optional
+
+from custom_components.mqtt_vacuum_camera.utils.camera.map_data import (
+    compute_map_hash,
+    get_pixel_size,
+    iter_layers,
+)
+
+ROOM_INDEX_CELL_PX = 2  # grid pixels per cell: 10 cm
+NO_ROOM = 0
+
+
+class RoomIndex:
+    """Segment of each cell of the map bounding box of the rooms."""
+
+    def __init__(
+        self,
+        pixel_size: float,
+        origin: tuple[int, int],
+        size: tuple[int, int],
+        cells: array,
+        segment_ids: list[str],
+        names: dict[str, str],
+    ) -> None:
+        self.pixel_size = pixel_size
+        self._left, self._top = origin
+        self._width, self._height = size
+        self._cells = cells
+        # cells hold the position in segment_ids + 1 (0 is NO_ROOM).
+        self.segment_ids = segment_ids
+        self.names = names
+
+    @classmethod
+    def build(cls, parsed_json: dict, is_rand: bool) -> RoomIndex:
+        """Rasterise the segment layers of a parsed map."""
+        segments: list[tuple[str, list[int]]] = []
+        names: dict[str, str] = {}
+        for layer in iter_layers(parsed_json, is_rand):
+            segment_id = layer.get("segment_id")
+            if layer.get("type") != "segment" or segment_id is None:
+                continue
+            segments.append((str(segment_id), layer["runs"]))
+            if layer.get("name"):
+                names[str(segment_id)] = layer["name"]
+        pixel_size = float(get_pixel_size(parsed_json, is_rand))
+        runs = [
+            (runs[index], runs[index + 1], runs[index + 2])
+            for _, runs in segments
+            for index in range(0, len(runs) - 2, 3)
+        ]
+        if not runs:
+            return cls(pixel_size, (0, 0), (0, 0), array("H"), [], names)
+
+        left = min(x for x, _, _ in runs) // ROOM_INDEX_CELL_PX
+        top = min(y for _, y, _ in runs) // ROOM_INDEX_CELL_PX
+        right = max(x + length - 1 for x, _, length in runs) // ROOM_INDEX_CELL_PX
+        bottom = max(y for _, y, _ in runs) // ROOM_INDEX_CELL_PX
+        width, height = right - left + 1, bottom - top + 1
+        cells = array("H", [NO_ROOM]) * (width * height)
+        for position, (_, segment_runs) in enumerate(segments, start=1):
+            for index in range(0, len(segment_runs) - 2, 3):
+                x, y, length = segment_runs[index : index + 3]
+                row = (y // ROOM_INDEX_CELL_PX - top) * width - left
+                start = row + x // ROOM_INDEX_CELL_PX
+                end = row + (x + length - 1) // ROOM_INDEX_CELL_PX + 1
+                cells[start:end] = array("H", [position]) * (end - start)
+        return cls(
+            pixel_size,
+            (left, top),
+            (width, height),
+            cells,
+            [segment_id for segment_id, _ in segments],
+            names,
+        )
+
+    @property
+    def has_rooms(self) -> bool:
+        """Return True if the map has segments."""
+        return bool(self.segment_ids)
+
+    def segment_at_cell(self, cell_x: int, cell_y: int) -> Optional[str]:
+        """Return the segment of a cell (grid pixels / ROOM_INDEX_CELL_PX)."""
+        column, row = cell_x - self._left, cell_y - self._top
+        if not (0 <= column < self._width and 0 <= row < self._height):
+            return None
+        position = self._cells[row * self._width + column]
+        return self.segment_ids[position - 1] if position else None
+
+    def segment_at(self, x: float, y: float) -> Optional[str]:
+        """Return the segment at a map position (map units)."""
+        return self.segment_at_cell(
+            int(x / self.pixel_size) // ROOM_INDEX_CELL_PX,
+            int(y / self.pixel_size) // ROOM_INDEX_CELL_PX,
+        )
+
+    def room_at(self, x: float, y: float) -> Optional[dict[str, Any]]:
+        """Return the segment id and name of the room at a map position."""
+        segment_id = self.segment_at(x, y)
+        if segment_id is None:
+            return None
+        return {"segment_id": segment_id, "name": self.names.get(segment_id)}
+
+    def segments_in_zone(self, zone: Iterable[float]) -> set[str]:
+        """Return the segments inside the bounding box of a zone (x, y, ...)."""
+        coords = list(zone)
+        if len(coords) < 4:
+            return set()
+        cell = ROOM_INDEX_CELL_PX * self.pixel_size
+        xs, ys = coords[0::2], coords[1::2]
+        left = max(int(min(xs) // cell) - self._left, 0)
+        right = min(int(max(xs) // cell) - self._left, self._width - 1)
+        top = max(int(min(ys) // cell) - self._top, 0)
+        bottom = min(int(max(ys) // cell) - self._top, self._height - 1)
+        found: set[int] = set()
+        for row in range(top, bottom + 1):
+            offset = row * self._width
+            found.update(self._cells[offset + left : offset + right + 1])
+        return {self.segment_ids[position - 1] for position in found if position}
+
+    def cell_counts(self) -> dict[str, int]:
+        """Return the number of cells of each segment."""
+        counts = [0] * (len(self.segment_ids) + 1)
+        for position in self._cells:
+            counts[position] += 1
+        return {
+            segment_id: counts[position]
+            for position, segment_id in enumerate(self.segment_ids, start=1)
+        }
+
+
+class RoomIndexCache:
+    """Room index of the current map, rebuilt only when the map changes."""
+
+    def __init__(self, is_rand: bool) -> None:
+        self._is_rand = is_rand
+        self._map_hash: Optional[str] = None
+        self._names: dict[str, str] = {}
+        self._map_names: dict[str, str] = {}
+        self.index: Optional[RoomIndex] = None
+        self.robot_room: Optional[dict[str, Any]] = None
+
+    def build(self, parsed_json: dict) -> tuple[str, Optional[RoomIndex]]:
+        """Return the map hash and its new index, None if unchanged (executor)."""
+        map_hash = compute_map_hash(parsed_json, self._is_rand)
+        if self.index is not None and map_hash == self._map_hash:
+            return map_hash, None
+        return map_hash, RoomIndex.build(parsed_json, self._is_rand)
+
+    def set_index(self, map_hash: str, index: Optional[RoomIndex]) -> RoomIndex:
+        """Use the index returned by build() and return the current one."""
+        if index is not None:
+            self._map_names = index.names
+            index.names = {**self._names, **self._map_names}
+            self.index, self._map_hash = index, map_hash
+        return self.index
+
+    def update(self, parsed_json: dict) -> RoomIndex:
+        """Return the index of the map, built if the map changed."""
+        return self.set_index(*self.build(parsed_json))
+
+    def set_names(self, names: dict[str, str]) -> None:
+        """Set the room names not found in the map (Rand256 destinations)."""
+        self._names = names
+        if self.index is not None:
+            self.index.names = {**names, **self._map_names}
+
+    def locate_robot(self, robot: Optional[dict[str, Any]]) -> None:
+        """Remember the room of the robot position."""
+        room = None
+        if robot is not None and self.index is not None:
+            room = self.index.room_at(robot["x"], robot["y"])
+        self.robot_room = room
+
+    def room_at(self, x: float, y: float) -> Optional[dict[str, Any]]:
+        """Return the room at a map position, None if unknown."""
+        if self.index is None:
+            return None
+        return self.index.room_at(x, y)
+
+    def segments_in_zone(self, zone: Iterable[float]) -> Optional[set[str]]:
+        """Return the segments under a zone, None if the rooms are unknown."""
+        if self.index is None or not self.index.has_rooms:
+            return None
+        return self.index.segments_in_zone(zone)
@@ -0,0 +1,225 @@
+"""
+Cleaning Session Analytics.
+Version: 2026.5.0
+Live metrics of the cleaning session computed incrementally from the path
+and the robot position of each parsed map: covered area (coverage raster),
+coverage per room, distance travelled, average speed and time per room.
+
+Only the path points received since the previous map are processed, so each
+payload costs O(new points). Positions are handled in map grid pixels (map
+units / pixel_size), which are 5 cm for both Hypfer and Rand256. The rooms
+come from the room index of the map (same cells as the coverage raster).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Any, Optional
+
+from custom_components.mqtt_vacuum_camera.const import DOMAIN, NOT_STREAMING_STATES
+from custom_components.mqtt_vacuum_camera.utils.camera.room_index import (
+    ROOM_INDEX_CELL_PX,
+    RoomIndex,
+)
+
+EVENT_SESSION_SUMMARY = f"event_{DOMAIN}_session_summary"
+
+GRID_PIXEL_M = 0.05  # size of a map grid pixel
+COVERAGE_CELL_PX = ROOM_INDEX_CELL_PX  # coverage raster cell: 10 cm
+BRUSH_RADIUS_CELLS = 1  # cleaned width around the path: 3 cells, 30 cm
+CELL_AREA_M2 = (COVERAGE_CELL_PX * GRID_PIXEL_M) ** 2
+# Cell key packing (cells are at most 32768 apart in a map).
+_KEY_SHIFT = 16
+_KEY_OFFSET = 1 << 15
+
+
+def _cell_key(cell_x: int, cell_y: int) -> int:
+    return ((cell_y + _KEY_OFFSET) << _KEY_SHIFT) | (cell_x + _KEY_OFFSET)
+
+
+@dataclass
+class _Session:
+    """Accumulated state of one cleaning session."""
+
+    started_mono: float
+    last_mono: float
+    started_at: float = field(default_factory=time.time)
+    covered: set[int] = field(default_factory=set)
+    room_covered: dict[str, int] = field(default_factory=dict)
+    room_time: dict[str, float] = field(default_factory=dict)
+    distance_px: float = 0.0
+    # Path progress: number of polylines and coordinates already processed.
+    polylines: int = 0
+    coords: int = 0
+    last_point: Optional[tuple[float, float]] = None
+
+
+class SessionAnalytics:
+    """Incremental metrics of the cleaning sessions of one vacuum."""
+
+    def __init__(self) -> None:
+        self._session: Optional[_Session] = None
+        self._last_metrics: dict[str, Any] = {}
+        self._rooms: Optional[RoomIndex] = None
+        self._room_sizes: dict[str, int] = {}
+
+    @property
+    def active(self) -> bool:
+        """Return True while a session is recorded."""
+        return self._session is not None
+
+    def _set_rooms(self, rooms: RoomIndex) -> None:
+        """Use the room index of a new map."""
+        if rooms is not self._rooms:
+            self._rooms = rooms
+            self._room_sizes = rooms.cell_counts()
+
+    def _cover(self, session: _Session, x: float, y: float) -> None:
+        """Mark the cells cleaned around a grid position."""
+        cell_x = int(x) // COVERAGE_CELL_PX
+        cell_y = int(y) // COVERAGE_CELL_PX
+        for offset_y in range(-BRUSH_RADIUS_CELLS, BRUSH_RADIUS_CELLS + 1):
+            for offset_x in range(-BRUSH_RADIUS_CELLS, BRUSH_RADIUS_CELLS + 1):
+                key = _cell_key(cell_x + offset_x, cell_y + offset_y)
+                if key in session.covered:
+                    continue
+                session.covered.add(key)
+                segment_id = self._rooms.segment_at_cell(
+                    cell_x + offset_x, cell_y + offset_y
+                )
+                if segment_id is not None:
+                    session.room_covered[segment_id] = (
+                        session.room_covered.get(segment_id, 0) + 1
+                    )
+
+    def _add_segment(
+        self, session: _Session, start: tuple[float, float], end: tuple[float, float]
+    ) -> None:
+        """Add a path segment (grid pixels): distance and covered cells."""
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        session.distance_px += length
+        steps = max(1, math.ceil(length / COVERAGE_CELL_PX))
+        for step in range(1, steps + 1):
+            ratio = step / steps
+            self._cover(
+                session,
+                start[0] + (end[0] - start[0]) * ratio,
+                start[1] + (end[1] - start[1]) * ratio,
+            )
+
+    def _add_points(self, session: _Session, coords: list, start: int) -> None:
+        """Process the coordinates of a polyline from index start."""
+        scale = 1.0 / self._rooms.pixel_size
+        for index in range(start, len(coords) - 1, 2):
+            point = (coords[index] * scale, coords[index + 1] * scale)
+            if session.last_point is None:
+                self._cover(session, *point)
+            else:
+                self._add_segment(session, session.last_point, point)
+            session.last_point = point
+
+    def _consume_path(self, session: _Session, path: list[list]) -> bool:
+        """Process the new path points, False if the path was restarted."""
+        if len(path) < session.polylines or (
+            session.polylines
+            and len(path) == session.polylines
+            and len(path[-1]) < session.coords
+        ):
+            return False
+        if session.polylines:
+            # Continue the last polyline processed, then the new ones.
+            self._add_points(session, path[session.polylines - 1], session.coords)
+        for polyline in path[session.polylines :]:
+            session.last_point = None
+            self._add_points(session, polyline, 0)
+        session.polylines = len(path)
+        session.coords = len(path[-1]) if path else 0
+        return True
+
+    def update(
+        self, entities: dict[str, Any], vacuum_state: Optional[str], rooms: RoomIndex
+    ) -> Optional[dict[str, Any]]:
+        """
+        Process the entities of a new map (extract_entities) and its rooms.
+
+        Returns the summary of the session when it ended with this map.
+        """
+        cleaning = vacuum_state not in NOT_STREAMING_STATES
+        session = self._session
+        if session is None and not cleaning:
+            return None
+        now = time.monotonic()
+        self._set_rooms(rooms)
+        summary = None
+        if session is None:
+            session = self._session = _Session(now, now)
+        elif not self._consume_path(session, entities["path"]):
+            # The path was restarted: a new session began.
+            summary = self.summary()
+            self._last_metrics = self.metrics()
+            session = self._session = _Session(now, now)
+        if session.polylines == 0 and entities["path"]:
+            self._consume_path(session, entities["path"])
+
+        robot = entities["robot"]
+        if robot is not None:
+            room = rooms.segment_at(robot["x"], robot["y"])
+            if room is not None:
+                session.room_time[room] = (
+                    session.room_time.get(room, 0.0) + now - session.last_mono
+                )
+        session.last_mono = now
+
+        if not cleaning:
+            summary = self.summary()
+            self._last_metrics = self.metrics()
+            self._session = None
+        return summary
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the sensor values of the current (or last) session."""
+        session = self._session
+        if session is None:
+            return self._last_metrics
+        duration = max(0.0, session.last_mono - session.started_mono)
+        distance = session.distance_px * GRID_PIXEL_M
+        floor_cells = sum(self._room_sizes.values())
+        covered_rooms = sum(session.room_covered.values())
+        return {
+            "session_area": round(len(session.covered) * CELL_AREA_M2, 2),
+            "session_coverage": (
+                round(100.0 * covered_rooms / floor_cells, 1) if floor_cells else 0
+            ),
+            "session_distance": round(distance, 2),
+            "session_average_speed": (
+                round(distance / duration, 3) if duration > 0 else 0
+            ),
+            "session_duration": round(duration),
+            "session_rooms": self._room_metrics(session),
+        }
+
+    def _room_metrics(self, session: _Session) -> dict[str, dict[str, Any]]:
+        """Return the coverage and time spent in each room."""
+        return {
+            self._rooms.names.get(segment_id, segment_id): {
+                "segment_id": segment_id,
+                "coverage": round(
+                    100.0 * session.room_covered.get(segment_id, 0) / size, 1
+                ),
+                "time": round(session.room_time.get(segment_id, 0.0)),
+            }
+            for segment_id, size in self._room_sizes.items()
+        }
+
+    def summary(self) -> Optional[dict[str, Any]]:
+        """Return the summary of the current session (for the event)."""
+        if self._session is None:
+            return None
+        return {"started_at": self._session.started_at, **self.metrics()}
+
+    def reset(self) -> None:
+        """Forget the current and last sessions."""
+        self._session = None
+        self._last_metrics = {}
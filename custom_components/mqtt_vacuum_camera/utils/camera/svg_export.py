@@ -0,0 +1,239 @@
+"""
+SVG Export.
+Version: 2026.5.0
+Render the parsed Hypfer / Rand256 map straight to SVG without rasterising:
+layers become run-length rectangles merged in one path per layer, entities
+become primitives. The static part is cached per map hash.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Mapping, Optional
+
+from custom_components.mqtt_vacuum_camera.const import DEFAULT_VALUES
+from custom_components.mqtt_vacuum_camera.utils.camera.map_data import (
+    compute_map_hash,
+    extract_entities,
+    extract_static_layers,
+)
+
+ROOM_COLORS = 16
+
+# Style key -> (colour option, alpha option)
+_STYLE_OPTIONS = {
+    "background": ("color_background", "alpha_background"),
+    "wall": ("color_wall", "alpha_wall"),
+    "path": ("color_move", "alpha_move"),
+    "charger": ("color_charger", "alpha_charger"),
+    "robot": ("color_robot", "alpha_robot"),
+    "go_to": ("color_go_to", "alpha_go_to"),
+    "no_go": ("color_no_go", "alpha_no_go"),
+    "zone_clean": ("color_zone_clean", "alpha_zone_clean"),
+    "text": ("color_text", "alpha_text"),
+}
+
+# Entity -> option that hides it
+_DISABLE_OPTIONS = {
+    "robot": "disable_robot",
+    "charger": "disable_charger",
+    "path": "disable_path",
+    "predicted_path": "disable_predicted_path",
+    "go_to_target": "disable_go_to_target",
+    "virtual_walls": "disable_virtual_walls",
+    "no_go_areas": "disable_restricted_areas",
+    "no_mop_areas": "disable_no_mop_areas",
+    "obstacles": "disable_obstacles",
+}
+
+
+def _rgba(color: Any, alpha: Any) -> str:
+    """Return a CSS rgba() colour from the options values."""
+    red, green, blue = (int(value) for value in list(color)[:3])
+    return f"rgba({red},{green},{blue},{round(float(alpha) / 255, 3)})"
+
+
+def style_from_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the SVG colours and hidden entities from the entry options."""
+
+    def option(key: str) -> Any:
+        return options.get(key, DEFAULT_VALUES.get(key))
+
+    colors = {
+        name: _rgba(option(color), option(alpha))
+        for name, (color, alpha) in _STYLE_OPTIONS.items()
+    }
+    colors["rooms"] = [
+        _rgba(option(f"color_room_{index}"), option(f"alpha_room_{index}"))
+        for index in range(ROOM_COLORS)
+    ]
+    hidden = {key for key, disable in _DISABLE_OPTIONS.items() if option(disable)}
+    return {"colors": colors, "hidden": hidden}
+
+
+def _runs_path(runs: list) -> str:
+    """Turn [x, y, length, ...] runs into one SVG path of 1 pixel high rects."""
+    return "".join(
+        f"M{runs[index]} {runs[index + 1]}h{runs[index + 2]}v1h-{runs[index + 2]}z"
+        for index in range(0, len(runs) - 2, 3)
+    )
+
+
+def _view_box(layers: list[dict[str, Any]]) -> tuple[int, int, int, int]:
+    """Return the bounding box (x, y, width, height) of all runs."""
+    min_x = min_y = None
+    max_x = max_y = 0
+    for layer in layers:
+        runs = layer["runs"]
+        for index in range(0, len(runs) - 2, 3):
+            x, y, length = runs[index], runs[index + 1], runs[index + 2]
+            min_x = x if min_x is None else min(min_x, x)
+            min_y = y if min_y is None else min(min_y, y)
+            max_x = max(max_x, x + length)
+            max_y = max(max_y, y + 1)
+    if min_x is None:
+        return 0, 0, 1, 1
+    return min_x, min_y, max_x - min_x, max_y - min_y
+
+
+def _static_fragment(static: dict[str, Any], colors: dict[str, Any]) -> str:
+    """Render the floor, segments and walls."""
+    parts = []
+    room_index = 0
+    # Walls on top of the rooms.
+    for layer in sorted(static["layers"], key=lambda item: item["type"] == "wall"):
+        if not layer["runs"]:
+            continue
+        if layer["type"] == "wall":
+            fill = colors["wall"]
+        else:
+            fill = colors["rooms"][room_index % ROOM_COLORS]
+            room_index += 1
+        segment = (
+            f' data-segment="{layer["segment_id"]}"' if layer["segment_id"] else ""
+        )
+        parts.append(f'<path fill="{fill}"{segment} d="{_runs_path(layer["runs"])}"/>')
+    return f'<g id="layers">{"".join(parts)}</g>'
+
+
+def _points(values: list, scale: float) -> str:
+    """Format flat [x, y, ...] map units as SVG points."""
+    return " ".join(
+        f"{values[index] / scale:g},{values[index + 1] / scale:g}"
+        for index in range(0, len(values) - 1, 2)
+    )
+
+
+def _entities_fragment(
+    entities: dict[str, Any], style: dict[str, Any], scale: float
+) -> str:
+    """Render the robot, path, zones and the other entities."""
+    colors, hidden = style["colors"], style["hidden"]
+    parts = []
+    shapes = (
+        ("no_go_areas", "polygon", f'fill="{colors["no_go"]}"'),
+        ("no_mop_areas", "polygon", f'fill="{colors["no_go"]}"'),
+        ("active_zones", "polygon", f'fill="{colors["zone_clean"]}"'),
+        ("virtual_walls", "polyline", f'fill="none" stroke="{colors["no_go"]}"'),
+        ("path", "polyline", f'fill="none" stroke="{colors["path"]}"'),
+        (
+            "predicted_path",
+            "polyline",
+            f'fill="none" stroke="{colors["path"]}" stroke-dasharray="2"',
+        ),
+    )
+    for key, element, attributes in shapes:
+        if key in hidden:
+            continue
+        for shape in entities[key]:
+            parts.append(f'<{element} {attributes} points="{_points(shape, scale)}"/>')
+
+    for obstacle in [] if "obstacles" in hidden else entities["obstacles"]:
+        parts.append(
+            f'<circle cx="{obstacle["x"] / scale:g}" cy="{obstacle["y"] / scale:g}" '
+            f'r="1.5" fill="{colors["no_go"]}"/>'
+        )
+    for key, color, radius in (
+        ("go_to_target", colors["go_to"], 2),
+        ("charger", colors["charger"], 3),
+    ):
+        point = entities[key]
+        if point and key not in hidden:
+            parts.append(
+                f'<circle id="{key}" cx="{point["x"] / scale:g}" '
+                f'cy="{point["y"] / scale:g}" r="{radius}" fill="{color}"/>'
+            )
+    robot = entities["robot"]
+    if robot and "robot" not in hidden:
+        x, y = robot["x"] / scale, robot["y"] / scale
+        parts.append(
+            f'<g id="robot" transform="translate({x:g} {y:g}) '
+            f'rotate({float(robot.get("angle") or 0):g})">'
+            f'<circle r="4" fill="{colors["robot"]}"/>'
+            f'<line x2="0" y2="-4" stroke="{colors["text"]}"/></g>'
+        )
+    return f'<g id="entities" stroke-width="0.6">{"".join(parts)}</g>'
+
+
+class SvgExporter:
+    """Per camera SVG renderer with the static layers cached per map hash."""
+
+    def __init__(self, is_rand: bool, options: Mapping[str, Any]) -> None:
+        self._is_rand = is_rand
+        self._style = style_from_options(options)
+        self._lock = Lock()
+        self._map_hash: Optional[str] = None
+        self._static: Optional[tuple[str, tuple, float]] = None
+        # Last rendered document and the parsed map it was built from.
+        self._source: Optional[dict] = None
+        self._document: Optional[tuple[str, bool]] = None
+
+    @property
+    def map_hash(self) -> Optional[str]:
+        """Return the hash of the cached static layers."""
+        return self._map_hash
+
+    def set_options(self, options: Mapping[str, Any]) -> None:
+        """Apply new colours / disabled entities."""
+        with self._lock:
+            self._style = style_from_options(options)
+            self._map_hash = self._static = None
+            self._source = self._document = None
+
+    def _static_part(self, parsed_json: dict) -> tuple[str, tuple, float]:
+        """Return the cached static fragment, rebuilt when the map changes."""
+        map_hash = compute_map_hash(parsed_json, self._is_rand)
+        if map_hash != self._map_hash or self._static is None:
+            static = extract_static_layers(parsed_json, self._is_rand)
+            self._static = (
+                _static_fragment(static, self._style["colors"]),
+                _view_box(static["layers"]),
+                float(static["pixel_size"]),
+            )
+            self._map_hash = map_hash
+        return self._static
+
+    def render(self, parsed_json: dict, static_only: bool = False) -> str:
+        """Render the SVG document (executor job)."""
+        with self._lock:
+            if (
+                self._document is not None
+                and parsed_json is self._source
+                and self._document[1] == static_only
+            ):
+                return self._document[0]
+            fragment, (x, y, width, height), scale = self._static_part(parsed_json)
+            entities = ""
+            if not static_only:
+                entities = _entities_fragment(
+                    extract_entities(parsed_json, self._is_rand), self._style, scale
+                )
+            document = (
+                '<svg xmlns="http://www.w3.org/2000/svg" '
+                f'viewBox="{x} {y} {width} {height}" shape-rendering="crispEdges">'
+                f'<rect x="{x}" y="{y}" width="{width}" height="{height}" '
+                f'fill="{self._style["colors"]["background"]}"/>'
+                f"{fragment}{entities}</svg>"
+            )
+            self._source, self._document = parsed_json, (document, static_only)
+            return document
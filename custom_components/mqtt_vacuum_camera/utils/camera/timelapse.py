@@ -0,0 +1,179 @@
+"""
+Cleaning session time-lapse.
+Version: 2026.5.0
+Build an animated WebP or APNG from the camera frame history. The frames are
+decimated and deduplicated on the event loop (cheap, bytes only), decoded and
+encoded in an executor thread (delta frames: WebP minimize_size / APNG bbox),
+then written atomically under www/. Progress is reported with events.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+import time
+from typing import Any
+import uuid
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.mqtt_vacuum_camera.const import DOMAIN, LOGGER
+from custom_components.mqtt_vacuum_camera.utils.files_operations import write_atomic
+
+TIMELAPSE_EXTENSIONS = {"webp": ".webp", "apng": ".png"}
+DEFAULT_TIMELAPSE_FRAMES = 120
+DEFAULT_FRAME_DURATION_MS = 200
+DEFAULT_TIMELAPSE_WIDTH = 640
+
+EVENT_TIMELAPSE_PROGRESS = f"event_{DOMAIN}_timelapse_progress"
+EVENT_TIMELAPSE_COMPLETED = f"event_{DOMAIN}_timelapse_completed"
+EVENT_TIMELAPSE_FAILED = f"event_{DOMAIN}_timelapse_failed"
+
+
+@dataclass
+class TimelapseRequest:
+    """Time-lapse options."""
+
+    entity_id: str
+    file_name: str
+    image_format: str = "webp"
+    max_frames: int = DEFAULT_TIMELAPSE_FRAMES
+    frame_duration: int = DEFAULT_FRAME_DURATION_MS
+    max_width: int = DEFAULT_TIMELAPSE_WIDTH
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+
+
+def select_frames(
+    frames: list, max_frames: int, frame_duration: int
+) -> tuple[list[bytes], list[int]]:
+    """
+    Decimate the frames evenly (always keeping the last one) and merge the
+    consecutive duplicates into a longer frame.
+    """
+    if max_frames > 0 and len(frames) > max_frames:
+        step = (len(frames) - 1) / max(1, max_frames - 1)
+        frames = [frames[round(position * step)] for position in range(max_frames)]
+    images: list[bytes] = []
+    durations: list[int] = []
+    last_etag = None
+    for frame in frames:
+        if frame.etag == last_etag:
+            durations[-1] += frame_duration
+            continue
+        images.append(frame.data)
+        durations.append(frame_duration)
+        last_etag = frame.etag
+    return images, durations
+
+
+def render_timelapse(
+    frames: list[bytes], durations: list[int], image_format: str, max_width: int
+) -> bytes:
+    """Decode, normalise and encode the animation (executor)."""
+    # pylint: disable=import-outside-toplevel
+    from PIL import Image, ImageOps
+
+    images = []
+    size = None
+    for data in frames:
+        with Image.open(BytesIO(data)) as source:
+            if max_width:
+                # JPEG frames are decoded directly at a reduced scale.
+                source.draft("RGB", (max_width, max_width))
+            image = source.convert("RGBA")
+        if max_width and image.width > max_width:
+            image.thumbnail(
+                (max_width, max_width * 4), Image.Resampling.LANCZOS, reducing_gap=2.0
+            )
+        if size is None:
+            size = image.size
+        elif image.size != size:
+            # Trims can change during a run, all frames must share one size.
+            image = ImageOps.pad(image, size, Image.Resampling.BILINEAR)
+        images.append(image)
+
+    buffer = BytesIO()
+    if image_format == "apng":
+        images[0].save(
+            buffer,
+            format="PNG",
+            save_all=True,
+            append_images=images[1:],
+            duration=durations,
+            loop=0,
+            disposal=0,
+            blend=0,
+        )
+    else:
+        images[0].save(
+            buffer,
+            format="WEBP",
+            save_all=True,
+            append_images=images[1:],
+            duration=durations,
+            loop=0,
+            quality=80,
+            method=4,
+            minimize_size=True,
+            allow_mixed=True,
+        )
+    return buffer.getvalue()
+
+
+def output_path(hass: HomeAssistant, file_name: str, image_format: str) -> Path:
+    """Return the www/ path of the time-lapse (file name only, no folders)."""
+    name = Path(file_name).name
+    extension = TIMELAPSE_EXTENSIONS[image_format]
+    if not name.lower().endswith(extension):
+        name = f"{Path(name).stem}{extension}"
+    return Path(hass.config.path("www")) / name
+
+
+async def async_run_timelapse(
+    hass: HomeAssistant, history_frames: list, request: TimelapseRequest
+) -> None:
+    """Build the time-lapse and report the progress with events."""
+    started = time.monotonic()
+    base_event: dict[str, Any] = {
+        "entity_id": request.entity_id,
+        "job_id": request.job_id,
+    }
+
+    def progress(stage: str, value: float) -> None:
+        hass.bus.async_fire(
+            EVENT_TIMELAPSE_PROGRESS, {**base_event, "stage": stage, "progress": value}
+        )
+
+    try:
+        frames, durations = select_frames(
+            history_frames, request.max_frames, request.frame_duration
+        )
+        progress("selected", 0.1)
+        data = await hass.async_add_executor_job(
+            render_timelapse,
+            frames,
+            durations,
+            request.image_format,
+            request.max_width,
+        )
+        progress("encoded", 0.9)
+        path = output_path(hass, request.file_name, request.image_format)
+        await hass.async_add_executor_job(write_atomic, path, data)
+    except (OSError, ValueError, RuntimeError) as err:
+        LOGGER.warning("%s: Time-lapse failed: %s", request.entity_id, err)
+        hass.bus.async_fire(EVENT_TIMELAPSE_FAILED, {**base_event, "error": str(err)})
+        return
+
+    progress("written", 1.0)
+    hass.bus.async_fire(
+        EVENT_TIMELAPSE_COMPLETED,
+        {
+            **base_event,
+            "path": str(path),
+            "url": f"/local/{path.name}",
+            "frames": len(frames),
+            "size": len(data),
+            "elapsed": round(time.monotonic() - started, 2),
+        },
+    )
@@ -0,0 +1,144 @@
+"""
+Trims Store.
+Version: 2026.5.0
+Auto-crop trims of every camera and floor in a single versioned store. The
+trims are kept in memory (lookup, save and reset are dictionary operations)
+and written with a delayed save that coalesces the changes. The legacy
+auto_crop_<camera>.json files are migrated on the first load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from custom_components.mqtt_vacuum_camera.const import CAMERA_STORAGE, DOMAIN, LOGGER
+
+TRIMS_STORE_KEY = f"{DOMAIN}.trims"
+TRIMS_STORE_VERSION = 1
+TRIMS_SAVE_DELAY_S = 30
+TRIMS_STORE_DATA = f"{DOMAIN}_trims_store"
+TRIM_KEYS = ("trim_up", "trim_left", "trim_down", "trim_right")
+LEGACY_PREFIX = "auto_crop_"
+DEFAULT_FLOOR = "floor_0"
+
+
+def normalize_trims(data: Any) -> Optional[dict[str, int]]:
+    """Return the trims of a legacy file, a TrimsData dict or a list."""
+    if isinstance(data, dict) and isinstance(data.get("trims_data"), dict):
+        data = data["trims_data"]
+    if isinstance(data, (list, tuple)) and len(data) == len(TRIM_KEYS):
+        data = dict(zip(TRIM_KEYS, data))
+    if not isinstance(data, dict):
+        return None
+    try:
+        return {key: int(data.get(key) or 0) for key in TRIM_KEYS}
+    except (TypeError, ValueError):
+        return None
+
+
+def read_legacy_files(
+    directory: Path,
+) -> tuple[dict[str, dict[str, dict[str, int]]], list[Path]]:
+    """Read the auto_crop_<camera>.json files (executor)."""
+    cameras: dict[str, dict[str, dict[str, int]]] = {}
+    files = sorted(directory.glob(f"{LEGACY_PREFIX}*.json"))
+    for path in files:
+        try:
+            trims = normalize_trims(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+        if trims is not None and any(trims.values()):
+            cameras[path.stem[len(LEGACY_PREFIX) :]] = {DEFAULT_FLOOR: trims}
+    return cameras, files
+
+
+def remove_files(files: Iterable[Path]) -> None:
+    """Delete the migrated files (executor)."""
+    for path in files:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as err:
+            LOGGER.warning("Unable to remove %s: %s", path, err)
+
+
+class TrimsStore:
+    """Trims of each camera and floor, persisted in one store."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store = Store(hass, TRIMS_STORE_VERSION, TRIMS_STORE_KEY)
+        self._cameras: dict[str, dict[str, dict[str, int]]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the store once, migrating the legacy files if it is missing."""
+        async with self._lock:
+            if self._loaded:
+                return
+            data = await self._store.async_load()
+            if data is not None:
+                self._cameras = data.get("cameras", {})
+            else:
+                directory = Path(self._hass.config.path(STORAGE_DIR, CAMERA_STORAGE))
+                cameras, files = await self._hass.async_add_executor_job(
+                    read_legacy_files, directory
+                )
+                self._cameras = cameras
+                if files:
+                    await self._store.async_save(self._data())
+                    await self._hass.async_add_executor_job(remove_files, files)
+                    LOGGER.debug("Migrated %d trims files to the store", len(files))
+            self._loaded = True
+
+    def _data(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"cameras": self._cameras}
+
+    def _schedule_save(self) -> None:
+        """Coalesce the changes in a delayed save."""
+        self._store.async_delay_save(self._data, TRIMS_SAVE_DELAY_S)
+
+    def get(self, camera: str, floor: str = DEFAULT_FLOOR) -> Optional[dict[str, int]]:
+        """Return the stored trims of a camera floor."""
+        return self._cameras.get(camera, {}).get(floor)
+
+    def set(self, camera: str, floor: str, trims: Any) -> bool:
+        """Store the trims of a camera floor, return True if they changed."""
+        trims = normalize_trims(trims)
+        if not trims or not any(trims.values()):
+            return False
+        floors = self._cameras.setdefault(camera, {})
+        if floors.get(floor) == trims:
+            return False
+        floors[floor] = trims
+        self._schedule_save()
+        return True
+
+    def reset(self, cameras: Optional[Iterable[str]] = None) -> list[str]:
+        """Remove the trims of the cameras (all if None), return the removed."""
+        if cameras is None:
+            removed = list(self._cameras)
+            self._cameras.clear()
+        else:
+            removed = [
+                camera for camera in cameras if self._cameras.pop(camera, None)
+            ]
+        if removed:
+            self._schedule_save()
+        return removed
+
+
+async def async_get_trims_store(hass: HomeAssistant) -> TrimsStore:
+    """Return the loaded trims store shared by the cameras."""
+    store = hass.data.get(TRIMS_STORE_DATA)
+    if store is None:
+        store = hass.data[TRIMS_STORE_DATA] = TrimsStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,130 @@
+"""
+Websocket API for dashboards.
+Version: 2026.5.0
+Push lightweight map deltas (robot, path tail, zones, ...) to custom cards
+instead of having them download the full rendered image on every frame, and
+let them hit-test many points against the obstacles in one call. The large
+camera attributes (rooms, zones, obstacles) are fetched on demand.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+
+from custom_components.mqtt_vacuum_camera.common import get_camera_entity
+from custom_components.mqtt_vacuum_camera.const import DOMAIN
+
+WS_SUBSCRIBE_MAP = f"{DOMAIN}/subscribe_map"
+WS_OBSTACLE_HIT_TEST = f"{DOMAIN}/obstacle_hit_test"
+WS_CAMERA_ATTRIBUTES = f"{DOMAIN}/camera_attributes"
+
+
+@callback
+def async_register_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_map)
+    websocket_api.async_register_command(hass, ws_obstacle_hit_test)
+    websocket_api.async_register_command(hass, ws_camera_attributes)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE_MAP,
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("map_hash"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_subscribe_map(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """
+    Subscribe to the map of a camera.
+
+    The first event is a snapshot (static layers omitted when the client
+    already has map_hash), then only deltas are sent.
+    """
+    camera = get_camera_entity(hass, msg["entity_id"])
+    if camera is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Camera entity not found"
+        )
+        return
+
+    tracker = camera.features.map_deltas
+
+    @callback
+    def forward_message(message: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], message))
+
+    snapshot = await tracker.async_snapshot(hass, msg.get("map_hash"))
+    # No await between subscribing and sending the snapshot: no delta is lost.
+    connection.subscriptions[msg["id"]] = tracker.async_subscribe(forward_message)
+    connection.send_result(msg["id"])
+    if snapshot is not None:
+        forward_message(snapshot)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_OBSTACLE_HIT_TEST,
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("points"): [vol.ExactSequence([vol.Coerce(float)] * 2)],
+    }
+)
+@callback
+def ws_obstacle_hit_test(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the nearest obstacle (or null) of each image point."""
+    camera = get_camera_entity(hass, msg["entity_id"])
+    if camera is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Camera entity not found"
+        )
+        return
+    points = [(x, y) for x, y in msg["points"]]
+    connection.send_result(
+        msg["id"], {"obstacles": camera.processors.obstacle_view.hit_test(points)}
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_CAMERA_ATTRIBUTES,
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("version"): int,
+    }
+)
+@callback
+def ws_camera_attributes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """
+    Return all the camera attributes.
+
+    When the client already has the current version only the version is sent.
+    """
+    camera = get_camera_entity(hass, msg["entity_id"])
+    if camera is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Camera entity not found"
+        )
+        return
+    attributes = camera.full_attributes()
+    version = camera.features.attributes.version
+    if msg.get("version") == version:
+        connection.send_result(msg["id"], {"version": version})
+        return
+    connection.send_result(msg["id"], {"version": version, "attributes": attributes})
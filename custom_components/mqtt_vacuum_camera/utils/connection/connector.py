@@ -1,9 +1,10 @@
 """
 Consolidated ValetudoConnector with grouped data.
-Last Updated on version: 2025.10.0
+Last Updated on version: 2026.5.0
 """
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 import json
 from typing import Any, Dict, List
@@ -17,9 +18,11 @@ from custom_components.mqtt_vacuum_camera.common import (
     redact_ip_filter,
 )
 from custom_components.mqtt_vacuum_camera.const import (
-    DECODED_TOPICS,
+    HYPFER_DECODED_TOPICS,
+    HYPFER_NON_DECODED_TOPICS,
     LOGGER,
-    NON_DECODED_TOPICS,
+    RAND256_DECODED_TOPICS,
+    RAND256_NON_DECODED_TOPICS,
     CameraModes,
 )
 
@@ -157,6 +160,35 @@ class ValetudoConnector:
         self.rrm_data = RRMData(rrm_command=f"{mqtt_topic}/command")
         self.pkohelrs_data = PkohelrsData()
         self._notification_listeners: Dict[str, Callable[[], None]] = {}
+        self._update_listeners: List[Callable[[], None]] = []
+        self._dispatch = self._build_dispatch()
+
+    @callback
+    def async_add_update_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call update_callback when the attributes, state, battery or rooms change."""
+        self._update_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._update_listeners:
+                self._update_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_update(self) -> None:
+        """Notify the listeners that the vacuum data changed."""
+        for update_callback in list(self._update_listeners):
+            update_callback()
+
+    @callback
+    def _async_set_mqtt_value(self, name: str, value: Any) -> None:
+        """Set a vacuum value of mqtt_data, notify the listeners if it changed."""
+        if getattr(self.mqtt_data, name) != value:
+            setattr(self.mqtt_data, name, value)
+            self._async_notify_update()
 
     async def update_data(self, process: bool = True):
         """
@@ -277,9 +309,12 @@ class ValetudoConnector:
     async def _hypfer_handle_status_payload(self, state) -> None:
         """Handle Hypfer status payload."""
         if state:
+            changed = state != self.mqtt_data.mqtt_vac_stat
             self.mqtt_data.mqtt_vac_stat = state
             if self.mqtt_data.mqtt_vac_stat != "docked":
                 self.connector_data.ignore_data = False
+            if changed:
+                self._async_notify_update()
 
     async def _hypfer_handle_connect_state(self, connect_state) -> None:
         """Handle Hypfer connect state."""
@@ -300,22 +335,28 @@ class ValetudoConnector:
 
     async def _hypfer_handle_errors(self, errors) -> None:
         """Handle Hypfer errors."""
-        self.mqtt_data.mqtt_vac_err = errors
+        self._async_set_mqtt_value("mqtt_vac_err", errors)
 
     async def _hypfer_handle_battery_level(self, battery_state) -> None:
         """Handle Hypfer battery level."""
         if battery_state:
-            self.mqtt_data.mqtt_vac_battery_level = int(battery_state)
+            battery_level = int(battery_state)
+            if battery_level != self.mqtt_data.mqtt_vac_battery_level:
+                self.mqtt_data.mqtt_vac_battery_level = battery_level
+                self._async_notify_update()
 
     async def _hypfer_handle_map_segments(self, msg) -> None:
         """Handle MQTT message for map segments."""
-        self.mqtt_data.mqtt_segments = await self._async_decode_mqtt_payload(msg)
-        self.connector_data.room_store.set_rooms(self.mqtt_data.mqtt_segments)
+        segments = await self._async_decode_mqtt_payload(msg)
+        self.connector_data.room_store.set_rooms(segments)
+        if segments != self.mqtt_data.mqtt_segments:
+            self.mqtt_data.mqtt_segments = segments
+            self._async_notify_update()
 
     async def _hypfer_handle_mop_attachment(self, mop_state) -> None:
         """Handle mop attachment state."""
         if mop_state is not None:
-            self.mqtt_data.mop_attached = _str_to_bool(mop_state)
+            self._async_set_mqtt_value("mop_attached", _str_to_bool(mop_state))
             # Update shared mop_mode based on both attachment and operation mode
             self.config.shared.mop_mode = (
                 self.mqtt_data.mop_attached
@@ -325,12 +366,16 @@ class ValetudoConnector:
     async def _hypfer_handle_dustbin_attachment(self, dustbin_state) -> None:
         """Handle dustbin attachment state."""
         if dustbin_state is not None:
-            self.mqtt_data.dustbin_attached = _str_to_bool(dustbin_state)
+            self._async_set_mqtt_value(
+                "dustbin_attached", _str_to_bool(dustbin_state)
+            )
 
     async def _hypfer_handle_watertank_attachment(self, watertank_state) -> None:
         """Handle watertank attachment state."""
         if watertank_state is not None:
-            self.mqtt_data.watertank_attached = _str_to_bool(watertank_state)
+            self._async_set_mqtt_value(
+                "watertank_attached", _str_to_bool(watertank_state)
+            )
             # Update shared mop_mode - watertank implies mopping capability
             self.config.shared.mop_mode = (
                 self.mqtt_data.watertank_attached
@@ -339,7 +384,7 @@ class ValetudoConnector:
 
     async def _hypfer_handle_operation_mode(self, mode) -> None:
         """Handle operation mode preset."""
-        self.mqtt_data.operation_mode = str(mode)
+        self._async_set_mqtt_value("operation_mode", str(mode))
         # Update shared mop_mode only if mop is attached AND mode contains "mop"
         self.config.shared.mop_mode = (
             self.mqtt_data.mop_attached and "mop" in str(mode).lower()
@@ -347,11 +392,11 @@ class ValetudoConnector:
 
     async def _hypfer_handle_water_usage(self, water_level) -> None:
         """Handle water usage preset."""
-        self.mqtt_data.water_usage = str(water_level)
+        self._async_set_mqtt_value("water_usage", str(water_level))
 
     async def _hypfer_handle_dock_status(self, status) -> None:
         """Handle dock status."""
-        self.mqtt_data.dock_status = str(status)
+        self._async_set_mqtt_value("dock_status", str(status))
         # Convert dock status to user-friendly text
         match str(status):
             case "emptying":
@@ -514,8 +559,17 @@ class ValetudoConnector:
         temp_payload = msg.payload
         if temp_payload:
             tmp_data = json.loads(temp_payload)
+            previous = (
+                self.rrm_data.mqtt_vac_re_stat,
+                self.mqtt_data.mqtt_vac_battery_level,
+            )
             self.rrm_data.mqtt_vac_re_stat = tmp_data.get("state", None)
             self.mqtt_data.mqtt_vac_battery_level = tmp_data.get("battery_level", None)
+            if previous != (
+                self.rrm_data.mqtt_vac_re_stat,
+                self.mqtt_data.mqtt_vac_battery_level,
+            ):
+                self._async_notify_update()
             if (
                 self.mqtt_data.mqtt_vac_stat != "docked"
                 or int(self.mqtt_data.mqtt_vac_battery_level) <= 100
@@ -526,12 +580,15 @@ class ValetudoConnector:
     async def rand256_handle_destinations(self, msg) -> None:
         """Handle Rand256 destinations."""
         tmp_data = await self._async_decode_mqtt_payload(msg)
+        changed = tmp_data != self.rrm_data.rrm_destinations
         self.rrm_data.rrm_destinations = tmp_data
         if "rooms" in tmp_data:
             rooms_data = {
                 str(room["id"]): room["name"].strip("#") for room in tmp_data["rooms"]
             }
             self.connector_data.room_store.set_rooms(rooms_data)
+        if changed:
+            self._async_notify_update()
 
     async def rrm_handle_active_segments(self, msg) -> None:
         """Handle Rand256 active segments."""
@@ -610,39 +667,50 @@ class ValetudoConnector:
             retain=retain,
         )
 
-    async def async_subscribe_to_topics(self) -> None:
-        """Subscribe to the MQTT topics for Hypfer and ValetudoRe."""
-        if self.config.mqtt_topic:
-            topics_with_none_encoding = build_full_topic_set(
-                base_topic=self.config.mqtt_topic,
-                topic_suffixes=NON_DECODED_TOPICS,
-                add_topic=self.config.command_topic,
+    def topics(self) -> dict[str, str | None]:
+        """Return the topics of the detected firmware with their encoding."""
+        base_topic = self.config.mqtt_topic
+        if self.is_rand256:
+            raw_topics = build_full_topic_set(base_topic, RAND256_NON_DECODED_TOPICS)
+            decoded_topics = build_full_topic_set(
+                base_topic, RAND256_DECODED_TOPICS, add_topic=self.rrm_data.rrm_command
             )
-            topics_with_default_encoding = build_full_topic_set(
-                base_topic=self.config.mqtt_topic,
-                topic_suffixes=DECODED_TOPICS,
-                add_topic=self.rrm_data.rrm_command,
+        else:
+            raw_topics = build_full_topic_set(
+                base_topic,
+                HYPFER_NON_DECODED_TOPICS,
+                add_topic=self.config.command_topic,
             )
-            topics_with_default_encoding.add(self.config.mqtt_hass_vacuum)
-            for topic in topics_with_none_encoding:
-                self.connector_data.unsubscribe_handlers.append(
-                    await mqtt.async_subscribe(
-                        self.connector_data.hass,
-                        topic,
-                        self.async_message_received,
-                        _QOS,
-                        encoding=None,
-                    )
-                )
-            for topic in topics_with_default_encoding:
-                self.connector_data.unsubscribe_handlers.append(
-                    await mqtt.async_subscribe(
-                        self.connector_data.hass,
-                        topic,
-                        self.async_message_received,
-                        _QOS,
-                    )
+            decoded_topics = build_full_topic_set(base_topic, HYPFER_DECODED_TOPICS)
+        decoded_topics.add(self.config.mqtt_hass_vacuum)
+        topics: dict[str, str | None] = dict.fromkeys(decoded_topics, "utf-8")
+        topics.update(dict.fromkeys(raw_topics))
+        return topics
+
+    async def async_subscribe_to_topics(self) -> None:
+        """Subscribe to the MQTT topics of the firmware, all at once."""
+        if not self.config.mqtt_topic:
+            return
+        results = await asyncio.gather(
+            *(
+                mqtt.async_subscribe(
+                    self.connector_data.hass,
+                    topic,
+                    self.async_message_received,
+                    _QOS,
+                    encoding=encoding,
                 )
+                for topic, encoding in self.topics().items()
+            ),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        # The successful subscriptions are kept to be removed on unload.
+        self.connector_data.unsubscribe_handlers.extend(
+            result for result in results if not isinstance(result, BaseException)
+        )
+        if errors:
+            raise errors[0]
 
     async def async_unsubscribe_from_topics(self) -> None:
         """Unsubscribe from all MQTT topics."""
@@ -657,111 +725,117 @@ class ValetudoConnector:
             self.config.shared.vacuum_ips = ips
         return f"{self.connector_data.file_name}: Vacuum IPs: {ips}"
 
+    def _decoded(
+        self, handler: Callable[[Any], Awaitable[None]]
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Return a message handler passing the decoded payload to handler."""
+
+        async def _handle(msg) -> None:
+            await handler(await self._async_decode_mqtt_payload(msg))
+
+        return _handle
+
+    def _build_dispatch(self) -> dict[str, Callable[[Any], Awaitable[None]]]:
+        """Return the handler of each subscribed topic."""
+        base_topic = self.config.mqtt_topic
+        handlers = {
+            "/map_data": self._rand256_handle_image_payload,
+            "/MapData/map-data": self._handle_hypfer_map_data,
+            "/MapData/segments": self._hypfer_handle_map_segments,
+            "/state": self.rand256_handle_statuses,
+            "/custom_command": self.rrm_handle_active_segments,
+            "/destinations": self._handle_rand256_destinations,
+            "/attributes": self._handle_rand256_attributes,
+            "/maploader/map": self._handle_pkohelrs_maploader_map,
+            "/maploader/status": self._handle_pkohelrs_maploader_state,
+            "/WifiConfigurationCapability/ips": self._handle_vacuum_ips,
+        }
+        decoded_handlers = {
+            "/StatusStateAttribute/status": self._hypfer_handle_status_payload,
+            "/$state": self._hypfer_handle_connect_state,
+            "/StatusStateAttribute/error_description": self._hypfer_handle_errors,
+            "/BatteryStateAttribute/level": self._hypfer_handle_battery_level,
+            "/AttachmentStateAttribute/mop": self._hypfer_handle_mop_attachment,
+            "/AttachmentStateAttribute/dustbin": (
+                self._hypfer_handle_dustbin_attachment
+            ),
+            "/AttachmentStateAttribute/watertank": (
+                self._hypfer_handle_watertank_attachment
+            ),
+            "/OperationModeControlCapability/preset": (
+                self._hypfer_handle_operation_mode
+            ),
+            "/WaterUsageControlCapability/preset": self._hypfer_handle_water_usage,
+            "/DockStatusStateAttribute/status": self._hypfer_handle_dock_status,
+            "/ValetudoEvents/valetudo_events": self._hypfer_handle_valetudo_events,
+        }
+        dispatch = {
+            f"{base_topic}{suffix}": handler for suffix, handler in handlers.items()
+        }
+        for suffix, handler in decoded_handlers.items():
+            dispatch[f"{base_topic}{suffix}"] = self._decoded(handler)
+        dispatch[self.config.command_topic] = self.async_handle_start_command
+        dispatch[self.rrm_data.rrm_command] = self.async_handle_start_command
+        dispatch[self.config.mqtt_hass_vacuum] = self._handle_hass_vacuum_config
+        return dispatch
+
     @callback
     async def async_message_received(self, msg) -> None:
-        """
-        Handle incoming MQTT messages using match-case to reduce branch complexity.
-        This replaces the long if-elif chain.
-        """
+        """Handle an incoming MQTT message with the handler of its topic."""
         self.connector_data.rcv_topic = msg.topic
         if self.config.shared.camera_mode != CameraModes.MAP_VIEW:
             return
-        topic = self.connector_data.rcv_topic
-        match topic:
-            case t if t == f"{self.config.mqtt_topic}/map_data":
-                await self._rand256_handle_image_payload(msg)
-            case t if (
-                t == f"{self.config.mqtt_topic}/MapData/map-data"
-                and not self.connector_data.ignore_data
-            ):
-                await self._hypfer_handle_image_data(msg)
-            case t if t == f"{self.config.mqtt_topic}/StatusStateAttribute/status":
-                decoded_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_status_payload(decoded_state)
-            case t if t == f"{self.config.mqtt_topic}/$state":
-                decoded_connect_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_connect_state(decoded_connect_state)
-            case t if (
-                t == f"{self.config.mqtt_topic}/StatusStateAttribute/error_description"
-            ):
-                decode_errors = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_errors(decode_errors)
-            case t if t == f"{self.config.mqtt_topic}/BatteryStateAttribute/level":
-                decoded_battery_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_battery_level(decoded_battery_state)
-            case t if t == f"{self.config.mqtt_topic}/AttachmentStateAttribute/mop":
-                decoded_mop_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_mop_attachment(decoded_mop_state)
-            case t if t == f"{self.config.mqtt_topic}/AttachmentStateAttribute/dustbin":
-                decoded_dustbin_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_dustbin_attachment(decoded_dustbin_state)
-            case t if (
-                t == f"{self.config.mqtt_topic}/AttachmentStateAttribute/watertank"
-            ):
-                decoded_watertank_state = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_watertank_attachment(decoded_watertank_state)
-            case t if (
-                t == f"{self.config.mqtt_topic}/OperationModeControlCapability/preset"
-            ):
-                decoded_operation_mode = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_operation_mode(decoded_operation_mode)
-            case t if (
-                t == f"{self.config.mqtt_topic}/WaterUsageControlCapability/preset"
-            ):
-                decoded_water_usage = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_water_usage(decoded_water_usage)
-            case t if t == f"{self.config.mqtt_topic}/DockStatusStateAttribute/status":
-                decoded_dock_status = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_dock_status(decoded_dock_status)
-            case t if t == f"{self.config.mqtt_topic}/ValetudoEvents/valetudo_events":
-                decoded_events = await self._async_decode_mqtt_payload(msg)
-                await self._hypfer_handle_valetudo_events(decoded_events)
-            case t if t == f"{self.config.mqtt_topic}/state":
-                await self.rand256_handle_statuses(msg)
-            case t if t == f"{self.config.mqtt_topic}/custom_command":
-                await self.rrm_handle_active_segments(msg)
-            case t if t == f"{self.config.mqtt_topic}/destinations":
-                await self.connector_data.hass.async_create_task(
-                    self.rand256_handle_destinations(msg)
-                )
-            case t if t == f"{self.config.mqtt_topic}/MapData/segments":
-                await self._hypfer_handle_map_segments(msg)
-            case t if t in [self.config.command_topic, self.rrm_data.rrm_command]:
-                await self.async_handle_start_command(msg)
-            case t if t == f"{self.config.mqtt_topic}/attributes":
-                self.rrm_data.rrm_attributes = await self._async_decode_mqtt_payload(
-                    msg
-                )
-                try:
-                    self.mqtt_data.mqtt_vac_err = self.rrm_data.rrm_attributes.get(
-                        "last_run_stats", {}
-                    ).get("errorDescription", None)
-                except AttributeError:
-                    LOGGER.debug("Error in getting last_run_stats")
-            case t if t == f"{self.config.mqtt_topic}/maploader/map":
-                await self._handle_pkohelrs_maploader_map(msg)
-            case t if t == f"{self.config.mqtt_topic}/maploader/status":
-                await self._handle_pkohelrs_maploader_state(msg)
-            case t if t == self.config.mqtt_hass_vacuum:
-                temp_json = await self._async_decode_mqtt_payload(msg)
-                if isinstance(temp_json, dict):
-                    self.config.shared.vacuum_api = temp_json.get("device", {}).get(
-                        "configuration_url", None
-                    )
-                elif isinstance(temp_json, str):
-                    self.config.shared.vacuum_api = temp_json
-                else:
-                    self.config.shared.vacuum_api = None
-                LOGGER.debug(
-                    "%s: Vacuum API URL: %s",
-                    self.connector_data.file_name,
-                    self.config.shared.vacuum_api,
-                )
-            case t if t == f"{self.config.mqtt_topic}/WifiConfigurationCapability/ips":
-                vacuum_host_ip = await self._async_decode_mqtt_payload(msg)
-                self.config.shared.vacuum_ips = (
-                    vacuum_host_ip.split(",")[0]
-                    if len(vacuum_host_ip.split(",")) > 1
-                    else vacuum_host_ip
-                )
-                LOGGER.debug(self._log_vacuum_ips(self.config.shared.vacuum_ips))
+        handler = self._dispatch.get(msg.topic)
+        if handler is not None:
+            await handler(msg)
+
+    async def _handle_hypfer_map_data(self, msg) -> None:
+        """Handle the Hypfer map unless the data is ignored."""
+        if not self.connector_data.ignore_data:
+            await self._hypfer_handle_image_data(msg)
+
+    async def _handle_rand256_destinations(self, msg) -> None:
+        """Handle the Rand256 destinations in a task."""
+        await self.connector_data.hass.async_create_task(
+            self.rand256_handle_destinations(msg)
+        )
+
+    async def _handle_rand256_attributes(self, msg) -> None:
+        """Handle the Rand256 attributes and the last run error."""
+        attributes = await self._async_decode_mqtt_payload(msg)
+        if attributes != self.rrm_data.rrm_attributes:
+            self.rrm_data.rrm_attributes = attributes
+            self._async_notify_update()
+        try:
+            self.mqtt_data.mqtt_vac_err = self.rrm_data.rrm_attributes.get(
+                "last_run_stats", {}
+            ).get("errorDescription", None)
+        except AttributeError:
+            LOGGER.debug("Error in getting last_run_stats")
+
+    async def _handle_hass_vacuum_config(self, msg) -> None:
+        """Handle the vacuum discovery config (API URL)."""
+        temp_json = await self._async_decode_mqtt_payload(msg)
+        if isinstance(temp_json, dict):
+            self.config.shared.vacuum_api = temp_json.get("device", {}).get(
+                "configuration_url", None
+            )
+        elif isinstance(temp_json, str):
+            self.config.shared.vacuum_api = temp_json
+        else:
+            self.config.shared.vacuum_api = None
+        LOGGER.debug(
+            "%s: Vacuum API URL: %s",
+            self.connector_data.file_name,
+            self.config.shared.vacuum_api,
+        )
+
+    async def _handle_vacuum_ips(self, msg) -> None:
+        """Handle the IPs of the vacuum."""
+        vacuum_host_ip = await self._async_decode_mqtt_payload(msg)
+        self.config.shared.vacuum_ips = (
+            vacuum_host_ip.split(",")[0]
+            if len(vacuum_host_ip.split(",")) > 1
+            else vacuum_host_ip
+        )
+        LOGGER.debug(self._log_vacuum_ips(self.config.shared.vacuum_ips))
@@ -1,6 +1,6 @@
 """
 Decompression Manager for MQTT Vacuum Camera.
-Version: 2025.10.0
+Version: 2026.5.0
 """
 
 from __future__ import annotations
@@ -8,7 +8,6 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional
 
-from isal import igzip, isal_zlib  # pylint: disable=c-extension-no-member
 from valetudo_map_parser.config.rand256_parser import RRMapParser
 
 from custom_components.mqtt_vacuum_camera.const import LOGGER
@@ -20,6 +19,9 @@ from custom_components.mqtt_vacuum_camera.utils.thread_pool import (
 
 def _safe_zlib_decompress(data: bytes) -> str:
     """Decompress Hypfer payload using zlib."""
+    # pylint: disable-next=import-outside-toplevel,c-extension-no-member
+    from isal import isal_zlib
+
     try:
         return isal_zlib.decompress(data).decode()
     except Exception as e:
@@ -28,6 +30,8 @@ def _safe_zlib_decompress(data: bytes) -> str:
 
 def _safe_gzip_decompress(data: bytes) -> bytes:
     """Decompress Rand256 payload using gzip."""
+    from isal import igzip  # pylint: disable=import-outside-toplevel
+
     try:
         return igzip.decompress(data)
     except Exception as e:
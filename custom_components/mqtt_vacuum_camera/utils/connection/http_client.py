@@ -0,0 +1,158 @@
+"""
+Robot HTTP Client.
+Version: 2026.5.0
+Long lived, per vacuum aiohttp session used to download the obstacle images
+from the robot: keep-alive connections, a small connection limit and a size
+guard on the downloaded data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping, Optional
+from urllib.parse import urljoin
+
+import aiohttp
+
+from custom_components.mqtt_vacuum_camera.const import (
+    CONF_OBSTACLE_LINK_IP,
+    CONF_OBSTACLE_LINK_PORT,
+    CONF_OBSTACLE_LINK_PROTOCOL,
+    DOWNLOAD_TIMEOUT,
+    LOGGER,
+    ROBOT_HTTP_CONNECT_TIMEOUT_S,
+    ROBOT_HTTP_KEEPALIVE_S,
+    ROBOT_HTTP_MAX_BYTES,
+    ROBOT_HTTP_MAX_CONNECTIONS,
+)
+
+
+class ResponseTooLarge(Exception):
+    """The response body is bigger than the allowed size."""
+
+
+def robot_base_url(options: Mapping[str, Any]) -> Optional[str]:
+    """Return the robot URL from the obstacle link options, None if unset."""
+    ip_address = options.get(CONF_OBSTACLE_LINK_IP)
+    if not ip_address:
+        return None
+    protocol = options.get(CONF_OBSTACLE_LINK_PROTOCOL) or "http"
+    port = options.get(CONF_OBSTACLE_LINK_PORT)
+    default_port = 443 if protocol == "https" else 80
+    if port and int(port) != default_port:
+        return f"{protocol}://{ip_address}:{int(port)}/"
+    return f"{protocol}://{ip_address}/"
+
+
+async def read_limited(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """
+    Stream the response body into a buffer, at most max_bytes.
+
+    With a Content-Length (and no Content-Encoding, as the length is then the
+    one of the compressed body) the size is checked before reading and the
+    body is read into a buffer of that size, without growing it.
+    """
+    length = response.content_length
+    if response.headers.get(aiohttp.hdrs.CONTENT_ENCODING):
+        length = None
+    if length is not None:
+        if length > max_bytes:
+            raise ResponseTooLarge(f"{length} bytes")
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        received = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            end = received + len(chunk)
+            if end > length:
+                raise ResponseTooLarge("more data than the Content-Length")
+            view[received:end] = chunk
+            received = end
+        view.release()
+        if received != length:
+            raise aiohttp.ClientPayloadError(f"{received} of {length} bytes received")
+        return bytes(buffer)
+
+    buffer = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        if len(buffer) + len(chunk) > max_bytes:
+            raise ResponseTooLarge(f"more than {max_bytes} bytes")
+        buffer += chunk
+    return bytes(buffer)
+
+
+class RobotHttpClient:
+    """HTTP session of one vacuum, created on first use."""
+
+    def __init__(
+        self,
+        file_name: str,
+        options: Mapping[str, Any],
+        max_bytes: int = ROBOT_HTTP_MAX_BYTES,
+    ) -> None:
+        self._file_name = file_name
+        self._base_url = robot_base_url(options)
+        self._max_bytes = max_bytes
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """Return the robot URL configured in the options."""
+        return self._base_url
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, (re)created if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=ROBOT_HTTP_MAX_CONNECTIONS,
+                keepalive_timeout=ROBOT_HTTP_KEEPALIVE_S,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=DOWNLOAD_TIMEOUT, connect=ROBOT_HTTP_CONNECT_TIMEOUT_S
+                ),
+            )
+        return self._session
+
+    def resolve(self, url: str) -> str:
+        """Resolve a link relative to the robot URL (absolute links unchanged)."""
+        if self._base_url and "://" not in url:
+            return urljoin(self._base_url, url)
+        return url
+
+    async def async_download(
+        self, url: str, set_timeout: int = DOWNLOAD_TIMEOUT
+    ) -> Optional[bytes]:
+        """Download url, None on error, timeout or too large response."""
+        try:
+            # The request timeout replaces the one of the session: keep connect.
+            timeout = aiohttp.ClientTimeout(
+                total=set_timeout, connect=ROBOT_HTTP_CONNECT_TIMEOUT_S
+            )
+            async with self._get_session().get(
+                self.resolve(url), timeout=timeout
+            ) as response:
+                if response.status != 200:
+                    LOGGER.warning(
+                        "Failed to download obstacle image. Status: %s, Reason: %s",
+                        response.status,
+                        response.reason,
+                    )
+                    return None
+                return await read_limited(response, self._max_bytes)
+        except ResponseTooLarge as err:
+            LOGGER.warning("%s: Obstacle image too large: %s", self._file_name, err)
+            return None
+        except aiohttp.ClientError as err:
+            LOGGER.warning("Client error occurred: %s", err, exc_info=True)
+            return None
+        except asyncio.TimeoutError as err:
+            LOGGER.warning("Timeout downloading image: %s", err)
+            return None
+
+    async def async_close(self) -> None:
+        """Close the session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
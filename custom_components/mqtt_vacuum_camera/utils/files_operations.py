@@ -4,23 +4,26 @@ Common functions for the MQTT Vacuum Camera integration.
 Those functions are used to store and retrieve user data from the Home Assistant storage.
 The data will be stored locally in the Home Assistant in .storage/valetudo_camera directory.
 Author: @sca075
-Version: 2025.10.0
+Version: 2026.5.0
 """
 
 from __future__ import annotations
 
 import asyncio
-import glob
 import json
+import os
 from pathlib import Path
 import re
-from typing import Any, List, Optional
+import tempfile
+from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.storage import STORAGE_DIR
 
-from ..const import CAMERA_STORAGE, LOGGER
+from ..common import get_camera_entity
+from ..const import DOMAIN, LOGGER
+from .camera.trims_store import async_get_trims_store
 from .language_cache import LanguageCache
 
 
@@ -142,6 +145,21 @@ async def async_del_file(file):
         LOGGER.debug("File not found: %s", file)
 
 
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file atomically (temporary file in the same folder + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 async def async_write_file_to_disk(
     file_to_write: str, data, is_binary: bool = False
 ) -> None:
@@ -219,37 +237,17 @@ def extract_core_entity_ids(entity_ids: list[str]) -> list[str]:
     return core_entity_ids
 
 
-async def async_list_files(pattern: str) -> List[str]:
-    """List files matching the pattern asynchronously."""
-    return await asyncio.to_thread(glob.glob, pattern)
-
-
-async def get_trims_files_names(path: str, entity_ids: list[str]) -> list[str]:
-    """
-    Generates the list of file names to delete based on the core entity IDs.
-    """
-    core_entity_ids = extract_core_entity_ids(entity_ids)
-    file_names = [f"{path}/auto_crop_{core_id}.json" for core_id in core_entity_ids]
-    return file_names
-
-
 async def async_clean_up_all_auto_crop_files(hass: HomeAssistant) -> None:
     """
-    Deletes all auto_crop_*.json files in the specified directory.
+    Deletes the stored trims of all the cameras.
     """
-
-    directory = Path(hass.config.path(STORAGE_DIR, CAMERA_STORAGE))
-    # Create the pattern to match all auto_crop_*.json files
-    pattern = str(directory / "auto_crop_*.json")
-    # List all matching files
-    files_to_delete = await async_list_files(pattern)
-    # Iterate over the files and delete each one
-    for file_path in files_to_delete:
-        try:
-            Path(file_path).unlink()
-            LOGGER.debug("Deleted: %s", file_path)
-        except OSError as e:
-            LOGGER.error("Error deleting %s: %s", file_path, e)
+    store = await async_get_trims_store(hass)
+    for camera in store.reset():
+        LOGGER.debug("Trims deleted: %s", camera)
+    # The running cameras would store their trims again before the reload.
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("camera") is not None:
+            entry_data["camera"].reset_trims()
 
 
 async def async_reset_map_trims(hass: HomeAssistant, entity_list: list) -> bool:
@@ -260,17 +258,17 @@ async def async_reset_map_trims(hass: HomeAssistant, entity_list: list) -> bool:
         LOGGER.debug("No entity IDs provided.")
         raise ServiceValidationError("no_entity_id_provided")
     LOGGER.debug("Resetting the map trims.")
-    files_path = hass.config.path(STORAGE_DIR, CAMERA_STORAGE)
-
-    # Collect files to delete
-    files_to_delete = await get_trims_files_names(files_path, entity_list)
+    cameras = []
+    for entity_id in entity_list:
+        camera = get_camera_entity(hass, entity_id)
+        if camera is not None:
+            camera.reset_trims()
+            cameras.append(camera.context.file_name)
+        else:
+            cameras.extend(extract_core_entity_ids([entity_id]))
 
-    # Loop through the list of files and remove each one asynchronously
-    if not files_to_delete:
-        LOGGER.debug("No files found to delete.")
+    store = await async_get_trims_store(hass)
+    if not store.reset(cameras):
+        LOGGER.debug("No trims found to delete.")
         return False
-
-    for file_path in files_to_delete:
-        await async_del_file(file_path)
-
     return True
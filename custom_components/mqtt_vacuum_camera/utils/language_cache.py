@@ -1,7 +1,7 @@
 """
 Language Cache for MQTT Vacuum Camera.
 This module provides caching for user language data to reduce I/O operations.
-Version: 2025.5.0
+Version: 2026.5.0
 """
 
 from __future__ import annotations
@@ -10,16 +10,22 @@ import asyncio
 from functools import lru_cache
 import json
 import logging
-import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+import time
+from typing import Dict, Iterable, List, Optional, Set
 
-from homeassistant.core import HomeAssistant
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.storage import STORAGE_DIR
 from valetudo_map_parser.config.types import UserLanguageStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# The last used token is looked up again after this delay or on user events.
+ACTIVE_USER_TTL_S = 300
+USER_EVENTS = (EVENT_USER_ADDED, EVENT_USER_UPDATED, EVENT_USER_REMOVED)
+EXCLUDED_USERS = ("Supervisor", "Home Assistant Content", "Home Assistant Cloud")
+
 
 class LanguageCache:
     """
@@ -31,7 +37,8 @@ class LanguageCache:
     _all_languages: Set[str] = set()  # Set of all languages
     _translations_cache: Dict[str, dict] = {}  # language -> translation data
     _initialized: bool = False
-    _auth_update_time: Optional[float] = None
+    _active_user_id: Optional[str] = None
+    _active_checked_at: Optional[float] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -40,7 +47,8 @@ class LanguageCache:
             cls._instance._all_languages = set()
             cls._instance._translations_cache = {}
             cls._instance._initialized = False
-            cls._instance._auth_update_time = None
+            cls._instance._active_user_id = None
+            cls._instance._active_checked_at = None
         return cls._instance
 
     @staticmethod
@@ -71,12 +79,9 @@ class LanguageCache:
             if all_languages:
                 self._all_languages = set(all_languages)
 
-            # Get the auth file update time
-            auth_file_path = Path(hass.config.path(STORAGE_DIR, "auth"))
-            if await asyncio.to_thread(auth_file_path.exists):
-                self._auth_update_time = await asyncio.to_thread(
-                    lambda: auth_file_path.stat().st_mtime
-                )
+            # The active user is looked up again when the users change.
+            for event_type in USER_EVENTS:
+                hass.bus.async_listen(event_type, self._async_users_changed)
 
             self._initialized = True
             _LOGGER.debug(
@@ -100,46 +105,17 @@ class LanguageCache:
         try:
             # Get all user IDs excluding system users
             users = await hass.auth.async_get_users()
-            excluded_users = [
-                "Supervisor",
-                "Home Assistant Content",
-                "Home Assistant Cloud",
-            ]
-            user_ids = [user.id for user in users if user.name not in excluded_users]
-
-            for user_id in user_ids:
-                user_data_file = Path(
-                    hass.config.path(STORAGE_DIR, f"frontend.user_data_{user_id}")
-                )
+            user_ids = [user.id for user in users if user.name not in EXCLUDED_USERS]
 
-                if await asyncio.to_thread(user_data_file.exists):
-                    try:
-                        # Use asyncio.to_thread for non-blocking file operations
-                        user_data = await self._async_read_file(str(user_data_file))
-                        if user_data:
-                            data = json.loads(user_data)
-                            language = data["data"]["language"]["language"]
-
-                            # Store in cache and UserLanguageStore
-                            self._user_languages[user_id] = language
-                            self._all_languages.add(language)
-                            await user_language_store.set_user_language(
-                                user_id, language
-                            )
-                            _LOGGER.debug(
-                                "Cached language for user %s: %s", user_id, language
-                            )
-                    except (KeyError, json.JSONDecodeError) as e:
-                        _LOGGER.debug(
-                            "User language data unavailable for %s, defaulting to en: %s",
-                            user_id,
-                            str(e),
-                        )
-                        self._user_languages[user_id] = "en"
-                        self._all_languages.add("en")
-                        await user_language_store.set_user_language(
-                            user_id, "en"
-                        )
+            # All the user data files are read in one executor job.
+            languages = await asyncio.to_thread(
+                self._read_user_languages, hass.config.path(STORAGE_DIR), user_ids
+            )
+            for user_id, language in languages.items():
+                self._user_languages[user_id] = language
+                self._all_languages.add(language)
+                await user_language_store.set_user_language(user_id, language)
+                _LOGGER.debug("Cached language for user %s: %s", user_id, language)
 
             # Mark UserLanguageStore as initialized using the proper method
             await self.async_mark_user_language_store_initialized()
@@ -164,6 +140,59 @@ class LanguageCache:
         with open(file_path, "r") as file:
             return file.read()
 
+    @staticmethod
+    def _read_user_languages(
+        storage_path: str, user_ids: Iterable[str]
+    ) -> Dict[str, str]:
+        """Read the language of the users from their frontend data (executor)."""
+        languages: Dict[str, str] = {}
+        for user_id in user_ids:
+            user_data_file = Path(storage_path) / f"frontend.user_data_{user_id}"
+            try:
+                with open(user_data_file, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except FileNotFoundError:
+                continue
+            except (OSError, json.JSONDecodeError) as e:
+                _LOGGER.debug("User data unavailable for %s: %s", user_id, str(e))
+                languages[user_id] = "en"
+                continue
+            try:
+                languages[user_id] = data["data"]["language"]["language"]
+            except (KeyError, TypeError):
+                _LOGGER.debug(
+                    "User language data unavailable for %s, defaulting to en", user_id
+                )
+                languages[user_id] = "en"
+        return languages
+
+    @callback
+    def _async_users_changed(self, _event: Event) -> None:
+        """Look up the active user again on the next request."""
+        self._active_checked_at = None
+
+    def _is_active_user_stale(self) -> bool:
+        """Return True if the active user must be looked up again."""
+        return (
+            self._active_checked_at is None
+            or time.monotonic() - self._active_checked_at > ACTIVE_USER_TTL_S
+        )
+
+    async def _async_refresh_active_user(self, hass: HomeAssistant) -> None:
+        """Find the active user and read its language once."""
+        self._active_user_id = await self._find_last_logged_in_user(hass)
+        self._active_checked_at = time.monotonic()
+        user_id = self._active_user_id
+        if not user_id:
+            return
+        languages = await asyncio.to_thread(
+            self._read_user_languages, hass.config.path(STORAGE_DIR), [user_id]
+        )
+        if user_id in languages:
+            self._user_languages[user_id] = languages[user_id]
+            self._all_languages.add(languages[user_id])
+            await UserLanguageStore().set_user_language(user_id, languages[user_id])
+
     async def get_active_user_language(self, hass: HomeAssistant) -> str:
         """
         Get the language of the active user, with caching to reduce I/O.
@@ -174,69 +203,10 @@ class LanguageCache:
         Returns:
             The language code (e.g., 'en', 'fr')
         """
-        # Check if auth file has been updated
-        if await self._is_auth_updated(hass):
-            # If auth has been updated, we need to refresh the active user
-            active_user_id = await self._find_last_logged_in_user(hass)
-            if active_user_id:
-                user_language_store = UserLanguageStore()
-                language = await user_language_store.get_user_language(active_user_id)
-                if language:
-                    return language
-
-                # Fallback to loading from file if not in UserLanguageStore
-                user_data_path = Path(
-                    hass.config.path(
-                        STORAGE_DIR, f"frontend.user_data_{active_user_id}"
-                    )
-                )
-                if await asyncio.to_thread(user_data_path.exists):
-                    try:
-                        # Use asyncio.to_thread for non-blocking file operations
-                        user_data = await self._async_read_file(str(user_data_path))
-                        if user_data:
-                            data = json.loads(user_data)
-                            language = data["data"]["language"]["language"]
-                            self._user_languages[active_user_id] = language
-                            await user_language_store.set_user_language(
-                                active_user_id, language
-                            )
-                            return language
-                    except (KeyError, json.JSONDecodeError) as e:
-                        _LOGGER.debug(
-                            "Error loading language for user %s: %s",
-                            active_user_id,
-                            str(e),
-                        )
-
-        # If we have a cached active user, use that
-        active_user_id = await self._find_last_logged_in_user(hass)
-        if active_user_id and active_user_id in self._user_languages:
-            return self._user_languages[active_user_id]
-
-        # Default to English if all else fails
-        return "en"
-
-    async def _is_auth_updated(self, hass: HomeAssistant) -> bool:
-        """
-        Check if the auth file has been updated since last check.
-
-        Args:
-            hass: The Home Assistant instance
-
-        Returns:
-            True if the auth file has been updated, False otherwise
-        """
-        auth_file_path = Path(hass.config.path(STORAGE_DIR, "auth"))
-        if not await asyncio.to_thread(auth_file_path.exists):
-            return False
-
-        # Use asyncio.to_thread for non-blocking file operations
-        current_mtime = await asyncio.to_thread(lambda: auth_file_path.stat().st_mtime)
-        if self._auth_update_time is None or current_mtime > self._auth_update_time:
-            self._auth_update_time = current_mtime
-            return True
-        return False
+        if self._is_active_user_stale():
+            await self._async_refresh_active_user(hass)
+        # Default to English if the user has no language.
+        return self._user_languages.get(self._active_user_id or "", "en")
 
     @staticmethod
     async def _find_last_logged_in_user(hass: HomeAssistant) -> Optional[str]:
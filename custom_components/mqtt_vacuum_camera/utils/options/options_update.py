@@ -0,0 +1,68 @@
+"""
+Options Update.
+Version: 2026.5.0
+Classify the changes of the config entry options, so that the changes that
+can be applied to the running camera (floor selection, floor data, colours,
+transparency and drawn elements) do not reload the whole config entry.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+from custom_components.mqtt_vacuum_camera.const import (
+    CONF_CURRENT_FLOOR,
+    CONF_FLOORS_DATA,
+    CONF_MOP_PATH_WIDTH,
+    CONF_ROBOT_SIZE,
+    CONF_TRIMS_DATA,
+    CONF_VAC_STAT,
+    CONF_VAC_STAT_FONT,
+    CONF_VAC_STAT_POS,
+    CONF_VAC_STAT_SIZE,
+)
+
+FLOOR_OPTIONS = frozenset({CONF_CURRENT_FLOOR, CONF_FLOORS_DATA, CONF_TRIMS_DATA})
+# Colours, transparency, disabled elements and rooms (materials included).
+DRAWING_PREFIXES = ("color_", "alpha_", "disable_")
+DRAWING_OPTIONS = frozenset(
+    {
+        CONF_MOP_PATH_WIDTH,
+        CONF_ROBOT_SIZE,
+        CONF_VAC_STAT,
+        CONF_VAC_STAT_FONT,
+        CONF_VAC_STAT_POS,
+        CONF_VAC_STAT_SIZE,
+    }
+)
+
+
+def changed_options(old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """Return the option keys added, removed or changed."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def is_drawing_option(key: str) -> bool:
+    """Return True if the option only changes how the map is drawn."""
+    return key in DRAWING_OPTIONS or key.startswith(DRAWING_PREFIXES)
+
+
+def needs_reload(changed: set[str]) -> bool:
+    """Return True if a change can not be applied to the running camera."""
+    return not changed or any(
+        key not in FLOOR_OPTIONS and not is_drawing_option(key) for key in changed
+    )
+
+
+def floor_to_apply(old: Mapping[str, Any], new: Mapping[str, Any]) -> Optional[str]:
+    """Return the floor to activate: selected, or whose data changed."""
+    floor = new.get(CONF_CURRENT_FLOOR)
+    if not floor:
+        return None
+    if old.get(CONF_CURRENT_FLOOR) != floor:
+        return floor
+    old_floors = old.get(CONF_FLOORS_DATA) or {}
+    new_floors = new.get(CONF_FLOORS_DATA) or {}
+    if old_floors.get(floor) != new_floors.get(floor):
+        return floor
+    return None
@@ -0,0 +1,49 @@
+"""
+Startup Timings.
+Version: 2026.5.0
+Monotonic duration of each start-up phase of a camera entry (coordinator,
+shared data, MQTT subscriptions, processors, entity added to hass). The
+timings are kept with the entry data, shown in the diagnostics and logged in
+one debug line when the entry is set up.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import time
+from typing import Callable, Iterator
+
+
+class StartupTimings:
+    """Duration of the start-up phases of a camera entry."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started = clock()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the phase run in the with block (also when it fails)."""
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.phases[name] = self._clock() - started
+
+    def finish(self, name: str) -> float:
+        """Record the time since the start as the phase name and return it."""
+        elapsed = self.phases[name] = self._clock() - self._started
+        return elapsed
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the duration of the phases in milliseconds."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()}
+
+    def summary(self, file_name: str) -> str:
+        """Return the timings as a single log line."""
+        phases = ", ".join(
+            f"{name} {milliseconds:.1f} ms"
+            for name, milliseconds in self.as_dict().items()
+        )
+        return f"{file_name}: Start-up timings: {phases or 'none'}"
@@ -1,5 +1,5 @@
 """Collection of services for the vacuums and camera components.
-Last Updated on version: 2025.3.0b1
+Last Updated on version: 2026.5.0
 Autor: @sca075"""
 
 from functools import partial
@@ -12,6 +12,7 @@ import voluptuous as vol
 from ...common import (
     get_device_info_from_entity_id,
     get_entity_id,
+    get_vacuum_coordinator,
     get_vacuum_mqtt_topic,
     is_rand256_vacuum,
 )
@@ -131,6 +132,29 @@ async def vacuum_clean_segments(call: ServiceCall, coordinator) -> None:
         LOGGER.warning("Missing required parameter: %s", e, exc_info=True)
 
 
+def target_coordinator(call: ServiceCall, hass: HomeAssistant):
+    """Return the coordinator of the vacuum targeted by the call, if loaded."""
+    vacuum_entity_id = get_entity_id(
+        call.data.get("entity_id"), call.data.get("device_id"), hass
+    )
+    if isinstance(vacuum_entity_id, list):
+        vacuum_entity_id = vacuum_entity_id[0] if vacuum_entity_id else None
+    if not vacuum_entity_id:
+        return None
+    return get_vacuum_coordinator(hass, get_vacuum_mqtt_topic(vacuum_entity_id, hass))
+
+
+def validate_zones_in_rooms(coordinator, zones: list) -> str:
+    """Check with the room index of the map that each zone covers a room."""
+    for zone in zones:
+        if not all(isinstance(coord, (int, float)) for coord in zone):
+            continue
+        segments = coordinator.rooms.segments_in_zone(zone)
+        if segments is not None and not segments:
+            return "zone_outside_rooms"
+    return "No Errors"
+
+
 async def vacuum_clean_zone(call: ServiceCall, coordinator) -> None:
     """Vacuum Zone Clean Action"""
 
@@ -158,6 +182,11 @@ async def vacuum_clean_zone(call: ServiceCall, coordinator) -> None:
         zone_lists = zone_ids
     elif not isinstance(zone_ids, list):
         got_error = "zoneid_must_be_list"
+    if got_error == "No Errors" and zone_lists is not zone_ids:
+        # The services are shared: check the rooms of the targeted vacuum only.
+        vacuum_coordinator = target_coordinator(call, coordinator.hass)
+        if vacuum_coordinator is not None:
+            got_error = validate_zones_in_rooms(vacuum_coordinator, zone_lists)
 
     # Raise a ServiceValidationError if there are errors
     if got_error != "No Errors":
@@ -272,9 +301,18 @@ async def vacuum_goto(call: ServiceCall, coordinator) -> None:
                 context=call.context,
             )
             return
+        room = None
+        vacuum_coordinator = target_coordinator(call, coordinator.hass)
+        if vacuum_coordinator is not None and x_coord is not None:
+            room = vacuum_coordinator.rooms.room_at(x_coord, y_coord)
         coordinator.hass.bus.async_fire(
             f"event_{DOMAIN}.vacuum_go_to",
-            {"topic": service_data["topic"], "x": x_coord, "y": y_coord},
+            {
+                "topic": service_data["topic"],
+                "x": x_coord,
+                "y": y_coord,
+                "room": room,
+            },
             context=call.context,
         )
     except KeyError as e:
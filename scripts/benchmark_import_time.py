@@ -0,0 +1,110 @@
+"""
+Benchmark of the import time of the integration.
+Each module Home Assistant imports when loading the integration is imported
+in a fresh interpreter with -X importtime. The cumulative time of the module
+is reported with the heavy modules it loaded (isal), which are expected to
+be imported on first use only.
+
+The valetudo_map_parser package is measured first: the deferred modules that
+its own __init__ imports are loaded with any import of the library, so they
+are reported apart and can only be deferred in the library.
+
+Usage: python scripts/benchmark_import_time.py [--runs N] [--budget-ms MS]
+(run from the repository root with the requirements of manifest.json
+installed; exits with 1 when a module is over the budget or loads a deferred
+module the library does not load by itself)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE = "custom_components.mqtt_vacuum_camera"
+LIBRARY = "valetudo_map_parser"
+MODULES = (PACKAGE, f"{PACKAGE}.config_flow", f"{PACKAGE}.camera", f"{PACKAGE}.sensor")
+# Modules that must not be imported when loading the integration.
+DEFERRED = ("isal",)
+# Imported first: their time is the one of Home Assistant, not of the module.
+BASELINE = ("homeassistant.core", "homeassistant.helpers.entity", "aiohttp.web")
+
+CHILD = """
+import importlib, json, sys
+for name in {baseline!r}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+before = set(sys.modules)
+importlib.import_module({module!r})
+loaded = [name for name in {deferred!r} if name in sys.modules and name not in before]
+print(json.dumps(loaded))
+"""
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """Import a module in a new interpreter, return its time (ms) and loaded."""
+    code = CHILD.format(baseline=BASELINE, module=module, deferred=DEFERRED)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=False,
+        text=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative_us = int(parts[1])
+    return cumulative_us / 1000, json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    """Measure each module and check the budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"Import time, best of {args.runs} runs")
+    try:
+        library_ms, by_library = measure(LIBRARY)
+    except RuntimeError as err:
+        sys.exit(f"{LIBRARY} can not be imported: {err}")
+    print(
+        f"{LIBRARY:>45}: {library_ms:7.1f} ms"
+        f"{', loads ' + ', '.join(by_library) if by_library else ''}"
+    )
+    for module in MODULES:
+        timings = []
+        loaded: list[str] = []
+        try:
+            for _ in range(args.runs):
+                elapsed, loaded = measure(module)
+                timings.append(elapsed)
+        except RuntimeError as err:
+            print(f"{module:>45}: import failed: {err}")
+            failed = True
+            continue
+        best = min(timings)
+        over = args.budget_ms is not None and best > args.budget_ms
+        own = [name for name in loaded if name not in by_library]
+        failed = failed or over or bool(own)
+        print(
+            f"{module:>45}: {best:7.1f} ms"
+            f"{' (over budget)' if over else ''}"
+            f"{', loaded ' + ', '.join(own) if own else ''}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
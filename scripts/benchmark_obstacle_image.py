@@ -0,0 +1,124 @@
+"""
+Benchmark of the obstacle image processing.
+Compare the previous pipeline (full resolution decode, pad, PNG encode) with
+render_obstacle_image (draft decode near the map size, reducing gap resize,
+pad, PNG encode). Each pipeline runs in its own process to measure its peak
+memory.
+
+Usage: python scripts/benchmark_obstacle_image.py [image.jpg] [--runs N]
+(a synthetic 1920x1080 photo is used without image)
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+from io import BytesIO
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from PIL import Image, ImageOps
+
+# Loaded from its file: Home Assistant is not needed to run the benchmark.
+_SPEC = importlib.util.spec_from_file_location(
+    "obstacle_image",
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components/mqtt_vacuum_camera/utils/camera/obstacle_image.py",
+    ),
+)
+obstacle_image = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(obstacle_image)
+
+MAP_SIZE = (800, 600)
+ASPECT_RATIO = "16, 9"
+
+
+def sample_jpeg(size: tuple[int, int] = (1920, 1080)) -> bytes:
+    """Return a synthetic camera photo (JPEG)."""
+    image = Image.effect_mandelbrot(size, (-2.0, -1.2, 1.0, 1.2), 64)
+    image = image.convert("RGB")
+    noise = Image.effect_noise(size, 40).convert("RGB")
+    image = Image.blend(image, noise, 0.3)
+    buffered = BytesIO()
+    image.save(buffered, format="JPEG", quality=90)
+    return buffered.getvalue()
+
+
+def previous_pipeline(image_data: bytes) -> bytes:
+    """Full decode, pad to the aspect ratio at full size and encode."""
+    image = Image.open(BytesIO(image_data))
+    ratio = obstacle_image.parse_aspect_ratio(ASPECT_RATIO)
+    size = obstacle_image.padded_size(image.size, MAP_SIZE, ratio)
+    image = ImageOps.pad(image, size)
+    buffered = BytesIO()
+    image.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+def current_pipeline(image_data: bytes) -> bytes:
+    """The single job used by the camera."""
+    return obstacle_image.render_obstacle_image(image_data, *MAP_SIZE, ASPECT_RATIO)
+
+
+def run(mode: str, path: str, runs: int) -> None:
+    """Run one pipeline and print its timings and peak memory."""
+    with open(path, "rb") as image_file:
+        image_data = image_file.read()
+    func = previous_pipeline if mode == "previous" else current_pipeline
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = []
+    output = b""
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = func(image_data)
+        timings.append(time.perf_counter() - start)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss
+    timings.sort()
+    print(
+        f"{mode:>9}: median {timings[len(timings) // 2] * 1000:7.1f} ms, "
+        f"best {timings[0] * 1000:7.1f} ms, "
+        f"peak memory +{peak_rss / 1024:6.1f} MB, output {len(output) // 1024} kB"
+    )
+
+
+def main() -> None:
+    """Run both pipelines in separate processes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("image", nargs="?")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--mode", choices=["sample", "previous", "current"])
+    args = parser.parse_args()
+
+    if args.mode == "sample":
+        with open(args.image, "wb") as sample:
+            sample.write(sample_jpeg())
+        return
+    if args.mode:
+        run(args.mode, args.image, args.runs)
+        return
+
+    # Everything runs in child processes: the peak RSS (ru_maxrss) of this
+    # process would be inherited by them.
+    path = args.image
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), ".obstacle_sample.jpg")
+        subprocess.run([sys.executable, __file__, path, "--mode", "sample"], check=True)
+    with Image.open(path) as image:
+        width, height = image.size
+    print(f"Image {width}x{height}, map {MAP_SIZE}, {args.runs} runs")
+    for mode in ("previous", "current"):
+        subprocess.run(
+            [sys.executable, __file__, path, "--runs", str(args.runs), "--mode", mode],
+            check=True,
+        )
+    if args.image is None:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Tests for the cached camera attributes snapshot."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.camera_attributes import (
+    AttributesSnapshot,
+    compact_attributes,
+)
+
+FULL = {
+    "friendly_name": "Camera",
+    "calibration_points": [{"vacuum": {"x": 0, "y": 0}, "map": {"x": 0, "y": 0}}],
+    "rooms": {"1": {"name": "Kitchen"}, "2": {"name": "Hall"}},
+    "zones": [],
+    "obstacles": [{"label": "sock"}],
+}
+
+
+def test_compact_attributes():
+    """Large payloads are replaced by their counts."""
+    compact = compact_attributes(FULL, 3)
+    assert "rooms" not in compact and "obstacles" not in compact
+    assert compact["rooms_count"] == 2
+    assert compact["zones_count"] == 0
+    assert compact["obstacles_count"] == 1
+    assert compact["calibration_points"] == FULL["calibration_points"]
+    assert compact["attributes_version"] == 3
+
+
+def test_snapshot_rebuilt_only_when_the_key_changes():
+    """The same mapping is reused until the key changes."""
+    builds = []
+
+    def build():
+        builds.append(1)
+        return dict(FULL)
+
+    snapshot = AttributesSnapshot()
+    first = snapshot.compact(("etag", 1), build)
+    assert snapshot.compact(("etag", 1), build) is first
+    assert len(builds) == 1
+    assert snapshot.version == 1
+
+    # A new key with the same data keeps the mapping and the version.
+    assert snapshot.compact(("etag", 2), build) is first
+    assert len(builds) == 2
+    assert snapshot.version == 1
+
+
+def test_snapshot_version_and_full_attributes():
+    """Changed data bumps the version, full returns the large payloads."""
+    data = dict(FULL)
+    snapshot = AttributesSnapshot()
+    snapshot.compact(1, lambda: dict(data))
+    data["obstacles"] = []
+    compact = snapshot.compact(2, lambda: dict(data))
+    assert compact["obstacles_count"] == 0
+    assert compact["attributes_version"] == 2
+    snapshot.invalidate()
+    assert snapshot.full(2, lambda: dict(data))["rooms"] == FULL["rooms"]
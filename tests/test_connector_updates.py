@@ -0,0 +1,160 @@
+"""Tests for the push updates of the ValetudoConnector."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.mqtt_vacuum_camera.utils.connection.connector import (
+    ValetudoConnector,
+)
+
+
+def _make_connector(is_rand256=False):
+    """Build a ValetudoConnector with minimal mocks."""
+    shared = MagicMock()
+    shared.file_name = "test_vacuum"
+    with patch(
+        "custom_components.mqtt_vacuum_camera.utils.connection.connector.RoomStore"
+    ):
+        return ValetudoConnector(
+            mqtt_topic="valetudo/TestRobot",
+            hass=MagicMock(),
+            camera_shared=shared,
+            is_rand256=is_rand256,
+        )
+
+
+@pytest.mark.asyncio
+async def test_hypfer_notifies_only_on_change():
+    """Repeated status or battery payloads do not notify the listeners."""
+    connector = _make_connector()
+    listener = MagicMock()
+    connector.async_add_update_listener(listener)
+
+    await connector._hypfer_handle_status_payload("cleaning")
+    await connector._hypfer_handle_status_payload("cleaning")
+    await connector._hypfer_handle_battery_level("80")
+    await connector._hypfer_handle_battery_level("80")
+    assert listener.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rand256_statuses_and_unsubscribe():
+    """A state change notifies, a removed listener is not called anymore."""
+    connector = _make_connector(is_rand256=True)
+    listener = MagicMock()
+    remove_listener = connector.async_add_update_listener(listener)
+    msg = MagicMock()
+    msg.payload = json.dumps({"state": "cleaning", "battery_level": 90})
+
+    await connector.rand256_handle_statuses(msg)
+    await connector.rand256_handle_statuses(msg)
+    assert listener.call_count == 1
+
+    remove_listener()
+    msg.payload = json.dumps({"state": "docked", "battery_level": 90})
+    await connector.rand256_handle_statuses(msg)
+    assert listener.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hypfer_attachments_and_presets_notify():
+    """The values used by the Hypfer sensors notify when they change."""
+    connector = _make_connector()
+    connector.config.shared.mop_mode = False
+    listener = MagicMock()
+    connector.async_add_update_listener(listener)
+
+    await connector._hypfer_handle_mop_attachment("true")
+    await connector._hypfer_handle_mop_attachment("true")
+    await connector._hypfer_handle_water_usage("high")
+    await connector._hypfer_handle_dock_status("idle")
+    await connector._hypfer_handle_dock_status("idle")
+    assert listener.call_count == 3
+    assert await connector.get_mop_attachment_status() is True
+    assert await connector.get_water_usage() == "high"
+
+
+def test_topics_are_limited_to_the_firmware():
+    """Only the topics of the detected firmware are subscribed."""
+    hypfer = _make_connector().topics()
+    assert hypfer["valetudo/TestRobot/MapData/map-data"] is None
+    assert hypfer["valetudo/TestRobot/hass/TestRobot_vacuum/command"] is None
+    assert hypfer["valetudo/TestRobot/StatusStateAttribute/status"] == "utf-8"
+    assert "valetudo/TestRobot/map_data" not in hypfer
+    assert "valetudo/TestRobot/state" not in hypfer
+
+    rand256 = _make_connector(is_rand256=True).topics()
+    assert rand256["valetudo/TestRobot/map_data"] is None
+    assert rand256["valetudo/TestRobot/command"] == "utf-8"
+    assert "valetudo/TestRobot/MapData/map-data" not in rand256
+    for topics in (hypfer, rand256):
+        assert topics["homeassistant/vacuum/TestRobot/TestRobot_vacuum/config"]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_concurrently_and_keep_handlers():
+    """All the topics are subscribed, the first error is raised after."""
+    connector = _make_connector(is_rand256=True)
+    unsubscribe = MagicMock()
+
+    async def _subscribe(hass, topic, *_args, **_kwargs):
+        if topic.endswith("/attributes"):
+            raise ValueError("broker error")
+        return unsubscribe
+
+    with (
+        patch(
+            "custom_components.mqtt_vacuum_camera.utils.connection.connector"
+            ".mqtt.async_subscribe",
+            side_effect=_subscribe,
+        ),
+        pytest.raises(ValueError),
+    ):
+        await connector.async_subscribe_to_topics()
+    handlers = connector.connector_data.unsubscribe_handlers
+    assert len(handlers) == len(connector.topics()) - 1
+    await connector.async_unsubscribe_from_topics()
+    assert unsubscribe.call_count == len(handlers)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_by_topic():
+    """Messages reach the handler of their topic, unknown topics are ignored."""
+    connector = _make_connector()
+    connector.config.shared.camera_mode = "map_view"
+    connector.config.shared.battery_level = None
+    listener = MagicMock()
+    connector.async_add_update_listener(listener)
+    msg = MagicMock()
+    msg.topic = "valetudo/TestRobot/BatteryStateAttribute/level"
+    msg.payload = b"75"
+
+    with patch.object(connector, "_hypfer_handle_image_data") as handle_image:
+        await connector.async_message_received(msg)
+        msg.topic = "valetudo/TestRobot/unknown"
+        await connector.async_message_received(msg)
+        msg.topic = "valetudo/TestRobot/MapData/map-data"
+        connector.connector_data.ignore_data = True
+        await connector.async_message_received(msg)
+        handle_image.assert_not_called()
+    assert listener.call_count == 1
+    assert connector.connector_data.rcv_topic == msg.topic
+
+
+@pytest.mark.asyncio
+async def test_rooms_and_destinations_notify_on_change():
+    """New segments or destinations notify, so the attributes are rebuilt."""
+    connector = _make_connector()
+    listener = MagicMock()
+    connector.async_add_update_listener(listener)
+    msg = MagicMock()
+    msg.payload = json.dumps({"1": "Kitchen"})
+
+    await connector._hypfer_handle_map_segments(msg)
+    await connector._hypfer_handle_map_segments(msg)
+    msg.payload = json.dumps({"rooms": [{"id": 1, "name": "#Hall"}]})
+    await connector.rand256_handle_destinations(msg)
+    await connector.rand256_handle_destinations(msg)
+    assert listener.call_count == 2
@@ -0,0 +1,54 @@
+"""Tests for the obstacles contact sheet."""
+
+from io import BytesIO
+
+from PIL import Image
+
+from custom_components.mqtt_vacuum_camera.utils.camera.contact_sheet import (
+    LABEL_HEIGHT,
+    PADDING,
+    THUMBNAIL_SIZE,
+    contact_sheet_signature,
+    grid_shape,
+    render_contact_sheet,
+)
+
+
+def _jpeg(size):
+    buffered = BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffered, format="JPEG")
+    return buffered.getvalue()
+
+
+def test_grid_shape():
+    """Rows are added as needed, a short list uses fewer columns."""
+    assert grid_shape(1) == (1, 1)
+    assert grid_shape(4) == (4, 1)
+    assert grid_shape(9) == (4, 3)
+
+
+def test_signature_follows_the_obstacles():
+    """The signature changes when an obstacle is added or relabelled."""
+    obstacles = [{"link": "http://robot/1", "label": "sock"}]
+    same = [{"link": "http://robot/1", "label": "sock", "point": {"x": 1}}]
+    assert contact_sheet_signature(obstacles) == contact_sheet_signature(same)
+    assert contact_sheet_signature(obstacles) != contact_sheet_signature(
+        [{"link": "http://robot/1", "label": "cable"}]
+    )
+
+
+def test_render_contact_sheet():
+    """All the tiles fit in the sheet, missing images do not fail."""
+    items = [
+        ("sock", _jpeg((1920, 1080))),
+        ("cable", None),
+        ("shoe", b"not an image"),
+        ("pet waste", _jpeg((640, 480))),
+        ("cord", _jpeg((800, 600))),
+    ]
+    with Image.open(BytesIO(render_contact_sheet(items))) as sheet:
+        assert sheet.format == "PNG"
+        assert sheet.size == (
+            4 * (THUMBNAIL_SIZE[0] + 2 * PADDING),
+            2 * (THUMBNAIL_SIZE[1] + LABEL_HEIGHT + 2 * PADDING),
+        )
@@ -0,0 +1,55 @@
+"""Tests for the camera frame history ring buffer."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.frame_history import (
+    FrameHistory,
+)
+
+PNG = "image/png"
+
+
+def test_consecutive_duplicates_are_skipped():
+    """The same frame twice in a row is recorded once."""
+    history = FrameHistory()
+    assert history.add(b"frame-a", '"a"', 1.0, PNG)
+    assert not history.add(b"frame-a", '"a"', 2.0, PNG)
+    assert len(history) == 1
+
+
+def test_frames_are_stored_once_per_hash():
+    """A frame coming back later shares the stored bytes."""
+    history = FrameHistory()
+    history.add(b"frame-a", '"a"', 1.0, PNG)
+    history.add(b"frame-b", '"b"', 2.0, PNG)
+    history.add(b"frame-a", '"a"', 3.0, PNG)
+    stats = history.stats()
+    assert stats["frames"] == 3
+    assert stats["unique_frames"] == 2
+    assert stats["memory_bytes"] == len(b"frame-a") + len(b"frame-b")
+
+
+def test_caps_evict_oldest_frames():
+    """Frame count and memory caps drop the oldest frames first."""
+    history = FrameHistory(max_frames=2)
+    for position in range(4):
+        history.add(bytes([position]) * 10, f'"{position}"', float(position), PNG)
+    assert [frame["etag"] for frame in history.index()] == ['"2"', '"3"']
+
+    history = FrameHistory(max_bytes=25)
+    for position in range(4):
+        history.add(bytes([position]) * 10, f'"{position}"', float(position), PNG)
+    assert history.memory_usage <= 25
+    assert history.get_by_index(-1).etag == '"3"'
+
+
+def test_lookup_by_index_and_time():
+    """Frames are found by index (negative from newest) or by time."""
+    history = FrameHistory()
+    history.add(b"frame-a", '"a"', 10.0, PNG)
+    history.add(b"frame-b", '"b"', 20.0, PNG)
+    assert history.get_by_index(0).data == b"frame-a"
+    assert history.get_by_index(-1).data == b"frame-b"
+    assert history.get_by_index(5) is None
+    assert history.get_by_time(5.0) is None
+    assert history.get_by_time(15.0).etag == '"a"'
+    assert history.get_by_time(25.0).etag == '"b"'
+    assert history.get_by_etag('"a"').timestamp == 10.0
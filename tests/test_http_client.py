@@ -0,0 +1,117 @@
+"""Tests for the robot HTTP client used for the obstacle images."""
+
+from unittest.mock import MagicMock, patch
+
+from aiohttp import hdrs
+import pytest
+
+from custom_components.mqtt_vacuum_camera.const import ROBOT_HTTP_CONNECT_TIMEOUT_S
+from custom_components.mqtt_vacuum_camera.utils.connection import http_client
+from custom_components.mqtt_vacuum_camera.utils.connection.http_client import (
+    ResponseTooLarge,
+    RobotHttpClient,
+    read_limited,
+    robot_base_url,
+)
+
+
+class _Content:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, _size):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _Response:
+    def __init__(self, chunks, content_length=None, headers=None):
+        self.content = _Content(chunks)
+        self.content_length = content_length
+        self.headers = headers or {}
+
+
+def test_robot_base_url():
+    """The URL is built from the obstacle link options."""
+    assert robot_base_url({"obstacle_link_ip": ""}) is None
+    assert (
+        robot_base_url(
+            {
+                "obstacle_link_protocol": "http",
+                "obstacle_link_ip": "192.168.1.20",
+                "obstacle_link_port": 80,
+            }
+        )
+        == "http://192.168.1.20/"
+    )
+    assert (
+        robot_base_url(
+            {
+                "obstacle_link_protocol": "https",
+                "obstacle_link_ip": "robot.local",
+                "obstacle_link_port": 8443,
+            }
+        )
+        == "https://robot.local:8443/"
+    )
+
+
+def test_resolve_relative_links():
+    """Relative links use the robot URL, absolute ones are unchanged."""
+    client = RobotHttpClient("vacuum", {"obstacle_link_ip": "10.0.0.2"})
+    assert client.resolve("/api/v2/image/1") == "http://10.0.0.2/api/v2/image/1"
+    assert client.resolve("http://other/img.jpg") == "http://other/img.jpg"
+
+
+async def test_read_limited_with_content_length():
+    """The body is assembled in the preallocated buffer."""
+    response = _Response([b"abc", b"def"], content_length=6)
+    assert await read_limited(response, 10) == b"abcdef"
+
+
+async def test_read_limited_without_content_length():
+    """Chunked responses are read up to the limit."""
+    assert await read_limited(_Response([b"ab", b"cd"]), 4) == b"abcd"
+    with pytest.raises(ResponseTooLarge):
+        await read_limited(_Response([b"ab", b"cde"]), 4)
+
+
+async def test_read_limited_rejects_large_or_inconsistent_bodies():
+    """Too large announced sizes or extra data are refused."""
+    with pytest.raises(ResponseTooLarge):
+        await read_limited(_Response([b"x"], content_length=100), 10)
+    with pytest.raises(ResponseTooLarge):
+        await read_limited(_Response([b"abc", b"def"], content_length=4), 10)
+
+
+async def test_read_limited_with_content_encoding():
+    """A compressed Content-Length is not the size of the decoded body."""
+    response = _Response(
+        [b"abc", b"def"], content_length=4, headers={hdrs.CONTENT_ENCODING: "gzip"}
+    )
+    assert await read_limited(response, 10) == b"abcdef"
+    response = _Response(
+        [b"abc", b"def"], content_length=4, headers={hdrs.CONTENT_ENCODING: "gzip"}
+    )
+    with pytest.raises(ResponseTooLarge):
+        await read_limited(response, 5)
+
+
+async def test_download_keeps_the_connect_timeout():
+    """The per-request timeout still limits the connection to the robot."""
+    client = RobotHttpClient("vacuum", {"obstacle_link_ip": "10.0.0.2"})
+    response = _Response([b"jpeg"], content_length=4)
+    response.status = 200
+    request = MagicMock()
+    request.__aenter__.return_value = response
+    session = MagicMock()
+    session.get.return_value = request
+    with (
+        patch.object(client, "_get_session", return_value=session),
+        patch.object(http_client.aiohttp, "ClientTimeout") as client_timeout,
+    ):
+        assert await client.async_download("/api/v2/image/1", 3) == b"jpeg"
+    client_timeout.assert_called_once_with(
+        total=3, connect=ROBOT_HTTP_CONNECT_TIMEOUT_S
+    )
+    assert session.get.call_args.kwargs["timeout"] is client_timeout.return_value
@@ -0,0 +1,52 @@
+"""Tests for the conditional-GET camera image view helpers."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.image_view import (
+    frame_etag,
+    http_date,
+    is_not_modified,
+)
+
+FRAME = b"\xff\xd8jpeg-bytes\xff\xd9"
+MODIFIED_AT = 1_760_000_000.0
+
+
+def test_frame_etag_is_stable_and_quoted():
+    """The same bytes always produce the same strong ETag."""
+    etag = frame_etag(FRAME)
+    assert etag == frame_etag(bytes(FRAME))
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != frame_etag(FRAME + b"\x00")
+
+
+def test_if_none_match_matches_current_etag():
+    """A matching If-None-Match (also weak or in a list) is not modified."""
+    etag = frame_etag(FRAME)
+    assert is_not_modified({"If-None-Match": etag}, etag, MODIFIED_AT)
+    assert is_not_modified({"If-None-Match": f'"x", W/{etag}'}, etag, MODIFIED_AT)
+    assert is_not_modified({"If-None-Match": "*"}, etag, MODIFIED_AT)
+    assert not is_not_modified({"If-None-Match": '"other"'}, etag, MODIFIED_AT)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    """A stale ETag wins over a fresh If-Modified-Since."""
+    headers = {
+        "If-None-Match": '"stale"',
+        "If-Modified-Since": http_date(MODIFIED_AT + 60),
+    }
+    assert not is_not_modified(headers, frame_etag(FRAME), MODIFIED_AT)
+
+
+def test_if_modified_since():
+    """If-Modified-Since compares at one second resolution."""
+    assert is_not_modified(
+        {"If-Modified-Since": http_date(MODIFIED_AT)}, None, MODIFIED_AT + 0.5
+    )
+    assert not is_not_modified(
+        {"If-Modified-Since": http_date(MODIFIED_AT - 10)}, None, MODIFIED_AT
+    )
+    assert not is_not_modified({"If-Modified-Since": "garbage"}, None, MODIFIED_AT)
+
+
+def test_no_conditional_headers():
+    """Plain requests always get the full frame."""
+    assert not is_not_modified({}, frame_etag(FRAME), MODIFIED_AT)
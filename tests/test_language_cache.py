@@ -0,0 +1,57 @@
+"""Tests for the language cache."""
+
+import json
+from types import SimpleNamespace
+
+from custom_components.mqtt_vacuum_camera.utils import language_cache
+from custom_components.mqtt_vacuum_camera.utils.language_cache import LanguageCache
+
+
+class FakeUserLanguageStore:
+    """In-memory replacement of the parser user language store."""
+
+    languages = {}
+
+    async def set_user_language(self, user_id, language):
+        """Store the language of a user."""
+        self.languages[user_id] = language
+
+
+def _write_user_data(path, user_id, data):
+    """Write the frontend data file of a user."""
+    (path / f"frontend.user_data_{user_id}").write_text(json.dumps(data))
+
+
+def test_read_user_languages(tmp_path):
+    """The user data files are read together, broken data defaults to en."""
+    _write_user_data(tmp_path, "a", {"data": {"language": {"language": "it"}}})
+    _write_user_data(tmp_path, "b", {"data": {}})
+    languages = LanguageCache._read_user_languages(  # pylint: disable=protected-access
+        str(tmp_path), ["a", "b", "missing"]
+    )
+    assert languages == {"a": "it", "b": "en"}
+
+
+async def test_active_user_language_is_cached(tmp_path, monkeypatch):
+    """The active user is looked up once per TTL or after a user event."""
+    monkeypatch.setattr(language_cache, "UserLanguageStore", FakeUserLanguageStore)
+    _write_user_data(tmp_path, "a", {"data": {"language": {"language": "de"}}})
+    lookups = []
+
+    async def find_user(_hass):
+        lookups.append(1)
+        return "a"
+
+    cache = LanguageCache.get_instance()
+    monkeypatch.setattr(cache, "_find_last_logged_in_user", find_user)
+    monkeypatch.setattr(cache, "_active_checked_at", None)
+    hass = SimpleNamespace(config=SimpleNamespace(path=lambda *_: str(tmp_path)))
+
+    assert await cache.get_active_user_language(hass) == "de"
+    assert await cache.get_active_user_language(hass) == "de"
+    assert len(lookups) == 1
+    assert FakeUserLanguageStore.languages["a"] == "de"
+
+    cache._async_users_changed(None)  # pylint: disable=protected-access
+    assert await cache.get_active_user_language(hass) == "de"
+    assert len(lookups) == 2
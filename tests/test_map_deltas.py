@@ -0,0 +1,89 @@
+"""Tests for the parsed map helpers and the websocket map deltas."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.map_data import (
+    compute_map_hash,
+    extract_entities,
+    extract_static_layers,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.map_deltas import (
+    compute_delta,
+    path_delta,
+)
+
+HYPFER_MAP = {
+    "pixelSize": 5,
+    "size": {"x": 5000, "y": 5000},
+    "layers": [
+        {"type": "floor", "compressedPixels": [10, 10, 5, 10, 11, 5]},
+        {
+            "type": "segment",
+            "compressedPixels": [20, 20, 3],
+            "metaData": {"segmentId": "1", "name": "Kitchen"},
+        },
+    ],
+    "entities": [
+        {"type": "robot_position", "points": [100, 200], "metaData": {"angle": 90}},
+        {"type": "charger_location", "points": [50, 50]},
+        {"type": "path", "points": [0, 0, 10, 10]},
+    ],
+}
+
+
+def test_map_hash_ignores_entities():
+    """Moving the robot does not change the map hash, editing a layer does."""
+    moved = dict(HYPFER_MAP, entities=[])
+    assert compute_map_hash(HYPFER_MAP, False) == compute_map_hash(moved, False)
+    edited = dict(HYPFER_MAP, layers=HYPFER_MAP["layers"][:1])
+    assert compute_map_hash(HYPFER_MAP, False) != compute_map_hash(edited, False)
+
+
+def test_extract_hypfer_map():
+    """Entities and layers are normalised."""
+    entities = extract_entities(HYPFER_MAP, False)
+    assert entities["robot"] == {"x": 100, "y": 200, "angle": 90}
+    assert entities["charger"] == {"x": 50, "y": 50}
+    assert entities["path"] == [[0, 0, 10, 10]]
+    static = extract_static_layers(HYPFER_MAP, False)
+    assert static["format"] == "hypfer"
+    assert static["layers"][1]["name"] == "Kitchen"
+    assert static["layers"][1]["runs"] == [20, 20, 3]
+
+
+def test_extract_rand256_layers_as_runs():
+    """Rand256 pixel indices become run-length rows."""
+    parsed = {
+        "image": {
+            "pixels": {"floor": [0, 1, 2, 5], "walls": []},
+            "position": {"top": 1, "left": 2},
+            "dimensions": {"width": 4, "height": 2},
+        },
+        "robot": [1000, 2000],
+        "path": {"points": [[1, 2], [3, 4]]},
+    }
+    static = extract_static_layers(parsed, True)
+    assert static["layers"][0]["runs"] == [2, 1, 3, 3, 2, 1]
+    assert extract_entities(parsed, True)["path"] == [[1, 2, 3, 4]]
+
+
+def test_path_delta_appends_tail():
+    """Only the new points of the path are sent."""
+    old = [[0, 0, 10, 10]]
+    assert path_delta(old, [[0, 0, 10, 10, 20, 20]]) == {
+        "index": 0,
+        "points": [20, 20],
+        "polylines": [],
+    }
+    assert path_delta(old, [[0, 0, 10, 10], [30, 30]])["polylines"] == [[30, 30]]
+    # A new cleaning run replaces the path.
+    assert path_delta(old, [[5, 5]]) is None
+
+
+def test_compute_delta_only_changed_keys():
+    """Unchanged entities are not part of the delta."""
+    previous = extract_entities(HYPFER_MAP, False)
+    current = extract_entities(HYPFER_MAP, False)
+    assert not compute_delta(previous, current)
+    current["robot"] = {"x": 110, "y": 200, "angle": 90}
+    current["path"] = [[0, 0, 10, 10, 110, 200]]
+    changed = compute_delta(previous, current)
+    assert set(changed) == {"robot", "path_append"}
@@ -0,0 +1,112 @@
+"""Tests for the map archive used for the warm start and the floor switch."""
+
+import json
+
+from custom_components.mqtt_vacuum_camera.utils.camera.map_store import (
+    RECORD_HEADER,
+    decode_record,
+    encode_map,
+    encode_record,
+    load_index,
+    pack_record,
+    read_index,
+    read_record,
+)
+from custom_components.mqtt_vacuum_camera.utils.files_operations import write_atomic
+
+PARSED_MAP = {"pixelSize": 5, "layers": [{"type": "floor", "compressedPixels": [1]}]}
+# Structure of the RRMapParser output (Rand256), with its tuples and nested lists.
+RAND256_MAP = {
+    "header": {"map_index": 3, "map_sequence": 41},
+    "charger": [25600, 25600],
+    "robot": [25850, 26320],
+    "robot_angle": 87,
+    "image": {
+        "segments": {
+            "count": 2,
+            "id": [16, 17],
+            "pixels_seg_16": [(120, 80), (121, 80), (122, 80)],
+            "pixels_seg_17": [(140, 90)],
+        },
+        "position": {"top": 153, "left": 202},
+        "dimensions": {"height": 320, "width": 410},
+        "pixels": {"floor": [(1, 2, 3)], "walls": [(4, 5, 6)], "segments": []},
+    },
+    "path": {"current_angle": 87, "points": [[25600, 25600], [25700, 25610]]},
+    "goto_target": None,
+    "currently_cleaned_zones": [[25000, 25000, 26000, 26000]],
+    "forbidden_zones": [[24000, 24000, 24500, 24000, 24500, 24500, 24000, 24500]],
+    "virtual_walls": [[24000, 26000, 25000, 26000]],
+    "currently_cleaned_blocks": [16],
+}
+
+
+def test_record_round_trip():
+    """The parsed map and its data type are restored unchanged."""
+    record = encode_record(PARSED_MAP, "Hypfer")
+    assert record[:4] == b"MVCA"
+    assert decode_record(record) == (PARSED_MAP, "Hypfer")
+
+
+def test_rand256_record_round_trip():
+    """The Rand256 parsed map comes back with its tuples as lists."""
+    parsed, data_type = decode_record(encode_record(RAND256_MAP, "Rand256"))
+    assert data_type == "Rand256"
+    assert parsed == json.loads(json.dumps(RAND256_MAP))
+    assert parsed["image"]["segments"]["pixels_seg_16"][0] == [120, 80]
+
+
+def test_encoded_map_is_a_snapshot():
+    """The JSON is taken before the parsed map is changed by a new render."""
+    parsed = {"robot": [1, 2], "blocks": {16}}
+    body = encode_map(parsed)
+    parsed["robot"][0] = 99
+    assert decode_record(pack_record(body, "Rand256"))[0] == {
+        "robot": [1, 2],
+        "blocks": [16],
+    }
+
+
+def test_record_is_compressed():
+    """Repetitive map data is stored compressed."""
+    parsed = {"pixels": list(range(100)) * 100}
+    record = encode_record(parsed, "Hypfer")
+    assert len(record) < len(json.dumps(parsed)) // 4
+
+
+def test_write_atomic_replaces_file(tmp_path):
+    """The file is replaced and no temporary file is left behind."""
+    target = tmp_path / "map_archive" / "floor_0.map"
+    write_atomic(target, encode_record({"first": 1}, "Hypfer"))
+    write_atomic(target, encode_record(PARSED_MAP, "Hypfer"))
+    assert read_record(target) == (PARSED_MAP, "Hypfer")
+    assert [path.name for path in target.parent.iterdir()] == [target.name]
+
+
+def test_missing_or_corrupt_files(tmp_path):
+    """Missing or corrupt records and index are ignored."""
+    assert read_record(tmp_path / "missing.map") is None
+    corrupt = tmp_path / "corrupt.map"
+    corrupt.write_bytes(b"not a record")
+    assert read_record(corrupt) is None
+    corrupt.write_bytes(RECORD_HEADER.pack(b"MVCA", 1, 0, 0) + b"not zlib")
+    assert read_record(corrupt) is None
+
+    assert read_index(tmp_path / "index.json") == {}
+    index = tmp_path / "index.json"
+    index.write_text("{")
+    assert read_index(index) == {}
+    index.write_text(json.dumps({"floors": {"floor_0": {"file": "floor_0.map"}}}))
+    assert read_index(index) == {"floor_0": {"file": "floor_0.map"}}
+
+
+def test_legacy_last_map_folder_is_removed(tmp_path):
+    """The raw payloads of the earlier format are deleted with the first read."""
+    legacy = tmp_path / "last_map"
+    legacy.mkdir()
+    (legacy / "robot_floor_0.map").write_bytes(b"payload")
+    folder = tmp_path / "map_archive" / "robot"
+    folder.mkdir(parents=True)
+    (folder / "index.json").write_text(json.dumps({"floors": {"floor_0": {}}}))
+    assert load_index(folder) == {"floor_0": {}}
+    assert not legacy.exists()
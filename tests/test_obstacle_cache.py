@@ -0,0 +1,70 @@
+"""Tests for the obstacle images cache (memory + disk LRU)."""
+
+from unittest.mock import MagicMock
+
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_cache import (
+    ObstacleImageCache,
+    obstacle_key,
+    view_variant,
+)
+
+
+def _hass(tmp_path):
+    """Minimal hass running the executor jobs inline."""
+    hass = MagicMock()
+    hass.config.path.side_effect = lambda *parts: str(tmp_path.joinpath(*parts))
+
+    async def add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = add_executor_job
+    return hass
+
+
+def test_obstacle_key_and_variant():
+    """The key follows the link, the variant is a safe file name part."""
+    assert obstacle_key({"link": "http://robot/a.jpg"}) == obstacle_key(
+        {"link": "http://robot/a.jpg", "label": "sock"}
+    )
+    assert obstacle_key({"link": "a"}) != obstacle_key({"link": "b"})
+    assert obstacle_key({"label": "sock"}) is None
+    assert view_variant(640, 480, "16:9") == "view_640x480_16-9"
+
+
+async def test_memory_lru_eviction(tmp_path):
+    """The least recently used images leave the memory first."""
+    cache = ObstacleImageCache(_hass(tmp_path), "vacuum", memory_bytes=10)
+    await cache.async_put("a", b"aaaa")
+    await cache.async_put("b", b"bbbb")
+    assert await cache.async_get("a") == b"aaaa"  # "a" is now the most recent
+    await cache.async_put("c", b"cccc")
+    assert cache.stats()["memory_items"] == 2
+    cache.clear_memory()
+    # Still served from disk.
+    assert await cache.async_get("b") == b"bbbb"
+
+
+async def test_disk_cache_survives_restart(tmp_path):
+    """A new cache instance finds the images stored on disk."""
+    await ObstacleImageCache(_hass(tmp_path), "vacuum").async_put(
+        "key", b"original"
+    )
+    await ObstacleImageCache(_hass(tmp_path), "vacuum").async_put(
+        "key", b"view", "view_640x480_16-9"
+    )
+    cache = ObstacleImageCache(_hass(tmp_path), "vacuum")
+    assert await cache.async_get("key") == b"original"
+    assert await cache.async_get("key", "view_640x480_16-9") == b"view"
+    assert await cache.async_get("other") is None
+
+
+async def test_disk_lru_eviction(tmp_path):
+    """The disk usage stays under the limit."""
+    cache = ObstacleImageCache(_hass(tmp_path), "vacuum", disk_bytes=10)
+    for key in ("a", "b", "c"):
+        await cache.async_put(key, key.encode() * 4)
+    assert sorted(path.name for path in tmp_path.rglob("*_original")) == [
+        "b_original",
+        "c_original",
+    ]
+    assert cache.stats()["disk_bytes"] == 8
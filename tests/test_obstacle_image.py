@@ -0,0 +1,49 @@
+"""Tests for the obstacle image processing job."""
+
+from io import BytesIO
+
+from PIL import Image
+
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_image import (
+    fitted_size,
+    padded_size,
+    parse_aspect_ratio,
+    render_obstacle_image,
+)
+
+
+def _jpeg(size):
+    buffered = BytesIO()
+    Image.new("RGB", size, (120, 80, 40)).save(buffered, format="JPEG")
+    return buffered.getvalue()
+
+
+def test_parse_aspect_ratio():
+    """Options like "16, 9" are parsed, "None" or invalid values ignored."""
+    assert parse_aspect_ratio("16, 9") == (16, 9)
+    assert parse_aspect_ratio("None") is None
+    assert parse_aspect_ratio("0, 9") is None
+    assert parse_aspect_ratio("wide") is None
+
+
+def test_fitted_and_padded_sizes():
+    """The image fits the map size and is padded to the aspect ratio."""
+    assert fitted_size((1920, 1080), (800, 600)) == (800, 450)
+    assert fitted_size((320, 240), (800, 600)) == (320, 240)
+    assert padded_size((800, 450), (800, 600), (4, 3)) == (800, 600)
+    assert padded_size((800, 600), (1920, 1000), (16, 9)) == (1066, 600)
+
+
+def test_render_downscales_and_pads():
+    """A large photo comes out at the map size, as PNG."""
+    output = render_obstacle_image(_jpeg((1920, 1080)), 800, 600, "4, 3")
+    with Image.open(BytesIO(output)) as image:
+        assert image.format == "PNG"
+        assert image.size == (800, 600)
+
+
+def test_render_without_map_size_keeps_the_image():
+    """Before the first map the image keeps its size."""
+    output = render_obstacle_image(_jpeg((640, 480)), 0, 0, "16, 9")
+    with Image.open(BytesIO(output)) as image:
+        assert image.size == (640, 480)
@@ -0,0 +1,62 @@
+"""Tests for the obstacle grid index."""
+
+import math
+import random
+
+from custom_components.mqtt_vacuum_camera.utils.camera.obstacle_index import (
+    ObstacleIndex,
+)
+
+
+def _obstacles(count: int, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "label": f"o{index}",
+            "point": {"x": rng.randint(0, 1000), "y": rng.randint(0, 800)},
+        }
+        for index in range(count)
+    ]
+
+
+def _linear_nearest(x, y, obstacles, radius):
+    nearest, best = None, radius
+    for obstacle in obstacles:
+        distance = math.hypot(x - obstacle["point"]["x"], y - obstacle["point"]["y"])
+        if distance < best:
+            nearest, best = obstacle, distance
+    return nearest
+
+
+def test_nearest_matches_linear_scan():
+    """The index returns the same obstacle as the previous linear scan."""
+    obstacles = _obstacles(500)
+    index = ObstacleIndex(obstacles, 65)
+    rng = random.Random(7)
+    for _ in range(300):
+        x, y = rng.randint(-50, 1050), rng.randint(-50, 850)
+        assert index.nearest(x, y, 65) is _linear_nearest(x, y, obstacles, 65)
+
+
+def test_k_nearest_sorted_and_bounded():
+    """k-nearest returns the closest obstacles in order, within the radius."""
+    obstacles = _obstacles(200)
+    index = ObstacleIndex(obstacles, 40)
+    result = index.k_nearest(500, 400, 5)
+    expected = sorted(
+        math.hypot(500 - o["point"]["x"], 400 - o["point"]["y"]) for o in obstacles
+    )[:5]
+    assert [distance for distance, _ in result] == expected
+    assert all(distance < 30 for distance, _ in index.k_nearest(500, 400, 50, 30))
+
+
+def test_batch_and_cache():
+    """Batch queries reuse the index built for the same list."""
+    obstacles = _obstacles(50)
+    index = ObstacleIndex.for_obstacles(obstacles, 65)
+    assert ObstacleIndex.for_obstacles(obstacles, 65) is index
+    points = [(10, 10), (500, 500), (2000, 2000)]
+    assert index.nearest_many(points, 65) == [
+        _linear_nearest(x, y, obstacles, 65) for x, y in points
+    ]
+    assert ObstacleIndex([], 65).nearest(1, 1, 65) is None
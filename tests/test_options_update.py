@@ -0,0 +1,53 @@
+"""Tests for the classification of the options updates."""
+
+from custom_components.mqtt_vacuum_camera.utils.options.options_update import (
+    changed_options,
+    floor_to_apply,
+    is_drawing_option,
+    needs_reload,
+)
+
+FLOORS = {
+    "floor_0": {"trims": {"floor": "floor_0", "trim_up": 1}},
+    "floor_1": {"trims": {"floor": "floor_1", "trim_up": 2}},
+}
+OPTIONS = {"current_floor": "floor_0", "floors_data": FLOORS, "color_wall": [0, 0, 0]}
+
+
+def test_floor_selection_is_applied_in_place():
+    """Selecting another floor does not need a reload."""
+    new = {**OPTIONS, "current_floor": "floor_1"}
+    assert changed_options(OPTIONS, new) == {"current_floor"}
+    assert not needs_reload(changed_options(OPTIONS, new))
+    assert floor_to_apply(OPTIONS, new) == "floor_1"
+
+
+def test_floor_data_changes():
+    """Only the data of the active floor is applied again."""
+    other = {**FLOORS, "floor_1": {"trims": {"floor": "floor_1", "trim_up": 5}}}
+    new = {**OPTIONS, "floors_data": other}
+    assert not needs_reload(changed_options(OPTIONS, new))
+    assert floor_to_apply(OPTIONS, new) is None
+
+    current = {**FLOORS, "floor_0": {"trims": {"floor": "floor_0", "trim_up": 5}}}
+    assert floor_to_apply(OPTIONS, {**OPTIONS, "floors_data": current}) == "floor_0"
+
+
+def test_drawing_options_are_applied_in_place():
+    """Colours, transparency and disabled elements do not need a reload."""
+    for key in ("color_wall", "alpha_room_3", "disable_obstacles", "robot_size"):
+        assert is_drawing_option(key)
+    new = {**OPTIONS, "current_floor": "floor_1", "color_wall": [1, 1, 1]}
+    assert not needs_reload(changed_options(OPTIONS, new))
+
+
+def test_other_options_reload():
+    """Any other change, or no change at all, needs a reload."""
+    assert not is_drawing_option("def_context_type")
+    new = {**OPTIONS, "color_wall": [1, 1, 1], "obstacle_link_ip": "10.0.0.2"}
+    assert needs_reload(changed_options(OPTIONS, new))
+    assert needs_reload(changed_options(OPTIONS, dict(OPTIONS)))
+    assert changed_options(OPTIONS, {"current_floor": "floor_0"}) == {
+        "floors_data",
+        "color_wall",
+    }
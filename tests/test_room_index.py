@@ -0,0 +1,87 @@
+"""Tests for the room index raster."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.room_index import (
+    RoomIndex,
+    RoomIndexCache,
+)
+
+# Kitchen 40x20 px from (10, 10), hall 20x20 px on its right (pixelSize 5).
+HYPFER_MAP = {
+    "pixelSize": 5,
+    "size": {"x": 5000, "y": 5000},
+    "layers": [
+        {
+            "type": "segment",
+            "compressedPixels": [run for y in range(10, 30) for run in (10, y, 40)],
+            "metaData": {"segmentId": "1", "name": "Kitchen"},
+        },
+        {
+            "type": "segment",
+            "compressedPixels": [run for y in range(10, 30) for run in (50, y, 20)],
+            "metaData": {"segmentId": "2", "name": "Hall"},
+        },
+        {"type": "wall", "compressedPixels": [9, 9, 62]},
+    ],
+    "entities": [],
+}
+
+RAND256_MAP = {
+    "image": {
+        "position": {"left": 0, "top": 0},
+        "dimensions": {"width": 100, "height": 100},
+        "pixels": {"floor": [], "walls": []},
+        "segments": {"id": [16], "pixels_seg_16": [1010, 1011, 1110, 1111]},
+    },
+}
+
+
+def test_room_lookup():
+    """Positions in map units resolve to the segment under them."""
+    index = RoomIndex.build(HYPFER_MAP, False)
+    assert index.segment_ids == ["1", "2"]
+    assert index.room_at(100, 100) == {"segment_id": "1", "name": "Kitchen"}
+    assert index.segment_at(300, 100) == "2"
+    assert index.segment_at(10, 10) is None
+    assert index.segment_at(10000, 100) is None
+    assert index.cell_counts() == {"1": 200, "2": 100}
+
+
+def test_segments_in_zone():
+    """A zone returns the segments under its bounding box."""
+    index = RoomIndex.build(HYPFER_MAP, False)
+    assert index.segments_in_zone([100, 100, 300, 120]) == {"1", "2"}
+    assert index.segments_in_zone([100, 100, 120, 120]) == {"1"}
+    assert index.segments_in_zone([1000, 1000, 1200, 1200]) == set()
+
+
+def test_rand256_segments():
+    """Rand256 segment pixels are indexed with the 50 mm grid."""
+    index = RoomIndex.build(RAND256_MAP, True)
+    assert index.segment_at(10 * 50, 10 * 50) == "16"
+    assert index.segment_at(0, 0) is None
+
+
+def test_cache_rebuilds_on_map_change():
+    """The index is kept for the same map and names are merged."""
+    cache = RoomIndexCache(False)
+    assert cache.room_at(100, 100) is None
+    assert cache.segments_in_zone([0, 0, 10, 10]) is None
+    index = cache.update(HYPFER_MAP)
+    assert cache.update(dict(HYPFER_MAP)) is index
+    cache.locate_robot({"x": 300, "y": 100})
+    assert cache.robot_room == {"segment_id": "2", "name": "Hall"}
+
+    rand = RoomIndexCache(True)
+    rand.set_names({"16": "Bedroom"})
+    rand.update(RAND256_MAP)
+    assert rand.room_at(500, 500)["name"] == "Bedroom"
+
+
+def test_build_does_not_change_the_cache():
+    """The index is built off the event loop and only applied by set_index."""
+    cache = RoomIndexCache(False)
+    map_hash, index = cache.build(HYPFER_MAP)
+    assert cache.index is None
+    assert cache.set_index(map_hash, index) is index
+    assert cache.build(dict(HYPFER_MAP)) == (map_hash, None)
+    assert cache.set_index(map_hash, None) is index
@@ -0,0 +1,104 @@
+"""Tests for the incremental cleaning session analytics."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera import session_analytics
+from custom_components.mqtt_vacuum_camera.utils.camera.map_data import (
+    extract_entities,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.room_index import RoomIndex
+from custom_components.mqtt_vacuum_camera.utils.camera.session_analytics import (
+    SessionAnalytics,
+)
+
+
+def hypfer_map(path, robot=None):
+    """Return a Hypfer map with a 40x20 px kitchen and a 20x20 px hall."""
+    kitchen = [run for y in range(20) for run in (0, y, 40)]
+    hall = [run for y in range(20) for run in (40, y, 20)]
+    entities = [{"type": "path", "points": list(points)} for points in path]
+    if robot:
+        entities.append({"type": "robot_position", "points": robot})
+    return {
+        "pixelSize": 5,
+        "size": {"x": 5000, "y": 5000},
+        "layers": [
+            {
+                "type": "segment",
+                "compressedPixels": kitchen,
+                "metaData": {"segmentId": "1", "name": "Kitchen"},
+            },
+            {
+                "type": "segment",
+                "compressedPixels": hall,
+                "metaData": {"segmentId": "2", "name": "Hall"},
+            },
+        ],
+        "entities": entities,
+    }
+
+
+def update(analytics, parsed_json, vacuum_state):
+    """Update the analytics as the camera does."""
+    rooms = RoomIndex.build(parsed_json, False)
+    entities = extract_entities(parsed_json, False)
+    return analytics.update(entities, vacuum_state, rooms)
+
+
+def test_distance_and_coverage():
+    """A straight line through the kitchen: distance, area and coverage."""
+    analytics = SessionAnalytics()
+    update(analytics, hypfer_map([[25, 50, 175, 50]]), "cleaning")
+    metrics = analytics.metrics()
+    # 30 grid px of 5 cm.
+    assert metrics["session_distance"] == 1.5
+    assert metrics["session_area"] > 0
+    kitchen = metrics["session_rooms"]["Kitchen"]
+    assert 0 < kitchen["coverage"] < 100
+    assert metrics["session_rooms"]["Hall"]["coverage"] == 0
+
+
+def test_only_new_points_are_processed(monkeypatch):
+    """The path already seen is not processed again."""
+    analytics = SessionAnalytics()
+    path = [0, 50, 50, 50]
+    update(analytics, hypfer_map([path]), "cleaning")
+    segments = []
+    add_segment = SessionAnalytics._add_segment
+
+    def counting(self, session, start, end):
+        segments.append((start, end))
+        add_segment(self, session, start, end)
+
+    monkeypatch.setattr(SessionAnalytics, "_add_segment", counting)
+    update(analytics, hypfer_map([path + [100, 50]]), "cleaning")
+    assert segments == [((10.0, 10.0), (20.0, 10.0))]
+    update(
+        analytics, hypfer_map([path + [100, 50], [100, 75, 100, 100]]), "cleaning"
+    )
+    assert len(segments) == 2
+    assert analytics.metrics()["session_distance"] == 1.25
+
+
+def test_session_summary_and_restart(monkeypatch):
+    """Docking ends the session, a shorter path starts a new one."""
+    analytics = SessionAnalytics()
+    assert update(analytics, hypfer_map([[0, 50, 100, 50]]), "docked") is None
+    assert not analytics.active
+
+    clock = iter([0.0, 10.0, 20.0, 20.0, 20.0])
+    monkeypatch.setattr(session_analytics.time, "monotonic", lambda: next(clock))
+    update(analytics, hypfer_map([[0, 50, 100, 50]], [250, 50]), "cleaning")
+    full_path = hypfer_map([[0, 50, 100, 50, 250, 50]], [250, 50])
+    update(analytics, full_path, "cleaning")
+    summary = update(analytics, full_path, "docked")
+    assert summary["session_duration"] == 20
+    assert summary["session_distance"] == 2.5
+    assert summary["session_average_speed"] == 0.125
+    assert summary["session_rooms"]["Hall"]["time"] == 20
+    assert not analytics.active
+    # The last session values stay published.
+    assert analytics.metrics()["session_distance"] == 2.5
+
+    update(analytics, hypfer_map([[0, 50, 100, 50, 250, 50]]), "cleaning")
+    summary = update(analytics, hypfer_map([[0, 50]]), "cleaning")
+    assert summary["session_distance"] == 2.5
+    assert analytics.metrics()["session_distance"] == 0
@@ -0,0 +1,47 @@
+"""Tests for the start-up phase timings of a camera entry."""
+
+import pytest
+
+from custom_components.mqtt_vacuum_camera.utils.startup_timings import StartupTimings
+
+
+class FakeClock:
+    """Monotonic clock moved by the test."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phases_and_total():
+    """Each phase and the total since the start are recorded in ms."""
+    clock = FakeClock()
+    timings = StartupTimings(clock)
+    with timings.phase("init_coordinator"):
+        with timings.phase("start_up_mqtt"):
+            clock.now += 0.25
+        clock.now += 0.05
+    clock.now += 1.0
+    assert timings.finish("async_setup_entry") == pytest.approx(1.3)
+    assert timings.as_dict() == {
+        "start_up_mqtt": 250.0,
+        "init_coordinator": 300.0,
+        "async_setup_entry": 1300.0,
+    }
+    assert timings.summary("robot") == (
+        "robot: Start-up timings: start_up_mqtt 250.0 ms, "
+        "init_coordinator 300.0 ms, async_setup_entry 1300.0 ms"
+    )
+
+
+def test_failed_phase_is_recorded():
+    """A phase that raises is still timed."""
+    clock = FakeClock()
+    timings = StartupTimings(clock)
+    with pytest.raises(ValueError), timings.phase("init_shared_data"):
+        clock.now += 0.01
+        raise ValueError
+    assert timings.as_dict() == {"init_shared_data": 10.0}
+    assert StartupTimings(clock).summary("robot") == "robot: Start-up timings: none"
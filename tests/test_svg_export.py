@@ -0,0 +1,51 @@
+"""Tests for the SVG export of the parsed map."""
+
+from custom_components.mqtt_vacuum_camera.utils.camera.svg_export import (
+    SvgExporter,
+    style_from_options,
+)
+
+HYPFER_MAP = {
+    "pixelSize": 5,
+    "size": {"x": 5000, "y": 5000},
+    "layers": [
+        {"type": "floor", "compressedPixels": [10, 10, 5, 10, 11, 5]},
+        {"type": "wall", "compressedPixels": [9, 9, 7]},
+    ],
+    "entities": [
+        {"type": "robot_position", "points": [60, 55], "metaData": {"angle": 90}},
+        {"type": "path", "points": [50, 50, 60, 55]},
+    ],
+}
+
+
+def test_render_layers_and_entities():
+    """Layers become run-length paths, entities primitives."""
+    document = SvgExporter(False, {}).render(HYPFER_MAP)
+    assert document.startswith("<svg")
+    assert 'viewBox="9 9 7 3"' in document
+    assert "M10 10h5v1h-5z" in document
+    assert 'points="10,10 12,11"' in document
+    assert 'id="robot"' in document
+
+
+def test_static_only_and_disabled_entities():
+    """Static output skips entities and disabled entities are hidden."""
+    assert 'id="robot"' not in SvgExporter(False, {}).render(HYPFER_MAP, True)
+    document = SvgExporter(False, {"disable_robot": True}).render(HYPFER_MAP)
+    assert 'id="robot"' not in document
+    assert "<polyline" in document
+
+
+def test_document_is_cached_for_the_same_map():
+    """The same parsed map is not rendered twice."""
+    exporter = SvgExporter(False, {})
+    first = exporter.render(HYPFER_MAP)
+    assert exporter.render(HYPFER_MAP) is first
+    assert exporter.map_hash is not None
+
+
+def test_style_uses_option_colours():
+    """Colours and alpha come from the options."""
+    style = style_from_options({"color_wall": [1, 2, 3], "alpha_wall": 255})
+    assert style["colors"]["wall"] == "rgba(1,2,3,1.0)"
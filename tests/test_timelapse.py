@@ -0,0 +1,50 @@
+"""Tests for the time-lapse frame selection."""
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from custom_components.mqtt_vacuum_camera.utils.camera import camera_services
+from custom_components.mqtt_vacuum_camera.utils.camera.frame_history import (
+    HistoryFrame,
+)
+from custom_components.mqtt_vacuum_camera.utils.camera.timelapse import (
+    select_frames,
+)
+
+
+def _frames(etags: str) -> list[HistoryFrame]:
+    return [
+        HistoryFrame(float(position), etag, "image/png", etag.encode())
+        for position, etag in enumerate(etags)
+    ]
+
+
+def test_duplicates_are_merged_into_longer_frames():
+    """Identical consecutive frames become one frame lasting longer."""
+    images, durations = select_frames(_frames("aabccc"), 0, 100)
+    assert images == [b"a", b"b", b"c"]
+    assert durations == [200, 100, 300]
+
+
+def test_decimation_keeps_first_and_last_frame():
+    """Frames are evenly decimated, keeping the end of the session."""
+    images, durations = select_frames(_frames("abcdefghij"), 4, 100)
+    assert images == [b"a", b"d", b"g", b"j"]
+    assert durations == [100] * 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [{"max_frames": 0}, {"frame_duration": "fast"}, {"max_width": -10}],
+)
+async def test_timelapse_rejects_invalid_sizes(options):
+    """Invalid frame counts, durations and widths are refused before the job."""
+    hass = MagicMock()
+    call = MagicMock(data={"entity_id": "camera.test", **options})
+    with patch.object(camera_services, "_get_camera_from_call"):
+        with pytest.raises(ServiceValidationError):
+            await camera_services.camera_timelapse(call, hass)
+    hass.async_create_background_task.assert_not_called()
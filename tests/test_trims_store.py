@@ -0,0 +1,86 @@
+"""Tests for the trims store."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.mqtt_vacuum_camera.const import DOMAIN
+from custom_components.mqtt_vacuum_camera.utils import files_operations
+from custom_components.mqtt_vacuum_camera.utils.camera import trims_store
+from custom_components.mqtt_vacuum_camera.utils.camera.trims_store import (
+    TrimsStore,
+    normalize_trims,
+    read_legacy_files,
+)
+
+TRIMS = {"trim_up": 10, "trim_left": 20, "trim_down": 30, "trim_right": 40}
+
+
+def test_normalize_trims():
+    """Legacy files, TrimsData dicts and lists give the same trims."""
+    assert normalize_trims({"floor": "floor_1", **TRIMS}) == TRIMS
+    assert normalize_trims({"trims_data": TRIMS}) == TRIMS
+    assert normalize_trims([10, 20, 30, 40]) == TRIMS
+    assert normalize_trims({"trim_up": 1})["trim_right"] == 0
+    assert normalize_trims({"trim_up": "x"}) is None
+    assert normalize_trims("trims") is None
+
+
+def test_read_legacy_files(tmp_path):
+    """Each auto_crop file becomes the first floor of its camera."""
+    (tmp_path / "auto_crop_robot.json").write_text(json.dumps({"trims_data": TRIMS}))
+    (tmp_path / "auto_crop_broken.json").write_text("{")
+    (tmp_path / "other.json").write_text(json.dumps(TRIMS))
+    cameras, files = read_legacy_files(tmp_path)
+    assert cameras == {"robot": {"floor_0": TRIMS}}
+    assert [path.name for path in files] == [
+        "auto_crop_broken.json",
+        "auto_crop_robot.json",
+    ]
+
+
+def test_set_get_and_reset(monkeypatch):
+    """Changes are kept in memory and saved with a delayed save."""
+    monkeypatch.setattr(trims_store, "Store", MagicMock())
+    store = TrimsStore(MagicMock())
+    delay_save = store._store.async_delay_save  # pylint: disable=protected-access
+    assert store.get("robot", "floor_0") is None
+
+    assert store.set("robot", "floor_0", {"floor": "floor_0", **TRIMS})
+    assert not store.set("robot", "floor_0", TRIMS)
+    assert not store.set("robot", "floor_1", {"trim_up": 0})
+    assert store.get("robot", "floor_0") == TRIMS
+    assert delay_save.call_count == 1
+
+    store.set("other", "floor_0", TRIMS)
+    assert store.reset(["robot", "missing"]) == ["robot"]
+    assert store.get("robot", "floor_0") is None
+    assert store.reset() == ["other"]
+    assert store.reset() == []
+    assert delay_save.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_reset_also_drops_the_live_trims(monkeypatch):
+    """A running camera does not store its old trims again before the reload."""
+    monkeypatch.setattr(trims_store, "Store", MagicMock())
+    store = TrimsStore(MagicMock())
+    store.set("robot", "floor_0", TRIMS)
+    camera = MagicMock()
+    camera.context.file_name = "robot"
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": {"camera": camera}}}
+    monkeypatch.setattr(
+        files_operations, "async_get_trims_store", AsyncMock(return_value=store)
+    )
+    monkeypatch.setattr(files_operations, "get_camera_entity", lambda *_: camera)
+
+    assert await files_operations.async_reset_map_trims(hass, ["camera.robot"])
+    assert store.get("robot", "floor_0") is None
+    camera.reset_trims.assert_called_once()
+
+    store.set("robot", "floor_0", TRIMS)
+    await files_operations.async_clean_up_all_auto_crop_files(hass)
+    assert store.get("robot", "floor_0") is None
+    assert camera.reset_trims.call_count == 2
@@ -0,0 +1,44 @@
+"""Tests for the room checks of the vacuum actions with several vacuums."""
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.mqtt_vacuum_camera.const import (
+    CONF_VACUUM_CONNECTION_STRING,
+    DOMAIN,
+)
+from custom_components.mqtt_vacuum_camera.utils.vacuum import mqtt_vacuum_services
+
+SERVICES = "custom_components.mqtt_vacuum_camera.utils.vacuum.mqtt_vacuum_services"
+
+
+def _hass_with_two_vacuums():
+    """Return a hass with the camera entries of two vacuums."""
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            "entry_1": {
+                CONF_VACUUM_CONNECTION_STRING: "valetudo/First",
+                "coordinator": "first",
+            },
+            "entry_2": {
+                CONF_VACUUM_CONNECTION_STRING: "valetudo/Second",
+                "coordinator": "second",
+            },
+        }
+    }
+    return hass
+
+
+def test_target_coordinator_of_the_called_vacuum():
+    """The coordinator of the targeted vacuum is used, not the first entry."""
+    hass = _hass_with_two_vacuums()
+    call = MagicMock()
+    call.data = {"entity_id": ["vacuum.second"]}
+    topics = {"vacuum.second": "valetudo/Second", "vacuum.other": "valetudo/Other"}
+    with patch(
+        f"{SERVICES}.get_vacuum_mqtt_topic",
+        side_effect=lambda entity_id, _hass: topics[entity_id],
+    ):
+        assert mqtt_vacuum_services.target_coordinator(call, hass) == "second"
+        call.data = {"entity_id": ["vacuum.other"]}
+        assert mqtt_vacuum_services.target_coordinator(call, hass) is None